@@ -3,30 +3,29 @@ import re
 import os
 import json
 import time
-import webbrowser
-import subprocess
-import requests
-from PyQt6.QtCore import Qt, QSettings, QThread, pyqtSignal, QEvent
-from PyQt6.QtGui import QIcon, QAction, QKeySequence, QTextDocument, QColor, QPalette, QPixmap, QImage
+import heapq
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from PyQt6.QtCore import Qt, QSettings, QThread, QTimer, pyqtSignal, QEvent, QStandardPaths
+from PyQt6.QtGui import QIcon, QAction, QKeySequence, QColor, QPalette, QPixmap, QImage
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QPushButton, QFileDialog, QMessageBox, QHBoxLayout,
-    QLineEdit, QLabel, QTableWidget, QTableWidgetItem, QComboBox, QFrame, QGroupBox, QHeaderView,
-    QInputDialog, QMainWindow, QColorDialog, QAbstractItemView, QProgressBar, QCheckBox, QToolButton, QSizePolicy,
+    QLineEdit, QLabel, QTableView, QComboBox, QFrame, QGroupBox, QHeaderView,
+    QInputDialog, QMainWindow, QColorDialog, QAbstractItemView, QAbstractItemDelegate, QProgressBar, QCheckBox, QToolButton, QSizePolicy,
     QStyle
 )
-import certifi
-import os
-
-# Set environment variable for requests to find CA bundle in frozen apps
-os.environ["REQUESTS_CA_BUNDLE"] = certifi.where()
 
+# Only what the first window needs is imported here. Dialogs, networking
+# (requests) and the updater are imported where first used, see
+# run_idle_startup_tasks() for work deferred until after the window shows.
 from plugins import (
-    HighlightDelegate, FindReplacePanel, UserGameStatsListDialog,
-    ContextLangDialog, ThemeManager, BinaryParser, SteamIntegration,
-    CSVHandler, FileManager, UIBuilder, HelpDialog, ContextMenuManager,
-    DragDropPlugin, GameNameFetchWorker, get_available_languages_for_selection,
-    get_display_name, get_code_from_display_name, AutoUpdater, IconLoader,
-    HTTPClient
+    HighlightDelegate, FindReplacePanel, ThemeManager, BinaryParser, SteamIntegration,
+    CSVHandler, FileManager, UIBuilder, ContextMenuManager, DragDropPlugin,
+    get_available_languages_for_selection, get_display_name, get_code_from_display_name,
+    IconLoader, AchievementTableModel, IconDelegate, ParseCache, SearchIndex,
+    RowHeightManager, RowStore, GameNameStore, PerfTracer, perf_tracer, traced,
+    SerializedCache, SchemaFileWatcher, diff_rows, pending_edits
 )
 
 if sys.platform == "win32":
@@ -37,43 +36,70 @@ APP_VERSION = "0.9.0"
 LOCALES_DIR = "assets/locales"
 STEAM_APP_LIST_CACHE = "assets/steam.api.allgamenames.json"
 
+# Locales of this process, see load_available_locales()
+_available_locales = None
+
 def load_available_locales():
-    """Load available locales from the locales directory"""
-    locales = {}
+    """Load available locales from the locales directory
+
+    Parsed once per process. Later launches load a marshal copy from the
+    cache directory until a locale file or the app version changes.
+    """
+    global _available_locales
+    if _available_locales is not None:
+        return _available_locales
+    
     path = resource_path(LOCALES_DIR)
-    if os.path.exists(path):
-        for filename in os.listdir(path):
-            if filename.endswith('.json'):
-                file_path = os.path.join(path, filename)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        locale_data = json.load(f)
-                        # Check if locale has metadata
-                        if '_locale_info' in locale_data:
-                            locale_info = locale_data['_locale_info']
-                            locale_name = locale_info.get('name')
-                            if locale_name:
-                                locales[locale_name] = {
-                                    'file_path': file_path,
-                                    'native_name': locale_info.get('native_name', locale_name),
-                                    'code': locale_info.get('code', filename[5:7]),  # Extract from filename
-                                    'priority': locale_info.get('priority', 999),
-                                    'data': locale_data
-                                }
-                        else:
-                            # Fallback for locales without metadata - use filename
-                            if filename.startswith('lang_') and len(filename) >= 12:
-                                code = filename[5:7]  # Extract code like "en" from "lang_en.json"
-                                locale_name = f"Language_{code}".capitalize()
-                                locales[locale_name] = {
-                                    'file_path': file_path,
-                                    'native_name': locale_name,
-                                    'code': code,
-                                    'priority': 999,
-                                    'data': locale_data
-                                }
-                except (json.JSONDecodeError, FileNotFoundError):
-                    pass
+    filenames = sorted(f for f in os.listdir(path) if f.endswith('.json')) if os.path.exists(path) else []
+    cache = SerializedCache(
+        os.path.join(
+            QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation),
+            "locales.marshal"
+        ),
+        APP_VERSION
+    )
+    stamp = SerializedCache.stamp_for(os.path.join(path, filename) for filename in filenames)
+    locales = cache.load(stamp)
+    if locales is None:
+        locales = read_locale_files(path, filenames)
+        cache.save(stamp, locales)
+    _available_locales = locales
+    return locales
+
+def read_locale_files(path, filenames):
+    """Parse locale JSON files into {locale name: info}"""
+    locales = {}
+    for filename in filenames:
+        file_path = os.path.join(path, filename)
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                locale_data = json.load(f)
+                # Check if locale has metadata
+                if '_locale_info' in locale_data:
+                    locale_info = locale_data['_locale_info']
+                    locale_name = locale_info.get('name')
+                    if locale_name:
+                        locales[locale_name] = {
+                            'file_path': file_path,
+                            'native_name': locale_info.get('native_name', locale_name),
+                            'code': locale_info.get('code', filename[5:7]),  # Extract from filename
+                            'priority': locale_info.get('priority', 999),
+                            'data': locale_data
+                        }
+                else:
+                    # Fallback for locales without metadata - use filename
+                    if filename.startswith('lang_') and len(filename) >= 12:
+                        code = filename[5:7]  # Extract code like "en" from "lang_en.json"
+                        locale_name = f"Language_{code}".capitalize()
+                        locales[locale_name] = {
+                            'file_path': file_path,
+                            'native_name': locale_name,
+                            'code': code,
+                            'priority': 999,
+                            'data': locale_data
+                        }
+        except (json.JSONDecodeError, FileNotFoundError):
+            pass
     return locales
 
 def get_sorted_locale_names(locales):
@@ -194,8 +220,10 @@ def load_translations_for_language(language):
     return {}
     
 class IconWorker(QThread):
-    """Worker thread for loading icons in background"""
-    icon_loaded = pyqtSignal(int, int, object) # row, col, QImage
+    """Worker thread for loading icons in background through a small download pool"""
+    icon_loaded = pyqtSignal(str, object) # icon hash, QImage
+
+    MAX_CONCURRENT_FETCHES = 6
 
     def __init__(self, tasks, icon_loader, game_id):
         super().__init__()
@@ -203,35 +231,86 @@ class IconWorker(QThread):
         self.icon_loader = icon_loader
         self.game_id = game_id
         self._is_running = True
+        
+        # Priority queue of icon hashes (lower first). Hashes are queued in table
+        # order, prioritize() pushes newer entries in front; stale ones are skipped.
+        self._lock = threading.Lock()
+        self._queued = set(tasks)
+        self._heap = [(0, i, icon_hash) for i, icon_hash in enumerate(tasks)]
+        self._boost = 0
+
+    def prioritize(self, icon_hashes):
+        """Fetch these hashes next (e.g. the rows currently in the viewport). Thread-safe."""
+        with self._lock:
+            self._boost -= 1
+            for i, icon_hash in enumerate(icon_hashes):
+                if icon_hash in self._queued:
+                    heapq.heappush(self._heap, (self._boost, i, icon_hash))
+
+    def _next_task(self):
+        with self._lock:
+            while self._heap:
+                _, _, icon_hash = heapq.heappop(self._heap)
+                if icon_hash in self._queued:
+                    self._queued.discard(icon_hash)
+                    return icon_hash
+        return None
+
+    def _load_icon(self, icon_hash):
+        # Load QImage (thread-safe)
+        with perf_tracer.span("IconWorker.fetch"):
+            return self.icon_loader.load_icon_image(icon_hash, self.game_id, (64, 64))
 
+    @traced("IconWorker")
     def run(self):
         print(f"[IconWorker] Starting with {len(self.tasks)} tasks. Game ID: {self.game_id}", flush=True)
-        for row, col, icon_hash in self.tasks:
-            if not self._is_running:
-                break
-            image = None
-            try:
-                # Load QImage (thread-safe)
-                image = self.icon_loader.load_icon_image(icon_hash, self.game_id, size=(64, 64))
-            except Exception as e:
-                print(f"[IconWorker] Error loading hash {icon_hash}: {e}", flush=True)
-            
-            # Emit signal regardless of success to update progress
-            if self._is_running:
-                self.icon_loaded.emit(row, col, image)
+        executor = ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_FETCHES, thread_name_prefix="IconFetch")
+        in_flight = {}
+        try:
+            while self._is_running:
+                # Keep the pool full with the most urgent icons
+                while len(in_flight) < self.MAX_CONCURRENT_FETCHES:
+                    icon_hash = self._next_task()
+                    if icon_hash is None:
+                        break
+                    future = executor.submit(self._load_icon, icon_hash)
+                    in_flight[future] = icon_hash
+                
+                if not in_flight:
+                    break
+                
+                # Short timeout so stop() and reprioritizing take effect quickly
+                done, _ = wait(in_flight, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    icon_hash = in_flight.pop(future)
+                    image = None
+                    try:
+                        image = future.result()
+                    except Exception as e:
+                        print(f"[IconWorker] Error loading hash {icon_hash}: {e}", flush=True)
+                    
+                    # Emit signal regardless of success to update progress
+                    if self._is_running:
+                        self.icon_loaded.emit(icon_hash, image)
+        finally:
+            # Don't wait for downloads still running, their results are dropped
+            executor.shutdown(wait=False, cancel_futures=True)
 
         print("[IconWorker] Finished", flush=True)
 
     def stop(self):
+        """Ask the worker to finish; returns immediately instead of blocking in wait()"""
         self._is_running = False
-        self.wait()
 
 class BinParserGUI(QMainWindow):
+    # Emitted from the startup loader thread, delivered queued to the GUI thread
+    app_list_ready = pyqtSignal()
 
     # =================================================================
     # INITIALIZATION AND UI SETUP
     # =================================================================
     
+    @traced("startup.window_init")
     def __init__(self, language="English"):
         self.modified = False
         super().__init__(parent=None)
@@ -242,12 +321,11 @@ class BinParserGUI(QMainWindow):
         self.binary_parser = BinaryParser()
         self.steam_integration = SteamIntegration()
         self.csv_handler = CSVHandler()
-        self.file_manager = FileManager()
+        self.file_manager = FileManager(self.binary_parser)
         self.drag_drop_plugin = DragDropPlugin(self)
         
-        # Steam game names - not loaded from file anymore, using API only
+        # Session cache of resolved game names; persistent names live in game_name_store
         self.steam_game_names = {}
-        self.steam_app_names = self.load_steam_app_list()
         
         # Load available locales and store for ui_builder access
         self.available_locales = load_available_locales()
@@ -282,9 +360,44 @@ class BinParserGUI(QMainWindow):
 
         self.settings = QSettings("Vena", "Steam Achievement Localizer")
         
+        # Timing breakdown of the slow paths, off unless asked for
+        perf_tracer.set_enabled(
+            PerfTracer.env_enabled() or self.settings.value("PerfTracing", False, type=bool)
+        )
+        self.perf_label = QLabel()
+        self.perf_label.setVisible(False)
+        self.statusBar().insertPermanentWidget(0, self.perf_label)
+        self.perf_timer = QTimer(self)
+        self.perf_timer.setInterval(1000)
+        self.perf_timer.timeout.connect(self.update_perf_label)
+        if perf_tracer.enabled:
+            self.perf_timer.start()
+        
+        # Recently parsed files are re-rendered without parsing again
+        self.binary_parser.parse_cache = ParseCache(
+            max_bytes=self.settings.value("ParseCacheSizeMB", 64, type=int) * 1024 * 1024
+        )
+        
         # Initialize IconLoader after settings
         self.icon_loader = IconLoader(self.settings)
         
+        # Game names are looked up in SQLite. The bundled app list is imported
+        # on a background thread (only on first start); until it is done,
+        # lookups fall back to the binary name or the Store API
+        self.game_name_store = GameNameStore(os.path.join(
+            QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation),
+            "game_names.sqlite3"
+        ))
+        startup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="StartupLoader")
+        self.app_list_future = startup_executor.submit(self.import_app_list)
+        startup_executor.shutdown(wait=False)
+        
+        # Steam regenerates schema files on its own; rows it changed are updated in place
+        self.schema_watcher = SchemaFileWatcher(self)
+        self.schema_watcher.file_changed.connect(self.on_schema_file_changed)
+        # Rows as parsed from raw_data, to tell the user's unsaved edits apart
+        self.loaded_rows = RowStore()
+        
         self.default_steam_path = self.detect_steam_path()
         
         self.force_manual_path = False
@@ -539,11 +652,26 @@ class BinParserGUI(QMainWindow):
         
 
         # --- Table ---
-        self.table = QTableWidget()
+        self.table = QTableView()
+        self.table_model = AchievementTableModel(self.table)
+        self.table.setModel(self.table_model)
         self.table.setToolTip(self.translations.get("tooltip_table", ""))
-        self.table.setHorizontalScrollMode(QTableWidget.ScrollMode.ScrollPerPixel)
-        self.table.setVerticalScrollMode(QTableWidget.ScrollMode.ScrollPerPixel)
-        self.table.itemChanged.connect(self.on_table_item_changed)
+        self.table.setHorizontalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
+        self.table.setVerticalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
+        self.table_model.cell_edited.connect(self.on_table_cell_edited)
+
+        # Global search runs against a casefolded row index, debounced while typing
+        self.search_index = SearchIndex()
+        self.table_model.modelReset.connect(self.on_table_model_reset)
+        self.table_model.dataChanged.connect(self.on_table_data_changed)
+        self.pending_search_text = ""
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.apply_global_search)
+
+        # Rows are sized to their wrapped text as they scroll into view
+        self.row_heights = RowHeightManager(self.table, self.table_model)
 
         # --- Context Menu Manager ---
         self.context_menu_manager = ContextMenuManager(self, self.translations)
@@ -580,10 +708,9 @@ class BinParserGUI(QMainWindow):
         self.header = self.table.horizontalHeader()
         self.header.setStretchLastSection(False)
 
-        self.data_rows = []
+        self.data_rows = RowStore()
         self.headers = []
         self.raw_data = b""
-        self.chunks = []
         
 
         stored_path = self.settings.value("UserSteamPath", "")
@@ -623,6 +750,15 @@ class BinParserGUI(QMainWindow):
         # Highlight delegate for search
         self.highlight_delegate = HighlightDelegate(self.table)
         self.table.setItemDelegate(self.highlight_delegate)
+        
+        # Icon column is painted from a pixmap cache instead of per-row QLabel widgets
+        self.icon_delegate = IconDelegate(self.table)
+        self.icon_delegate_column = -1
+        self.icon_rows = {}
+        self.icon_worker = None
+        self.retired_icon_workers = set()
+        # Icons of rows scrolled into view are downloaded first
+        self.table.verticalScrollBar().valueChanged.connect(lambda _: self.prioritize_visible_icons())
 
         # Add find/replace panel (hidden by default)
         self.find_replace_panel = FindReplacePanel(self, self.headers)
@@ -630,12 +766,9 @@ class BinParserGUI(QMainWindow):
         # Initialize theme manager
         self.theme_manager = ThemeManager(self, resource_path)
 
-        # Initialize auto-updater
-        self.auto_updater = AutoUpdater(APP_VERSION, self.translations, self)
+        # Auto-updater is created on first use (see get_auto_updater)
+        self.auto_updater = None
         self.auto_updater_enabled = self.settings.value("auto_update_enabled", True, type=bool)
-        # Check for updates automatically on startup (if enabled in settings)
-        if self.auto_updater_enabled:
-            self.auto_updater.check_for_updates()
 
         # Create menubar
         self.create_menubar()
@@ -648,6 +781,39 @@ class BinParserGUI(QMainWindow):
         if hasattr(self, 'translations') and self.translations:
             self.refresh_ui_texts(update_menubar=False)  # Menu already created above
 
+        # Work the first paint does not need runs once the window is up
+        QTimer.singleShot(self.IDLE_STARTUP_DELAY_MS, self.run_idle_startup_tasks)
+
+    # Gives the event loop time to show and paint the window first
+    IDLE_STARTUP_DELAY_MS = 200
+
+    @traced("startup.idle")
+    def run_idle_startup_tasks(self):
+        """Second startup phase, after the window is on screen
+
+        Loads networking (requests) to install the HTTP cache, schedules
+        on_app_list_ready() for when the app list import is done and starts
+        the automatic update check.
+        """
+        from plugins import HTTPClient, HTTPCache
+        # Store API and update check responses are cached on disk between runs
+        HTTPClient.set_cache(HTTPCache(
+            os.path.join(
+                QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation),
+                "http_cache.sqlite3"
+            ),
+            max_bytes=self.settings.value("HTTPCacheSizeMB", 32, type=int) * 1024 * 1024
+        ))
+        
+        # Names cached by older versions are moved once the import is done,
+        # without blocking the window while it still runs
+        self.app_list_ready.connect(self.on_app_list_ready)
+        self.app_list_future.add_done_callback(lambda _: self.app_list_ready.emit())
+        
+        # Check for updates automatically on startup (if enabled in settings)
+        if self.auto_updater_enabled:
+            self.get_auto_updater().check_for_updates()
+
     def create_menubar(self):
         """Create menubar using ui_builder plugin"""
         # On macOS, get existing menubar or create new one
@@ -694,7 +860,7 @@ class BinParserGUI(QMainWindow):
     def stretch_columns(self):
         """Stretch columns to fill available width while respecting minimum widths"""
         """Stretch columns to fill table width"""
-        if self.table.columnCount() == 0:
+        if self.table_model.columnCount() == 0:
             return
             
         header_width = self.table.viewport().width()
@@ -702,7 +868,7 @@ class BinParserGUI(QMainWindow):
         
         # Determine visible columns
         visible_columns = []
-        for i in range(self.table.columnCount()):
+        for i in range(self.table_model.columnCount()):
             if not self.table.isColumnHidden(i):
                 visible_columns.append(i)
         
@@ -714,7 +880,7 @@ class BinParserGUI(QMainWindow):
         total_min_width = 0
         
         for col in visible_columns:
-            header_text = self.table.horizontalHeaderItem(col).text()
+            header_text = self.table_model.headers[col]
             # Special width for icon column
             if header_text == 'icon':
                 # Fixed width for icon column (64px icon + padding)
@@ -735,7 +901,7 @@ class BinParserGUI(QMainWindow):
             # Count flexible columns (exclude icon from major stretching)
             flexible_columns_count = 0
             for i, col in enumerate(visible_columns):
-                header_text = self.table.horizontalHeaderItem(col).text()
+                header_text = self.table_model.headers[col]
                 if header_text != 'icon':
                     flexible_columns_count += 1
             
@@ -743,7 +909,7 @@ class BinParserGUI(QMainWindow):
                 space_per_flexible = extra_space // flexible_columns_count
                 
                 for i, col in enumerate(visible_columns):
-                    header_text = self.table.horizontalHeaderItem(col).text()
+                    header_text = self.table_model.headers[col]
                     if header_text == 'icon':
                         # Icon column gets only small stretch or nothing
                         self.table.setColumnWidth(col, min_widths[i])
@@ -790,35 +956,12 @@ class BinParserGUI(QMainWindow):
 
     def update_row_colors(self):
         """Update row/icon background colors based on current theme palette"""
-        if not hasattr(self, 'table') or self.table.rowCount() == 0:
+        if not hasattr(self, 'table') or self.table_model.rowCount() == 0:
             return
             
         bg_color_1, bg_color_2 = self.get_row_pair_colors()
-                
-        self.table.blockSignals(True)
-        # Disable sorting temporarily
-        is_sorting_enabled = self.table.isSortingEnabled()
-        self.table.setSortingEnabled(False)
-        
-        try:
-            for row_i in range(self.table.rowCount()):
-                # Determine background color for this row pair
-                pair_index = row_i // 2
-                row_bg_color = bg_color_1 if pair_index % 2 == 0 else bg_color_2
-                
-                for col_i in range(self.table.columnCount()):
-                    item = self.table.item(row_i, col_i)
-                    if item:
-                        item.setBackground(row_bg_color)
-                    
-                    # Check for cell widgets (labels for icons)
-                    widget = self.table.cellWidget(row_i, col_i)
-                    if widget and isinstance(widget, QLabel):
-                        hex_color = row_bg_color.name()
-                        widget.setStyleSheet(f"background-color: {hex_color}; border: none;")
-        finally:
-            self.table.setSortingEnabled(is_sorting_enabled)
-            self.table.blockSignals(False)
+        # Text and icon cells both take their background from the model
+        self.table_model.set_row_colors(bg_color_1, bg_color_2)
 
     def changeEvent(self, event):
         """Handle theme/palette changes"""
@@ -1098,12 +1241,20 @@ class BinParserGUI(QMainWindow):
 
     def show_help_dialog(self):
         """Show the help dialog"""
+        from plugins import HelpDialog
         dialog = HelpDialog(self, self.translations)
         dialog.exec()
 
+    def get_auto_updater(self):
+        """The auto-updater, imported and created on first use"""
+        if self.auto_updater is None:
+            from plugins import AutoUpdater
+            self.auto_updater = AutoUpdater(APP_VERSION, self.translations, self)
+        return self.auto_updater
+
     def check_for_updates_manual(self):
         """Manually check for updates (triggered from Help menu)"""
-        self.auto_updater.check_for_updates(manual=True)
+        self.get_auto_updater().check_for_updates(manual=True)
 
     # =================================================================
     # FILE OPERATIONS AND STEAM INTEGRATION
@@ -1153,12 +1304,14 @@ class BinParserGUI(QMainWindow):
             return
         
         self.parse_and_fill_table(show_success_msg=show_success_msg)
+        self.schema_watcher.watch(path)
         self.version()
         self.gamename()
         
         # Auto-collapse file search section on successful load
         self.set_file_search_expanded(False)
 
+    @traced("parse_and_fill_table")
     def parse_and_fill_table(self, show_success_msg=True):
         # Check if we have data to parse
         if not hasattr(self, 'raw_data') or not self.raw_data:
@@ -1185,7 +1338,6 @@ class BinParserGUI(QMainWindow):
         
         # Use binary parser plugin
         all_rows, headers = self.binary_parser.parse_binary_data(self.raw_data)
-        self.chunks = self.binary_parser.chunks
         self.headers = self.prioritize_headers(headers)  # Prioritize headers
         
         # Check if icons should be loaded
@@ -1194,138 +1346,22 @@ class BinParserGUI(QMainWindow):
             self.headers.remove('icon')
         
         self.data_rows = all_rows
-        self.table.clear()
-        self.table.setColumnCount(len(self.headers))
-        
-        # Create header labels with Steam language display names
-        header_labels = []
-        for header in self.headers:
-            if header == 'key':
-                header_labels.append(header.upper())
-            else:
-                # Use Steam language display name if available
-                display_name = get_display_name(header)
-                # Add line break before parentheses for better readability
-                if '(' in display_name:
-                    display_name = display_name.replace(' (', '\n(')
-                header_labels.append(display_name)
-        
-        self.table.setHorizontalHeaderLabels(header_labels)
-        self.table.setRowCount(len(all_rows))
         
         # Ensure all rows have columns for our headers
-        for row in self.data_rows:
-            for header in self.headers:
-                if header not in row:
-                    row[header] = ''
-        
-        # Fill table with data
-        self.table.blockSignals(True)
+        self.data_rows.ensure_columns(self.headers)
+        self.loaded_rows = self.data_rows.copy()
         
-        # Get current game ID for icon URLs
-        game_id = self.current_game_id() if hasattr(self, 'current_game_id') else None
+        # Stop existing worker if any
+        self._stop_icon_worker()
         
         # Colors for alternating row pairs (zebra striping for achievements)
         bg_color_1, bg_color_2 = self.get_row_pair_colors()
+        self.table_model.set_row_colors(bg_color_1, bg_color_2)
         
-        # Prepare for icon loading
-        icon_tasks = []
-        placeholder = None
-        self.icons_to_load_total = 0
-        self.icons_loaded_count = 0
-        
-        if 'icon' in self.headers:
-            placeholder = self.icon_loader.get_placeholder_icon(size=(64, 64))
-            self.icons_to_load_total = sum(1 for row in self.data_rows if row.get('icon', ''))
-            
-        # Show progress bar for icons
-        if self.icons_to_load_total > 0:
-            self.show_progress(self.translations.get("loading", "Loading icons..."), total=self.icons_to_load_total)
-            
-        icon_rows_to_merge = []
-
-        # Stop existing worker if any
-        if hasattr(self, 'icon_worker') and self.icon_worker is not None:
-             self.icon_worker.stop()
-             self.icon_worker = None
-        
-        for row_i, row in enumerate(self.data_rows):
-            # Determine background color for this row pair
-            pair_index = row_i // 2
-            row_bg_color = bg_color_1 if pair_index % 2 == 0 else bg_color_2
-            
-            for col_i, col_name in enumerate(self.headers):
-                value = row.get(col_name, '')
-
-                # Special handling for icon column
-                if col_name == 'icon' and value:
-                    # Check if this is a key row (not _opis)
-                    key_value = row.get('key', '')
-                    is_main_row = not key_value.endswith('_opis')
-                    
-                    if is_main_row:
-                        # This is the main achievement row, create icon label
-                        icon_label = QLabel()
-                        icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                        
-                        # Set background
-                        hex_color = row_bg_color.name()
-                        icon_label.setStyleSheet(f"background-color: {hex_color}; border: none;")
-                        
-                        # Set placeholder initially
-                        if placeholder:
-                            icon_label.setPixmap(placeholder)
-                        
-                        # Add to task list for background loading
-                        icon_tasks.append((row_i, col_i, value))
-                        
-                        # Set widget in cell
-                        self.table.setCellWidget(row_i, col_i, icon_label)
-                        
-                        # Also set an empty item so cell is selectable
-                        item = QTableWidgetItem('')
-                        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                        item.setBackground(row_bg_color) # Set background
-                        self.table.setItem(row_i, col_i, item)
-                        
-                        # Mark this row for merging if next row is _opis
-                        if row_i + 1 < len(self.data_rows):
-                            next_key = self.data_rows[row_i + 1].get('key', '')
-                            if next_key == f"{key_value}_opis":
-                                icon_rows_to_merge.append(row_i)
-                    else:
-                        # This is _opis row, just set empty item (will be merged)
-                        item = QTableWidgetItem('')
-                        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                        item.setBackground(row_bg_color) # Set background
-                        self.table.setItem(row_i, col_i, item)
-                else:
-                    # Normal text item
-                    item = QTableWidgetItem(value)
-                    item.setBackground(row_bg_color) # Set background
-                    
-                    if col_name == 'key':
-                        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-
-                    self.table.setItem(row_i, col_i, item)
-        
-        # Merge icon cells for key and key_opis rows
-        if 'icon' in self.headers:
-            icon_col = self.headers.index('icon')
-            for row_i in icon_rows_to_merge:
-                # Merge current row with next row (key + key_opis)
-                self.table.setSpan(row_i, icon_col, 2, 1)
-
-        # Start icon worker if tasks exist
-        if icon_tasks:
-            self.icon_worker = IconWorker(icon_tasks, self.icon_loader, str(game_id) if game_id else None)
-            self.icon_worker.icon_loaded.connect(self.update_icon_cell)
-            self.icon_worker.finished.connect(self.hide_progress)
-            self.icon_worker.start()
-            
-
-        
-        self.table.blockSignals(False)
+        # The model serves data_rows directly, no per-cell items are created
+        self.table.clearSpans()
+        self.table_model.set_data_rows(self.data_rows, self.headers, self.get_header_labels(self.headers))
+        self._populate_icon_column()
         
         # Глобальний режим видимості колонок (мов)
         mandatory_columns = self.get_mandatory_columns()  # Always visible
@@ -1372,18 +1408,117 @@ class BinParserGUI(QMainWindow):
             msg = self.translations.get("records_loaded").format(count=len(all_rows), countby2=self.countby2)
             QMessageBox.information(self, self.translations.get("success"), msg)
 
+    def get_header_labels(self, headers):
+        """Create header labels with Steam language display names"""
+        header_labels = []
+        for header in headers:
+            if header == 'key':
+                header_labels.append(header.upper())
+            else:
+                # Use Steam language display name if available
+                display_name = get_display_name(header)
+                # Add line break before parentheses for better readability
+                if '(' in display_name:
+                    display_name = display_name.replace(' (', '\n(')
+                header_labels.append(display_name)
+        return header_labels
+
+    def _populate_icon_column(self):
+        """Attach the icon delegate to the icon column and start loading missing icons"""
+        icon_tasks = []
+        self.icon_rows = {}
+        self.icons_to_load_total = 0
+        self.icons_loaded_count = 0
+        
+        # Delegates stick to column positions, detach from the previous icon column
+        if self.icon_delegate_column != -1:
+            self.table.setItemDelegateForColumn(self.icon_delegate_column, None)
+            self.icon_delegate_column = -1
+        
+        if 'icon' in self.headers:
+            icon_col = self.headers.index('icon')
+            self.icon_delegate.placeholder = self.icon_loader.get_placeholder_icon(size=(64, 64))
+            self.table.setItemDelegateForColumn(icon_col, self.icon_delegate)
+            self.icon_delegate_column = icon_col
+            
+            for row_i, row in enumerate(self.data_rows):
+                value = row.get('icon', '')
+                key_value = row.get('key', '')
+                
+                # Only the main achievement row shows the icon, its _opis row is merged into it
+                if not value or key_value.endswith('_opis'):
+                    continue
+                
+                self.icon_rows.setdefault(value, []).append(row_i)
+                
+                # Merge icon cells for key and key_opis rows
+                if row_i + 1 < len(self.data_rows):
+                    next_key = self.data_rows[row_i + 1].get('key', '')
+                    if next_key == f"{key_value}_opis":
+                        self.table.setSpan(row_i, icon_col, 2, 1)
+            
+            # Pixmaps already in memory are painted right away, only fetch the rest
+            self.icon_delegate.retain(self.icon_rows)
+            icon_tasks = [icon_hash for icon_hash in self.icon_rows if not self.icon_delegate.has_pixmap(icon_hash)]
+            self.icons_to_load_total = len(icon_tasks)
+            
+            # Show progress bar for icons
+            if self.icons_to_load_total > 0:
+                self.show_progress(self.translations.get("loading", "Loading icons..."), total=self.icons_to_load_total)
+        
+        self._setup_icon_worker(icon_tasks)
+
+    def _stop_icon_worker(self):
+        """Stop the running icon worker without blocking the UI thread"""
+        worker = getattr(self, 'icon_worker', None)
+        if worker is None:
+            return
+        self.icon_worker = None
+        worker.stop()
+        
+        # Keep a reference until the thread has really finished, a QThread
+        # must not be destroyed while running
+        if worker.isRunning():
+            self.retired_icon_workers.add(worker)
+            worker.finished.connect(lambda: self.retired_icon_workers.discard(worker))
+
     def _setup_icon_worker(self, icon_tasks):
         """Helper to stop existing worker and start a new one if needed"""
-        if hasattr(self, 'icon_worker') and self.icon_worker is not None:
-             self.icon_worker.stop()
-             self.icon_worker = None
+        self._stop_icon_worker()
         
         if icon_tasks:
             game_id = self.current_game_id() if hasattr(self, 'current_game_id') else None
             self.icon_worker = IconWorker(icon_tasks, self.icon_loader, str(game_id) if game_id else None)
             self.icon_worker.icon_loaded.connect(self.update_icon_cell)
-            self.icon_worker.finished.connect(self.hide_progress)
+            self.icon_worker.finished.connect(self.on_icon_worker_finished)
             self.icon_worker.start()
+            self.prioritize_visible_icons()
+
+    def on_icon_worker_finished(self):
+        # Retired workers finish later, only the current one owns the progress bar
+        if self.sender() is self.icon_worker:
+            self.hide_progress()
+
+    def prioritize_visible_icons(self):
+        """Move icons of the rows in the viewport to the front of the download queue"""
+        if self.icon_worker is None or self.icon_delegate_column == -1:
+            return
+        
+        first_row = self.table.rowAt(0)
+        if first_row < 0:
+            return
+        last_row = self.table.rowAt(self.table.viewport().height() - 1)
+        if last_row < 0:
+            last_row = self.table_model.rowCount() - 1
+        
+        visible_hashes = []
+        for row in range(first_row, last_row + 1):
+            icon_hash = self.data_rows[row].get('icon', '')
+            if icon_hash and not self.icon_delegate.has_pixmap(icon_hash):
+                visible_hashes.append(icon_hash)
+        
+        if visible_hashes:
+            self.icon_worker.prioritize(visible_hashes)
 
     def on_load_icons_toggled(self, checked):
         """Handle toggling of icon loading option"""
@@ -1394,16 +1529,55 @@ class BinParserGUI(QMainWindow):
         if hasattr(self, 'raw_data') and self.raw_data:
              self.parse_and_fill_table(show_success_msg=False)
 
-    def update_icon_cell(self, row, col, image):
-        """Slot to update icon cell when loaded from background thread"""
-        if row < self.table.rowCount() and col < self.table.columnCount():
-            if image and not image.isNull():
-                widget = self.table.cellWidget(row, col)
-                if isinstance(widget, QLabel):
-                    pixmap = QPixmap.fromImage(image)
-                    widget.setPixmap(pixmap)
+    # Spans shown in the status bar while tracing, in this order
+    PERF_STATUS_SPANS = [
+        "parse_and_fill_table", "parse_binary_data", "update_row_heights",
+        "IconWorker", "GameNameFetchWorker", "replace_language_in_binary"
+    ]
+
+    def on_perf_tracing_toggled(self, checked):
+        """Turn timing spans and their status bar breakdown on or off"""
+        self.settings.setValue("PerfTracing", checked)
+        perf_tracer.set_enabled(checked)
+        if checked:
+            self.perf_timer.start()
+        else:
+            self.perf_timer.stop()
+            self.perf_label.setVisible(False)
+
+    def update_perf_label(self):
+        text = perf_tracer.format_summary(self.PERF_STATUS_SPANS)
+        self.perf_label.setText(text)
+        self.perf_label.setVisible(bool(text))
+
+    def save_perf_trace(self):
+        """Write the recorded spans as a Chrome trace (chrome://tracing, Perfetto)"""
+        fname, _ = QFileDialog.getSaveFileName(
+            self, self.translations.get("save_perf_trace", "Save performance trace..."),
+            "trace.json", "JSON files (*.json)"
+        )
+        if not fname:
+            return
+        if perf_tracer.dump_chrome_trace(fname):
+            self.statusBar().showMessage(self.translations.get("perf_trace_saved", "Performance trace saved"), 5000)
+        else:
+            QMessageBox.warning(self, self.translations.get("error"), self.translations.get("perf_trace_save_failed", "Could not save the performance trace"))
+
+    def update_icon_cell(self, icon_hash, image):
+        """Slot to cache an icon loaded by the background thread and repaint its cells"""
+        # Ignore late results of a worker that was already replaced
+        if self.sender() is not self.icon_worker:
+            return
+        
+        if image and not image.isNull():
+            self.icon_delegate.set_pixmap(icon_hash, QPixmap.fromImage(image))
+            
+            if self.icon_delegate_column != -1:
+                for row in self.icon_rows.get(icon_hash, []):
+                    self.table.update(self.table_model.index(row, self.icon_delegate_column))
         
         # Update progress bar
+        self.icons_loaded_count += 1
         if self.icons_to_load_total > 0:
             self.update_progress(increment=1, message=self.translations.get("loading_icons", "Loading icons"))
             
@@ -1415,8 +1589,8 @@ class BinParserGUI(QMainWindow):
         """Replace language data in binary using file_manager plugin"""
         file_path = self.get_stats_bin_path()
         try:
-            data = self.file_manager.load_binary_file(file_path)
-            return self.file_manager.replace_language_in_binary(data, self.data_rows)
+            with self.file_manager.open_mapped(file_path) as data:
+                return self.file_manager.replace_language_in_binary(data, self.data_rows)
         except Exception as e:
             # If direct file loading fails, use raw_data if available
             if hasattr(self, 'raw_data') and self.raw_data:
@@ -1448,7 +1622,7 @@ class BinParserGUI(QMainWindow):
             msg_box.exec()
             return
         
-        self.sync_table_to_data_rows()
+        self.commit_table_editor()
         datas = self.replace_lang_in_bin()
         if datas is None:
             # Create custom warning message box
@@ -1473,7 +1647,7 @@ class BinParserGUI(QMainWindow):
                 f.write(datas)
             
             # Update raw_data to reflect the saved state
-            self.raw_data = datas
+            self.on_schema_saved(save_path, datas)
             
             # Create custom message box with proper button text
             msg_box = QMessageBox(self)
@@ -1510,7 +1684,7 @@ class BinParserGUI(QMainWindow):
 
         if not save_path:
             return
-        self.sync_table_to_data_rows()
+        self.commit_table_editor()
         datas = self.replace_lang_in_bin()
         if datas is None:
             # Create custom warning message box
@@ -1527,7 +1701,7 @@ class BinParserGUI(QMainWindow):
                 f.write(datas)
             
             # Update raw_data to reflect the saved state
-            self.raw_data = datas
+            self.on_schema_saved(save_path, datas)
             
             # Create custom success message box
             msg_box = QMessageBox(self)
@@ -1545,6 +1719,116 @@ class BinParserGUI(QMainWindow):
             ok_button = msg_box.addButton(self.translations.get("button_ok"), QMessageBox.ButtonRole.AcceptRole)
             msg_box.exec()
 
+    def on_schema_saved(self, save_path, data):
+        """Saved data becomes the new baseline; writing the watched file is no external change"""
+        self.raw_data = data
+        self.loaded_rows = self.data_rows.copy()
+        if os.path.abspath(save_path) == self.schema_watcher.path:
+            self.schema_watcher.mark_own_write()
+
+    @traced("reload_changed_schema")
+    def on_schema_file_changed(self, path):
+        """The open file was rewritten (usually by Steam): update the rows that changed
+
+        Rows are matched by achievement key. If the same achievements are
+        still there, only the changed cells are replaced and the table,
+        column widths and icons stay as they are; otherwise the table is
+        rebuilt. Unsaved edits are kept in both cases, and the user is
+        offered to write them into the new file right away.
+        """
+        if not self.raw_data:
+            return
+        try:
+            with open(path, "rb") as f:
+                new_data = f.read()
+        except OSError as e:
+            print(f"[SchemaWatcher] Cannot read {path}: {e}")
+            return
+        if new_data == self.raw_data:
+            return
+        
+        self.commit_table_editor()
+        edits = pending_edits(self.data_rows, self.loaded_rows)
+        try:
+            new_rows, _ = self.binary_parser.parse_binary_data(new_data)
+        except Exception as e:
+            print(f"[SchemaWatcher] Cannot parse rewritten file: {e}")
+            return
+        
+        ignore = [] if self.settings.value("LoadIcons", True, type=bool) else ['icon']
+        diff = diff_rows(self.loaded_rows, new_rows, ignore)
+        self.raw_data = new_data
+        
+        # Only cells of shown columns can be replaced in place; a column
+        # dropped by remove_empty_columns() that Steam filled needs a rebuild
+        shown = diff.changed_columns.issubset(self.headers)
+        if diff.in_place and shown and 'icon' not in diff.changed_columns:
+            index = {key: i for i, key in enumerate(self.data_rows.column('key'))}
+            new_index = {key: i for i, key in enumerate(new_rows.column('key'))}
+            changed_rows = []
+            for key in diff.changed:
+                row, new_row = index[key], new_index[key]
+                for name in diff.changed_columns:
+                    value = new_rows.get_value(new_row, name, '')
+                    self.loaded_rows.set_value(row, name, value)
+                    if (key, name) not in edits:
+                        self.data_rows.set_value(row, name, value)
+                changed_rows.append(row)
+            self.table_model.refresh_rows(changed_rows)
+        else:
+            # Achievements or columns were added or removed: rebuild, then put the edits back
+            self.parse_and_fill_table(show_success_msg=False)
+            index = {key: i for i, key in enumerate(self.data_rows.column('key'))}
+            for (key, name), value in edits.items():
+                if key in index:
+                    self.data_rows.set_value(index[key], name, value)
+            self.table_model.refresh()
+        
+        # A description change shows up in the key row and its _opis row
+        achievements = {key[:-5] if key.endswith('_opis') else key for key in diff.changed + diff.added + diff.removed}
+        self.statusBar().showMessage(
+            self.translations.get("schema_file_updated", "The file was updated by Steam: {count} achievements changed").format(
+                count=len(achievements)
+            ),
+            10000
+        )
+        if edits:
+            self.offer_reapply_translations(len(edits))
+
+    def offer_reapply_translations(self, count):
+        """Ask whether unsaved edits should be written into the rewritten file"""
+        if not self.settings.value("SchemaWatchAutoReapply", False, type=bool):
+            msg_box = QMessageBox(self)
+            msg_box.setIcon(QMessageBox.Icon.Question)
+            msg_box.setWindowTitle(self.translations.get("schema_changed_title", "File changed by Steam"))
+            msg_box.setText(self.translations.get(
+                "schema_changed_reapply",
+                "Steam rewrote the open file. Write your {count} unsaved changes into it again?"
+            ).format(count=count))
+            cb = QCheckBox(self.translations.get("schema_changed_always", "Always do this without asking"))
+            msg_box.setCheckBox(cb)
+            yes_button = msg_box.addButton(self.translations.get("button_yes"), QMessageBox.ButtonRole.YesRole)
+            msg_box.addButton(self.translations.get("button_no"), QMessageBox.ButtonRole.NoRole)
+            msg_box.exec()
+            if msg_box.clickedButton() != yes_button:
+                # Edits stay in the table, unsaved
+                return
+            if cb.isChecked():
+                self.settings.setValue("SchemaWatchAutoReapply", True)
+        
+        path = self.schema_watcher.path
+        try:
+            datas = self.file_manager.replace_language_in_binary(self.raw_data, self.data_rows)
+            self.file_manager.save_binary_file_atomic(datas, path)
+        except Exception as e:
+            QMessageBox.warning(self, self.translations.get("error"), f"{self.translations.get('error_cannot_save')}\n{str(e)}")
+            return
+        self.on_schema_saved(path, datas)
+        self.set_modified(False)
+        self.statusBar().showMessage(
+            self.translations.get("schema_changes_reapplied", "Your changes were written into the updated file"), 10000
+        )
+
     def detect_steam_path(self):
         """Auto-detect Steam path using steam integration plugin"""
         return self.steam_integration.detect_steam_path()
@@ -1601,6 +1885,7 @@ class BinParserGUI(QMainWindow):
             self.manual_file_game_id = None
 
         self.parse_and_fill_table()
+        self.schema_watcher.watch(path)
         self.version()
         self.gamename()
 
@@ -1670,12 +1955,12 @@ class BinParserGUI(QMainWindow):
             return
 
         # Reset UI
+        self.schema_watcher.unwatch()
         self.raw_data = b""
-        self.data_rows = []
+        self.data_rows = RowStore()
         self.headers = []
-        self.table.clear()
-        self.table.setRowCount(0)
-        self.table.setColumnCount(0)
+        self.table.clearSpans()
+        self.table_model.set_data_rows(self.data_rows, self.headers)
         if hasattr(self, "version_label"):
             self.version_label.setText(f"{self.translations.get('file_version')}{self.translations.get('unknown')}")
         if hasattr(self, "gamename_label"):
@@ -1727,6 +2012,7 @@ class BinParserGUI(QMainWindow):
             return
             
         info_text = self.translations.get("export_csv_for_translate_info", "")
+        from plugins import ContextLangDialog
         dlg = ContextLangDialog(self.headers, info_text=info_text, mode='export', parent=self)
         if not dlg.exec():
             return
@@ -1749,6 +2035,7 @@ class BinParserGUI(QMainWindow):
     def import_csv(self):
         """Import translations using csv_handler plugin"""
         info_text = self.translations.get("import_csv_info", "")
+        from plugins import ContextLangDialog
         dlg = ContextLangDialog(self.headers, info_text=info_text, mode='import', parent=self)
         if not dlg.exec():
             return
@@ -1761,8 +2048,8 @@ class BinParserGUI(QMainWindow):
             return
 
         try:
-            success, imported_count, changed_count, skipped_count, reason = self.csv_handler.import_translations(
-                fname, self.data_rows, import_col
+            success, imported_count, changed_count, skipped_count, reason = self.import_csv_with_progress(
+                fname, import_col
             )
             
             if success:
@@ -1790,6 +2077,21 @@ class BinParserGUI(QMainWindow):
             QMessageBox.warning(self, self.translations.get("error"), 
                               f"{self.translations.get('import_failed', 'Import failed')}\n{str(e)}")
 
+    def import_csv_with_progress(self, file_path, import_col):
+        """Stream a translation CSV into data_rows, showing progress in percent"""
+        message = self.translations.get("importing_csv", "Importing CSV")
+        self.show_progress(message, total=100)
+
+        def report(bytes_read, total_bytes):
+            percent = bytes_read * 100 // total_bytes if total_bytes else 100
+            if percent > self.progress_current:
+                self.update_progress(increment=percent - self.progress_current, message=message)
+
+        try:
+            return self.csv_handler.import_translations(file_path, self.data_rows, import_col, progress=report)
+        finally:
+            self.hide_progress()
+
     def import_dropped_csv(self, file_path):
         """Import dropped CSV file into current target language"""
         # Check if we need to auto-load game
@@ -1798,7 +2100,7 @@ class BinParserGUI(QMainWindow):
         
         if not self.data_rows:
             # Try to peek at CSV to find game_id in header
-            preview = self.csv_handler.get_column_preview(file_path, max_rows=1)
+            preview = self.csv_handler.get_column_preview(file_path, max_rows=1, count_rows=False)
             game_id = None
             if preview['valid'] and preview['header']:
                 # User puts game_id as last element in header row without column Label
@@ -1839,8 +2141,7 @@ class BinParserGUI(QMainWindow):
             # Check if target language column exists, if not, create it
             if self.data_rows and target_lang not in self.data_rows[0]:
                  # Add the column to all rows
-                 for row in self.data_rows:
-                     row[target_lang] = ""
+                 self.data_rows.ensure_columns([target_lang])
                  
                  # Add to headers if not present
                  if target_lang not in self.headers:
@@ -1848,8 +2149,8 @@ class BinParserGUI(QMainWindow):
 
                      pass 
             
-            success, imported_count, changed_count, skipped_count, reason = self.csv_handler.import_translations(
-                file_path, self.data_rows, target_lang
+            success, imported_count, changed_count, skipped_count, reason = self.import_csv_with_progress(
+                file_path, target_lang
             )
             
             if success:
@@ -1898,141 +2199,82 @@ class BinParserGUI(QMainWindow):
     # TABLE OPERATIONS AND DATA MANAGEMENT
     # =================================================================
 
-    def refresh_table(self):
-        self.table.clear()
-        self.table.setColumnCount(len(self.headers))
-        self.table.setHorizontalHeaderLabels(self.headers)
-        self.table.setRowCount(len(self.data_rows))
-        for row_i, row_data in enumerate(self.data_rows):
-            for col_i, header in enumerate(self.headers):
-                value = row_data.get(header, '')
-                item = QTableWidgetItem(value)
-                self.table.setItem(row_i, col_i, item)
-        self.update_row_heights()
-
-    def on_table_item_changed(self, item):
+    def on_table_cell_edited(self, row, col, header, old_value, new_value):
         if self.is_undoing or self.is_redoing:
             return
 
-        row = item.row()
-        col = item.column()
-        header = self.headers[col]
-        new_value = item.text()
-        if 0 <= row < len(self.data_rows):
-            old_value = self.data_rows[row].get(header, '')
-            self.undo_stack.append((row, col, header, old_value, new_value))
-            self.redo_stack.clear() 
-            self.data_rows[row][header] = new_value
+        self.undo_stack.append((row, col, header, old_value, new_value))
+        self.redo_stack.clear() 
         self.set_modified(True)
-        
-        # Update row height to accommodate wrapped text
-        # This allows text to wrap down instead of expanding the column horizontally
-        if hasattr(self, 'update_row_heights'):
-            # Update only the affected row for performance
-            max_height = self.table.verticalHeader().defaultSectionSize()
-            has_content = False
-            
-            for col_i in range(self.table.columnCount()):
-                # Skip hidden columns
-                if self.table.isColumnHidden(col_i):
-                    continue
-
-                cell_item = self.table.item(row, col_i)
-                if cell_item and cell_item.text():
-                    has_content = True
-                    doc = QTextDocument()
-                    doc.setHtml(cell_item.text())
-                    doc.setTextWidth(self.table.columnWidth(col_i))
-                    height = doc.size().height() + 8
-                    if height > max_height:
-                        max_height = height
-            
-            # Only set custom height if there's actual content, otherwise use default
-            if has_content:
-                self.table.setRowHeight(row, int(max_height))
-            else:
-                self.table.setRowHeight(row, self.table.verticalHeader().defaultSectionSize())
-
-    def sync_table_to_data_rows(self):
+        # The row's height follows via RowHeightManager (model dataChanged)
 
+    def commit_table_editor(self):
+        """Push the text of an open cell editor into the model before data_rows is used"""
         if self.table.state() == QAbstractItemView.State.EditingState:
             editor = self.table.focusWidget()
-            if editor:
-
-                index = self.table.indexAt(editor.pos())
+            if isinstance(editor, QLineEdit):
+                index = self.table.currentIndex()
                 if index.isValid():
+                    self.table_model.setData(index, editor.text())
+                self.table.closeEditor(editor, QAbstractItemDelegate.EndEditHint.NoHint)
 
-                    self.table.model().setData(index, editor.text())
+    def on_table_model_reset(self):
+        self.search_index.set_data_rows(self.table_model.rows, self.table_model.headers)
 
-                self.table.closePersistentEditor(self.table.item(index.row(), index.column()))
-
-
-        # Sync changes from table widget back to data_rows
-        for row_i in range(self.table.rowCount()):
-            if row_i >= len(self.data_rows):
-                continue
-            for col_i, header in enumerate(self.headers):
-                item = self.table.item(row_i, col_i)
-                value = item.text() if item else ''
-                self.data_rows[row_i][header] = value
+    def on_table_data_changed(self, top_left, bottom_right, roles=()):
+        # Zebra color updates don't change any text
+        if roles and Qt.ItemDataRole.DisplayRole not in roles and Qt.ItemDataRole.EditRole not in roles:
+            return
+        self.search_index.invalidate_rows(top_left.row(), bottom_right.row())
 
     def global_search_in_table(self, text):
-        search_text = text.strip().lower()
+        """Schedule a search; clearing the box applies at once, typing is debounced"""
+        self.pending_search_text = text
+        if not text.strip():
+            self.search_timer.stop()
+            self.apply_global_search()
+        else:
+            self.search_timer.start()
+
+    def apply_global_search(self):
+        search_text = self.pending_search_text.strip()
+        row_count = self.table_model.rowCount()
 
-        for row in range(self.table.rowCount()):
-            self.table.setRowHidden(row, False)
-                               
         if not search_text:
+            visible = None
             self.highlight_delegate.set_highlight("")
-            self.highlight_delegate.highlight_column = -1
-            self.table.viewport().update()
-            return
+        else:
+            visible = set(self.search_index.match(search_text))
+            self.highlight_delegate.set_highlight(search_text.lower())
+        self.highlight_delegate.highlight_column = -1
 
-        self.highlight_delegate.set_highlight(search_text)
-        self.highlight_delegate.highlight_column = -1 
+        # Only touch rows whose state changes, with repaints held until the end
+        self.table.setUpdatesEnabled(False)
+        try:
+            for row in range(row_count):
+                hidden = visible is not None and row not in visible
+                if self.table.isRowHidden(row) != hidden:
+                    self.table.setRowHidden(row, hidden)
+        finally:
+            self.table.setUpdatesEnabled(True)
         self.table.viewport().update()
-
-        for row in range(self.table.rowCount()):
-            row_has_match = False
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                if item and search_text in item.text().lower():
-                    row_has_match = True
-            self.table.setRowHidden(row, not row_has_match)
+        # Rows that just became visible may not be measured yet
+        self.row_heights.schedule()
 
     def update_row_heights(self):
-        for row in range(self.table.rowCount()):
-            max_height = self.table.verticalHeader().defaultSectionSize()
-            for col in range(self.table.columnCount()):
-                # Skip hidden columns to avoid calculation issues
-                if self.table.isColumnHidden(col):
-                    continue
-                    
-                item = self.table.item(row, col)
-                if item and item.text():
-                    doc = QTextDocument()
-                    doc.setHtml(item.text())
-                    doc.setTextWidth(self.table.columnWidth(col))
-                    height = doc.size().height() + 8
-                    if height > max_height:
-                        max_height = height
-            self.table.setRowHeight(row, int(max_height))
-
-    # =================================================================
-    # EDITING OPERATIONS (UNDO/REDO/COPY/PASTE)
-    # =================================================================
+        """Size rows to their text again; measured lazily for rows in view"""
+        self.row_heights.invalidate()
 
     def copy_selection_to_clipboard(self):
-        selection = self.table.selectedRanges()
-        if not selection:
+        selection = self.table.selectionModel().selection()
+        if selection.isEmpty():
             return
         s = ''
         for rng in selection:
-            for row in range(rng.topRow(), rng.bottomRow()+1):
+            for row in range(rng.top(), rng.bottom()+1):
                 row_data = []
-                for col in range(rng.leftColumn(), rng.rightColumn()+1):
-                    item = self.table.item(row, col)
-                    row_data.append(item.text() if item else '')
+                for col in range(rng.left(), rng.right()+1):
+                    row_data.append(self.table_model.cell_text(row, col))
                 s += '\t'.join(row_data) + '\n'
         QApplication.clipboard().setText(s)
 
@@ -2041,48 +2283,41 @@ class BinParserGUI(QMainWindow):
         if not clipboard:
             return
         rows = clipboard.split('\n')
-        current = self.table.currentRow()
-        col = self.table.currentColumn()
+        current = self.table.currentIndex().row()
+        col = self.table.currentIndex().column()
+        if current < 0 or col < 0:
+            return
         for r, row_data in enumerate(rows):
             if not row_data.strip():
                 continue
             for c, text in enumerate(row_data.split('\t')):
                 row_idx = current + r
                 col_idx = col + c
-                if row_idx < self.table.rowCount() and col_idx < self.table.columnCount():
-                    self.table.setItem(row_idx, col_idx, QTableWidgetItem(text))
+                if row_idx < self.table_model.rowCount() and col_idx < self.table_model.columnCount():
+                    self.table_model.setData(self.table_model.index(row_idx, col_idx), text)
 
     def cut_selection_to_clipboard(self):
         self.copy_selection_to_clipboard()
         self.clear_selection()
 
     def clear_selection(self):
-        selected_ranges = self.table.selectedRanges()
-        for rng in selected_ranges:
-            for row in range(rng.topRow(), rng.bottomRow() + 1):
-                for col in range(rng.leftColumn(), rng.rightColumn() + 1):
-                    item = self.table.item(row, col)
-                    if item:
-                        item.setText("")  
-                    else:
-                        self.table.setItem(row, col, QTableWidgetItem(""))
+        for index in self.table.selectionModel().selectedIndexes():
+            self.table_model.setData(index, "")
 
-                    if 0 <= row < len(self.data_rows) and 0 <= col < len(self.headers):
-                        header = self.headers[col]
-                        self.data_rows[row][header] = ""
+    def set_cell_value(self, row, header, value):
+        """Write a value by column name (columns may have been reordered since the edit)"""
+        if header in self.table_model.headers:
+            col = self.table_model.headers.index(header)
+            self.table_model.setData(self.table_model.index(row, col), value)
+        elif 0 <= row < len(self.data_rows):
+            self.data_rows[row][header] = value
 
     def undo(self):
         if not self.undo_stack:
             return
         self.is_undoing = True
         row, col, header, old_value, new_value = self.undo_stack.pop()
-        self.data_rows[row][header] = old_value
-        item = self.table.item(row, col)
-        if not item:
-            item = QTableWidgetItem(old_value)
-            self.table.setItem(row, col, item)
-        else:
-            item.setText(old_value)
+        self.set_cell_value(row, header, old_value)
         self.redo_stack.append((row, col, header, new_value, old_value))
         self.is_undoing = False
 
@@ -2091,13 +2326,7 @@ class BinParserGUI(QMainWindow):
             return
         self.is_redoing = True
         row, col, header, new_value, old_value = self.redo_stack.pop()
-        self.data_rows[row][header] = new_value
-        item = self.table.item(row, col)
-        if not item:
-            item = QTableWidgetItem(new_value)
-            self.table.setItem(row, col, item)
-        else:
-            item.setText(new_value)
+        self.set_cell_value(row, header, new_value)
         self.undo_stack.append((row, col, header, old_value, new_value))
         self.is_redoing = False
 
@@ -2184,91 +2413,25 @@ class BinParserGUI(QMainWindow):
     def save_column_widths(self):
         """Save current column widths"""
         self.column_widths = {}
-        for i in range(self.table.columnCount()):
+        for i in range(self.table_model.columnCount()):
             self.column_widths[i] = self.table.columnWidth(i)
 
     def restore_column_widths(self):
         """Restore saved column widths"""
         if hasattr(self, 'column_widths'):
             for i, width in self.column_widths.items():
-                if i < self.table.columnCount():
+                if i < self.table_model.columnCount():
                     self.table.setColumnWidth(i, width)
 
     def refresh_table(self):
         """Update table content from data structure without recreating everything"""
-        self.save_column_widths()
-        self.table.blockSignals(True)
-        
-        # Colors for alternating row pairs
-        bg_color_1, bg_color_2 = self.get_row_pair_colors()
-        
-        # Prepare for icon loading
-        icon_tasks = []
-        placeholder = None
-        self.icons_to_load_total = 0
-        self.icons_loaded_count = 0
-        
-        if 'icon' in self.headers:
-             placeholder = self.icon_loader.get_placeholder_icon(size=(64, 64))
-             self.icons_to_load_total = sum(1 for row in self.data_rows if row.get('icon', ''))
-        
-        # Show progress bar for icons
-        if self.icons_to_load_total > 0:
-            self.show_progress(self.translations.get("loading", "Loading icons..."), total=self.icons_to_load_total)
-            
-        for row_i, row in enumerate(self.data_rows):
-            # Determine background color for this row pair
-            pair_index = row_i // 2
-            row_bg_color = bg_color_1 if pair_index % 2 == 0 else bg_color_2
-            
-            for col_i, col_name in enumerate(self.headers):
-                value = row.get(col_name, '')
-                
-                # Special handling for icon column
-                if col_name == 'icon' and value:
-                    # Check if this is a key row (not _opis)
-                    key_value = row.get('key', '')
-                    is_main_row = not key_value.endswith('_opis')
-                    
-                    if is_main_row:
-                        icon_label = QLabel()
-                        icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                        hex_color = row_bg_color.name()
-                        icon_label.setStyleSheet(f"background-color: {hex_color}; border: none;")
-                        
-                        if placeholder:
-                            icon_label.setPixmap(placeholder)
-                        
-                        icon_tasks.append((row_i, col_i, value))
-                        self.table.setCellWidget(row_i, col_i, icon_label)
-                        
-                        # Set empty text item so cell is selectable but doesn't show hash
-                        item = QTableWidgetItem('')
-                        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                        item.setBackground(row_bg_color)
-                        self.table.setItem(row_i, col_i, item)
-                        continue
-
-                # Standard text item
-                if self.table.item(row_i, col_i):
-                    self.table.item(row_i, col_i).setText(value)
-                    self.table.item(row_i, col_i).setBackground(row_bg_color)
-                else:
-                    item = QTableWidgetItem(value)
-                    if col_name == 'key':
-                        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    item.setBackground(row_bg_color)
-                    self.table.setItem(row_i, col_i, item)
-        
-        self._setup_icon_worker(icon_tasks)
-        
-        self.table.blockSignals(False)
-        self.restore_column_widths()
+        # data_rows was changed in place (e.g. CSV import), the view only has to repaint
+        self.table_model.refresh()
 
     def on_translation_language_changed(self):
         """Handle translation language change"""
         # Ensure any pending edits are committed before rebuilding table
-        self.sync_table_to_data_rows()
+        self.commit_table_editor()
         
         if not hasattr(self, 'data_rows') or not self.data_rows:
             return
@@ -2281,13 +2444,10 @@ class BinParserGUI(QMainWindow):
             old_headers = self.headers.copy()
             
             # Get all original headers from binary data
-            all_headers = set()
-            for row in self.data_rows:
-                for col in row.keys():
-                    all_headers.add(col)
+            all_headers = self.data_rows.column_names()
             
             # Re-prioritize with new selection
-            self.headers = self.prioritize_headers(list(all_headers))
+            self.headers = self.prioritize_headers(all_headers)
             
             # Refresh table display
             self.refresh_table_with_new_headers()
@@ -2302,97 +2462,31 @@ class BinParserGUI(QMainWindow):
 
         # Save current widths by clean label
         saved_widths = {}
-        for i in range(self.table.columnCount()):
-            item = self.table.horizontalHeaderItem(i)
-            if item:
-                # Store width for the existing content
-                saved_widths[_clean_label(item.text())] = self.table.columnWidth(i)
+        for i, label in enumerate(self.table_model.header_labels):
+            # Store width for the existing content
+            saved_widths[_clean_label(label)] = self.table.columnWidth(i)
         
-        self.table.clear()
-        self.table.setColumnCount(len(self.headers))
+        # Resetting the model resets the header sections, remember hidden columns by name
+        hidden_headers = {header for i, header in enumerate(self.table_model.headers) if self.table.isColumnHidden(i)}
+        mandatory_columns = self.get_mandatory_columns()
         
         # Updated header labels
-        header_labels = []
-        for header in self.headers:
-            if header == 'key':
-                header_labels.append(header.upper())
-            else:
-                display_name = get_display_name(header)
-                if '(' in display_name:
-                     # Use actual newline character, not literal \n string
-                    display_name = display_name.replace(' (', '\n(')
-                header_labels.append(display_name)
-                
-        self.table.setHorizontalHeaderLabels(header_labels)
-        self.table.setRowCount(len(self.data_rows))
-        
-        # Restore widths by clean label
-        for i in range(self.table.columnCount()):
-            item = self.table.horizontalHeaderItem(i)
-            if item:
-                 label = _clean_label(item.text())
-                 if label in saved_widths:
-                     self.table.setColumnWidth(i, saved_widths[label])
-
-        # Colors for alternating row pairs
-        bg_color_1, bg_color_2 = self.get_row_pair_colors()
+        header_labels = self.get_header_labels(self.headers)
         
-        # Prepare for icon loading
-        icon_tasks = []
-        placeholder = None
-        self.icons_to_load_total = 0
-        self.icons_loaded_count = 0
+        self.table.clearSpans()
+        self.table_model.set_data_rows(self.data_rows, self.headers, header_labels)
         
-        if 'icon' in self.headers:
-             placeholder = self.icon_loader.get_placeholder_icon(size=(64, 64))
-             self.icons_to_load_total = sum(1 for row in self.data_rows if row.get('icon', ''))
-             
-        # Show progress bar for icons
-        if self.icons_to_load_total > 0:
-            self.show_progress(self.translations.get("loading", "Loading icons..."), total=self.icons_to_load_total)
-            
-        self.table.blockSignals(True)
-        for row_i, row in enumerate(self.data_rows):
-            # Determine background color for this row pair
-            pair_index = row_i // 2
-            row_bg_color = bg_color_1 if pair_index % 2 == 0 else bg_color_2
-            
-            for col_i, col_name in enumerate(self.headers):
-                value = row.get(col_name, '')
-                
-                # Special handling for icon column
-                if col_name == 'icon' and value:
-                    key_value = row.get('key', '')
-                    is_main_row = not key_value.endswith('_opis')
-                    
-                    if is_main_row:
-                        icon_label = QLabel()
-                        icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                        hex_color = row_bg_color.name()
-                        icon_label.setStyleSheet(f"background-color: {hex_color}; border: none;")
-                        
-                        if placeholder:
-                            icon_label.setPixmap(placeholder)
-                        
-                        icon_tasks.append((row_i, col_i, value))
-                        self.table.setCellWidget(row_i, col_i, icon_label)
-                        
-                        item = QTableWidgetItem('')
-                        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                        item.setBackground(row_bg_color)
-                        self.table.setItem(row_i, col_i, item)
-                        continue
-
-                item = QTableWidgetItem(value)
-                if col_name == 'key':
-                    item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                
-                item.setBackground(row_bg_color)
-                self.table.setItem(row_i, col_i, item)
+        # Restore widths by clean label
+        for i, label in enumerate(header_labels):
+            label = _clean_label(label)
+            if label in saved_widths:
+                self.table.setColumnWidth(i, saved_widths[label])
         
-        self._setup_icon_worker(icon_tasks)
+        for i, header in enumerate(self.headers):
+            self.table.setColumnHidden(i, header in hidden_headers and header not in mandatory_columns)
         
-        self.table.blockSignals(False)
+        self._populate_icon_column()
+        self.update_row_heights()
 
     def remove_empty_columns(self):
         """Remove columns that are completely empty (except for key column)"""
@@ -2402,32 +2496,18 @@ class BinParserGUI(QMainWindow):
         # Find columns to remove
         columns_to_remove = []
         
-        # Get all column names from the data
-        all_columns = set()
-        for row in self.data_rows:
-            all_columns.update(row.keys())
-        
-        for col_name in all_columns:
+        for col_name in self.data_rows.column_names():
             # Never remove key column
             if col_name == 'key':
                 continue
                 
-            # Check if column is completely empty
-            is_empty = True
-            for row in self.data_rows:
-                value = row.get(col_name, '').strip()
-                if value:  # If any non-empty value found
-                    is_empty = False
-                    break
-            
-            if is_empty:
+            # Check if column is completely empty (missing cells count as empty)
+            if not any(value and value.strip() for value in self.data_rows.column(col_name)):
                 columns_to_remove.append(col_name)
         
         # Remove empty columns from data
         for col_name in columns_to_remove:
-            for row in self.data_rows:
-                if col_name in row:
-                    del row[col_name]
+            self.data_rows.drop_column(col_name)
         
         # Update headers list if it exists
         if hasattr(self, 'headers') and self.headers:
@@ -2487,6 +2567,13 @@ class BinParserGUI(QMainWindow):
         self.progress_bar.setFormat(f"{message} {self.progress_current}/{self.progress_total}")
         QApplication.processEvents()
     
+    def set_progress(self, current, total=None, message=None):
+        """Update progress bar to an absolute position (for workers that report done/total)"""
+        if total is not None and total != self.progress_total:
+            self.progress_total = total
+            self.progress_bar.setMaximum(total)
+        self.update_progress(increment=current - self.progress_current, message=message)
+    
     def hide_progress(self):
         """Hide progress bar"""
         self.progress_bar.setVisible(False)
@@ -2495,79 +2582,81 @@ class BinParserGUI(QMainWindow):
         self.statusBar().showMessage(self.translations.get("ready", "Ready"))
         QApplication.processEvents()
 
-    def load_steam_app_list(self):
-        """Load Steam app list from local cache"""
-        cache_path = resource_path(STEAM_APP_LIST_CACHE)
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Convert list to dict for O(1) lookup: {appid: name}
-                    return {str(app['appid']): app['name'] for app in data.get('applist', {}).get('apps', [])}
-            except Exception:
-                pass
-        return {}
+    @traced("import_app_list")
+    def import_app_list(self):
+        """Import the bundled app list into the store; runs on a background thread"""
+        # SQLite connections belong to one thread, this one is closed again right away
+        store = GameNameStore(self.game_name_store.db_path)
+        try:
+            return store.import_app_list(resource_path(STEAM_APP_LIST_CACHE))
+        finally:
+            store.close()
+
+    def on_app_list_ready(self):
+        """App list import finished: migrate old cached names, show the real game name"""
+        error = self.app_list_future.exception()
+        if error is not None:
+            print(f"[GameNames] App list import failed: {error}")
+        self.migrate_game_name_cache()
+        # Names looked up during the import were not memoized, look the current one up again
+        if getattr(self, 'raw_data', None):
+            self.gamename()
+
+    def migrate_game_name_cache(self):
+        """Move names cached in QSettings by older versions into the game name store"""
+        self.settings.beginGroup("GameNameCache")
+        try:
+            names = {appid: self.settings.value(appid) for appid in self.settings.childKeys()}
+        finally:
+            self.settings.endGroup()
+        if not names:
+            return
+        self.game_name_store.put_names({
+            appid: name for appid, name in names.items()
+            if isinstance(name, str) and name not in GameNameStore.FAILED_STATUSES
+        })
+        self.settings.remove("GameNameCache")
+        self.settings.sync()
 
     def fetch_game_name_from_api(self, appid, progress_callback=None, is_cancelled=None):
-        """Fetch game name from Steam Store API with error handling"""
-        try:
-            if progress_callback:
-                progress_callback(0, f"Fetching game {appid}...")
-            
-            # Check if operation was cancelled
-            if is_cancelled and is_cancelled():
-                return None
-            
-            
-            url = f"https://store.steampowered.com/api/appdetails?appids={appid}"
-            response = HTTPClient.get(url, timeout=(5, 10))
-            response.raise_for_status()
-            data = response.json()
-            
-            if progress_callback:
-                progress_callback(100, f"Loaded game {appid}")
-                
-            if str(appid) in data and data[str(appid)]['success']:
-                return data[str(appid)]['data']['name']
-            else:
-                # Game exists but API returned success=false (delisted, region-locked, etc.)
-                print(f"[API] Game {appid}: API returned success=false")
-                return "API_FAILED"
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 429:
-                print(f"[API] Game {appid}: Rate limited (429)")
-                return "RATE_LIMITED"
-            else:
-                print(f"[API] Game {appid}: HTTP error {e.response.status_code}")
-                return "API_ERROR"
-        except requests.exceptions.Timeout:
-            print(f"[API] Game {appid}: Request timeout")
-            return "TIMEOUT"
-        except requests.exceptions.RequestException as e:
-            print(f"[API] Game {appid}: Network error - {str(e)}")
-            return "NETWORK_ERROR"
-        except Exception as e:
-            print(f"[API] Game {appid}: Unexpected error - {str(e)}")
-            return "UNKNOWN_ERROR"
+        """Fetch game name from Steam Store API; returns the name or an error code"""
+        if progress_callback:
+            progress_callback(0, f"Fetching game {appid}...")
+        
+        # Check if operation was cancelled
+        if is_cancelled and is_cancelled():
+            return None
+        
+        from plugins import fetch_app_name
+        status, name, _ = fetch_app_name(appid)
+        
+        if progress_callback:
+            progress_callback(100, f"Loaded game {appid}")
+        
+        return name if status == GameNameStore.STATUS_OK else status
     
     def save_game_name_to_cache(self, appid, name):
-        """Save game name to QSettings cache"""
-        cache_key = f"GameNameCache/{appid}"
-        self.settings.setValue(cache_key, name)
-        self.settings.sync()
+        """Save a resolved game name, or an API error code (kept until its TTL runs out)"""
+        if name in GameNameStore.FAILED_STATUSES:
+            self.game_name_store.put(appid, None, name)
+        else:
+            self.game_name_store.put(appid, name)
     
     def get_game_name_from_cache(self, appid):
-        """Get game name from QSettings cache"""
-        cache_key = f"GameNameCache/{appid}"
-        return self.settings.value(cache_key, None)
+        """Cached game name, the error code of a recent failed lookup, or None"""
+        entry = self.game_name_store.get_entry(appid)
+        if entry is None:
+            return None
+        name, status = entry
+        return name if status == GameNameStore.STATUS_OK else status
     
     def get_steam_game_name(self, appid, show_progress=True):
         """
         Get game name using offline-first approach.
         
         Priority order (offline-first):
-        1. QSettings cache (fastest, most recent)
-        2. Local JSON file (steam.api.allgamenames.json - works offline)
+        1. Game name store (names resolved before; recent failures are not retried)
+        2. Bundled app list (steam.api.allgamenames.json, imported into the store - works offline)
         3. Steam API (requires internet, only for games not in JSON)
         
         This ensures the app works offline for games in the JSON database,
@@ -2582,18 +2671,17 @@ class BinParserGUI(QMainWindow):
         
         appid_str = str(appid)
         
-        # 1. Check QSettings cache first (most specific/recent)
+        # 1. Check the store first (most specific/recent)
         cached_name = self.get_game_name_from_cache(appid_str)
         if cached_name:
-            # Don't return error codes from cache, treat them as not cached
-            if cached_name not in ["RATE_LIMITED", "API_FAILED", "API_ERROR", "TIMEOUT", "NETWORK_ERROR", "UNKNOWN_ERROR"]:
-                return cached_name
+            # A failed lookup is not repeated until its TTL runs out
+            if cached_name in GameNameStore.FAILED_STATUSES:
+                return None
+            return cached_name
             
         # 2. Check local full app list (bulk cache from JSON - works offline)
-        if hasattr(self, 'steam_app_names') and appid_str in self.steam_app_names:
-            name = self.steam_app_names[appid_str]
-            # Save to QSettings cache for faster future access
-            self.save_game_name_to_cache(appid_str, name)
+        name = self.game_name_store.get_app_list_name(appid_str)
+        if name:
             return name
         
         # 3. Fetch from Steam API (individual request for new/missing games - requires internet)
@@ -2605,13 +2693,13 @@ class BinParserGUI(QMainWindow):
             if api_result and not api_result.startswith("RATE_LIMITED") and not api_result.startswith("API_") and not api_result.endswith("_ERROR"):
                 # Success - got a real game name
                 self.save_game_name_to_cache(appid, api_result)
-                self.settings.sync()
                 if show_progress:
                     self.update_progress(increment=1, message="Loading")
                 return api_result
             elif api_result in ["RATE_LIMITED", "API_FAILED", "API_ERROR", "TIMEOUT", "NETWORK_ERROR", "UNKNOWN_ERROR"]:
                 # Error occurred - cache the error to avoid retrying immediately
-                # But don't save permanently, so next app restart can try again
+                # It expires after a TTL, so the name is fetched again later
+                self.save_game_name_to_cache(appid, api_result)
                 if show_progress:
                     self.update_progress(increment=1, message="Error")
                 return None
@@ -2626,16 +2714,15 @@ class BinParserGUI(QMainWindow):
         
         return None
 
-    def get_game_name_for_id(self, appid, raw_data=None, show_progress=False):
+    def get_game_name_for_id(self, appid, raw_data=None, show_progress=False, binary_name=None):
         """
         Get game name using game ID only (cache-first approach).
         
         Lookup order:
         1. Session memory cache
-        2. QSettings cache
-        3. JSON file (steam_app_names)
-        4. Binary file (marked with * as code name)
-        5. Return "Unknown"
+        2. Game name store (resolved names, then the bundled app list)
+        3. Binary file (marked with * as code name)
+        4. Return "Unknown"
         
         Never makes API calls automatically.
         
@@ -2643,6 +2730,8 @@ class BinParserGUI(QMainWindow):
             appid: Steam App ID
             raw_data: Binary file data (optional, for fallback)
             show_progress: Ignored (kept for compatibility)
+            binary_name: Game name already read from the binary file (optional,
+                used instead of parsing raw_data)
         """
         if not appid:
             return self.translations.get("unknown", "Unknown")
@@ -2653,34 +2742,39 @@ class BinParserGUI(QMainWindow):
         if appid_str in self.steam_game_names:
             return self.steam_game_names[appid_str]
         
-        # 2. Check QSettings cache
-        cached = self.get_game_name_from_cache(appid_str)
-        if cached:
-            self.steam_game_names[appid_str] = cached
-            return cached
-        
-        # 3. Check JSON file
-        if appid_str in self.steam_app_names:
-            name = self.steam_app_names[appid_str]
+        # 2. Check the store (runtime results and the imported app list)
+        name = self.game_name_store.get_name(appid_str)
+        if name:
             self.steam_game_names[appid_str] = name
-            self.save_game_name_to_cache(appid_str, name)
             return name
         
-        # 4. Fallback to binary file (mark as code name with *)
-        if raw_data:
+        # 3. Fallback to binary file (mark as code name with *)
+        if binary_name is None and raw_data:
             binary_name = self.binary_parser.get_gamename(raw_data)
-            if binary_name and binary_name != self.translations.get("unknown", "Unknown"):
-                # Mark as code name from binary
-                marked_name = f"*{binary_name}"
+        if binary_name and binary_name != self.translations.get("unknown", "Unknown"):
+            # Mark as code name from binary
+            marked_name = f"*{binary_name}"
+            # While the app list is still importing, the store may know it soon
+            if self.app_list_future.done():
                 self.steam_game_names[appid_str] = marked_name
-                # Don't save to QSettings cache - we want to try API next time
-                return marked_name
+            # Not stored - we want to try API next time
+            return marked_name
         
-        # 5. Return unknown
+        # 4. Return unknown
         unknown = self.translations.get("unknown", "Unknown")
-        self.steam_game_names[appid_str] = unknown
+        if self.app_list_future.done():
+            self.steam_game_names[appid_str] = unknown
         return unknown
     
+    def get_game_names_for_ids(self, entries):
+        """Resolve names for many (appid, binary_name) pairs with a few batched store queries"""
+        pending = [str(appid) for appid, _ in entries if appid and str(appid) not in self.steam_game_names]
+        self.steam_game_names.update(self.game_name_store.get_names(pending))
+        return [
+            self.get_game_name_for_id(appid, binary_name=binary_name)
+            for appid, binary_name in entries
+        ]
+    
     
 
     
@@ -2813,8 +2907,9 @@ class BinParserGUI(QMainWindow):
         self.show_progress(total=len(stats_files))
         
         # Create and start worker
+        from plugins import GameNameFetchWorker
         self.worker = GameNameFetchWorker(stats_files, stats_dir, self)
-        self.worker.progress.connect(lambda current, total, msg: self.update_progress(message=msg))
+        self.worker.progress.connect(self.set_progress)
         self.worker.api_error.connect(self.on_api_error)
         self.worker.finished.connect(self.on_stats_loading_finished)
         self.worker.start()
@@ -2830,9 +2925,23 @@ class BinParserGUI(QMainWindow):
             self.api_error_dialog.setWindowFlags(self.api_error_dialog.windowFlags() | Qt.WindowType.WindowStaysOnTopHint)
             self.api_error_dialog.show()
 
-    def on_stats_loading_finished(self, stats_list):
+    def on_stats_loading_finished(self, results):
         self.hide_progress()
         
+        names = self.get_game_names_for_ids(
+            (game_id, metadata['gamename']) for game_id, metadata in results
+        )
+        unknown = self.translations.get("unknown")
+        stats_list = [
+            (
+                name,
+                metadata['version'] if metadata['version'] is not None else unknown,
+                game_id,
+                metadata['achievement_count']
+            )
+            for name, (game_id, metadata) in zip(names, results)
+        ]
+        
         # Mark fetch as completed if UseSteamName is ON
         if self.settings.value("UseSteamName", False, type=bool):
             self.settings.setValue("SteamNamesFetchCompleted", True)
@@ -2844,6 +2953,7 @@ class BinParserGUI(QMainWindow):
         
         # Show dialog
         # Show dialog
+        from plugins import UserGameStatsListDialog
         self.dlg = UserGameStatsListDialog(self, stats_list, self.steam_game_names, self.settings)
         self.dlg.exec()
 
@@ -2952,8 +3062,15 @@ class BinParserGUI(QMainWindow):
 
     def closeEvent(self, event):
         if hasattr(self, 'icon_worker') and self.icon_worker:
-            self.icon_worker.stop()
+            self._stop_icon_worker()
         if self.maybe_save_before_exit():
+            # Stopped workers leave their poll loop within ~0.1s, don't let
+            # the window take a running QThread down with it
+            for worker in list(self.retired_icon_workers):
+                worker.wait(1000)
+            trace_file = PerfTracer.env_trace_file()
+            if trace_file:
+                perf_tracer.dump_chrome_trace(trace_file)
             event.accept()
         else:
             event.ignore()
@@ -2998,11 +3115,13 @@ class BinParserGUI(QMainWindow):
                 # Clean environment variables that might interfere with launching external apps from AppImage
                 if "LD_LIBRARY_PATH" in env:
                     del env["LD_LIBRARY_PATH"]
+                import subprocess
                 subprocess.Popen(["xdg-open", steam_url], env=env)
                 return
             except Exception as e:
                 print(f"Failed to open URL with xdg-open: {e}")
         
+        import webbrowser
         webbrowser.open(steam_url)
 
 def main():
@@ -3054,4 +3173,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Schema scanning uses a process pool; frozen builds must not rerun the GUI in workers
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
@@ -0,0 +1,4 @@
+"""
+Benchmarks for Steam Achievement Localizer
+Synthetic schema files and timings of the parse/patch/import hot paths
+"""
@@ -0,0 +1,211 @@
+"""
+Benchmark Runner for Steam Achievement Localizer
+Times the parse/patch/import hot paths on synthetic schemas and saves the results as JSON
+"""
+import argparse
+import csv
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.schema_generator import LANGUAGES, generate_schema
+from plugins.binary_parser import BinaryParser
+from plugins.csv_handler import CSVHandler
+from plugins.file_manager import FileManager
+
+
+# (achievements, languages) per case; override with --sizes
+DEFAULT_SIZES: List[Tuple[int, int]] = [(100, 10), (1000, 10), (1000, len(LANGUAGES)), (5000, len(LANGUAGES))]
+
+STAGES = ["parse_binary_data", "get_achievement_count", "replace_language_in_binary", "import_translations"]
+
+
+def measure(func: Callable[[], Any], repeats: int) -> Dict[str, float]:
+    """Wall time of func over repeats runs, plus its peak traced memory
+
+    Timed runs happen without tracemalloc, which slows allocation-heavy
+    code down a lot; one extra traced run gives the peak.
+    """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'min_s': min(timings),
+        'median_s': statistics.median(timings),
+        'max_s': max(timings),
+        'peak_memory_bytes': peak
+    }
+
+
+def _with_throughput(result: Dict[str, float], size_bytes: int, rows: int) -> Dict[str, float]:
+    best = result['min_s'] or 1e-9
+    result['mb_per_s'] = size_bytes / best / (1024 * 1024)
+    result['rows_per_s'] = rows / best
+    return result
+
+
+def write_translation_csv(path: str, rows, target: str):
+    """CSV in the export_for_translation() layout, translating every row"""
+    with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.writer(f)
+        writer.writerow(['key', 'english', 'translation', target])
+        for row in rows:
+            writer.writerow([
+                row['key'], row.get('english', ''), f"translated {row['key']}", row.get(target, '')
+            ])
+
+
+def run_case(achievements: int,
+             languages: int,
+             repeats: int,
+             icons: bool = True,
+             opis_duplicates: bool = False,
+             stages: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Benchmark every stage on one generated schema"""
+    stages = stages or STAGES
+    data = generate_schema(
+        achievements=achievements, languages=languages, icons=icons, opis_duplicates=opis_duplicates
+    )
+    # Last language in use: missing for some achievements, like a real partial translation
+    target = LANGUAGES[languages - 1] if languages > 1 else 'english'
+
+    parser = BinaryParser()
+    rows, headers = parser.parse_binary_data(data)
+    row_count = len(rows)
+    size = len(data)
+
+    case: Dict[str, Any] = {
+        'achievements': achievements,
+        'languages': languages,
+        'icons': icons,
+        'opis_duplicates': opis_duplicates,
+        'target_language': target,
+        'size_bytes': size,
+        'rows': row_count,
+        'stages': {}
+    }
+
+    if "parse_binary_data" in stages:
+        case['stages']['parse_binary_data'] = _with_throughput(
+            measure(lambda: BinaryParser().parse_binary_data(data), repeats), size, row_count
+        )
+
+    if "get_achievement_count" in stages:
+        count_parser = BinaryParser()
+        case['achievement_count'] = count_parser.get_achievement_count(data)
+        case['stages']['get_achievement_count'] = _with_throughput(
+            measure(lambda: count_parser.get_achievement_count(data), repeats), size, row_count
+        )
+
+    if "replace_language_in_binary" in stages:
+        # As in the app: the file was parsed (and tokenized) by the same parser before saving
+        edited = rows.copy()
+        edited.ensure_columns([target])
+        for index, row in enumerate(edited):
+            row[target] = f"{target} edited {index}"
+        file_manager = FileManager(parser)
+        case['output_size_bytes'] = len(file_manager.replace_language_in_binary(data, edited))
+        case['stages']['replace_language_in_binary'] = _with_throughput(
+            measure(lambda: file_manager.replace_language_in_binary(data, edited), repeats), size, row_count
+        )
+
+    if "import_translations" in stages:
+        handler = CSVHandler()
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = os.path.join(tmp, "translations.csv")
+            write_translation_csv(csv_path, rows, target)
+            csv_size = os.path.getsize(csv_path)
+
+            def import_csv():
+                # Fresh rows every run, otherwise later runs would change nothing
+                target_rows = rows.copy()
+                target_rows.ensure_columns([target])
+                success, imported, *_ = handler.import_translations(csv_path, target_rows, target)
+                if not success or imported != row_count:
+                    raise RuntimeError(f"CSV import failed ({imported}/{row_count} rows)")
+
+            case['stages']['import_translations'] = _with_throughput(
+                measure(import_csv, repeats), csv_size, row_count
+            )
+
+    return case
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _parse_size(text: str) -> Tuple[int, int]:
+    try:
+        achievements, languages = text.lower().split('x')
+        return int(achievements), int(languages)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected NxM (achievements x languages), got {text!r}")
+
+
+def main(argv: Optional[List[str]] = None):
+    p = argparse.ArgumentParser(description="Benchmark parsing, saving and CSV import on synthetic schemas.")
+    p.add_argument("--sizes", type=_parse_size, nargs="+", default=DEFAULT_SIZES,
+                   help="Cases as NxM (achievements x languages), e.g. 1000x10 5000x27")
+    p.add_argument("--repeats", type=int, default=5, help="Timed runs per stage (best and median are kept)")
+    p.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES)
+    p.add_argument("--no-icons", action="store_true", help="Generate schemas without icons")
+    p.add_argument("--opis", action="store_true", help="Generate duplicate english descriptions (_opis rows)")
+    p.add_argument("--output", default="benchmark_results.json", help="JSON file for the results")
+    args = p.parse_args(argv)
+
+    results = {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'repeats': args.repeats,
+        'cases': []
+    }
+
+    for achievements, languages in args.sizes:
+        case = run_case(
+            achievements, languages, args.repeats,
+            icons=not args.no_icons, opis_duplicates=args.opis, stages=args.stages
+        )
+        results['cases'].append(case)
+        print(f"{achievements} achievements x {languages} languages "
+              f"({case['size_bytes'] / 1024:.0f} KiB, {case['rows']} rows)")
+        for stage, result in case['stages'].items():
+            print(f"  {stage:<28} {result['min_s'] * 1000:9.2f} ms"
+                  f"  {result['mb_per_s']:8.1f} MB/s  {result['rows_per_s']:11.0f} rows/s"
+                  f"  peak {result['peak_memory_bytes'] / 1024:8.0f} KiB")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
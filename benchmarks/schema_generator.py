@@ -0,0 +1,131 @@
+"""
+Schema Generator for Steam Achievement Localizer benchmarks
+Builds valid UserGameStatsSchema binaries of any size from a seed
+"""
+import argparse
+import os
+import random
+import struct
+import sys
+from typing import List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plugins.keyvalues import TYPE_SECTION, TYPE_STRING, TYPE_INT32, TYPE_END
+from plugins.steam_lang_codes import STEAM_LANGUAGE_CODES
+
+
+# English first (every achievement has it), then Steam's other languages
+LANGUAGES: List[str] = ['english'] + sorted(code for code in STEAM_LANGUAGE_CODES if code != 'english')
+
+# Achievement-type stat, the one holding the "bits" section
+STAT_TYPE_ACHIEVEMENTS = 4
+
+
+def _string(key: str, value: str) -> bytes:
+    return bytes([TYPE_STRING]) + key.encode('utf-8') + b'\x00' + value.encode('utf-8') + b'\x00'
+
+
+def _int32(key: str, value: int) -> bytes:
+    return bytes([TYPE_INT32]) + key.encode('utf-8') + b'\x00' + struct.pack('<i', value)
+
+
+def _section(key: str, body: bytes) -> bytes:
+    return bytes([TYPE_SECTION]) + key.encode('utf-8') + b'\x00' + body + bytes([TYPE_END])
+
+
+def generate_schema(achievements: int = 100,
+                    languages: int = 10,
+                    icons: bool = True,
+                    opis_duplicates: bool = False,
+                    missing_ratio: float = 0.2,
+                    appid: int = 480,
+                    seed: int = 1) -> bytes:
+    """Build a schema with the given number of achievements and languages
+
+    Args:
+        achievements: Number of achievements in the "bits" section
+        languages: How many of LANGUAGES to use (english is always first)
+        icons: Add icon / icon_gray strings to every achievement
+        opis_duplicates: Give every third achievement a second english
+            description string, which the parser turns into a "_opis" row
+        missing_ratio: Chance that a non-english translation is left out
+        appid: Game ID used as the root section name
+        seed: Seed for the missing translations; same arguments, same bytes
+
+    Returns:
+        Schema bytes as Steam writes them to UserGameStatsSchema_<appid>.bin
+    """
+    if not 1 <= languages <= len(LANGUAGES):
+        raise ValueError(f"languages must be between 1 and {len(LANGUAGES)}")
+    rng = random.Random(seed)
+    used_languages = LANGUAGES[:languages]
+
+    bits = []
+    for index in range(achievements):
+        names = []
+        descriptions = []
+        for language in used_languages:
+            if language != 'english' and rng.random() < missing_ratio:
+                continue
+            names.append(_string(language, f"{language} achievement {index} – ünïcødé"))
+            descriptions.append(_string(language, f"{language} description of achievement {index} ✓"))
+            if opis_duplicates and language == 'english' and index % 3 == 0:
+                descriptions.append(_string('english', f"second description of achievement {index}"))
+        names.append(_string('token', f"#NEW_ACHIEVEMENT_{index}_NAME"))
+        descriptions.append(_string('token', f"#NEW_ACHIEVEMENT_{index}_DESC"))
+
+        display = _section('name', b''.join(names)) + _section('desc', b''.join(descriptions))
+        display += _int32('hidden', index % 2)
+        if icons:
+            display += _string('icon', f"{index:040x}.jpg")
+            display += _string('icon_gray', f"{index:040x}_gray.jpg")
+
+        body = _string('name', f"ACH_{index}") + _section('display', display) + _int32('bit', index % 32)
+        bits.append(_section(str(index), body))
+
+    achievement_stat = (
+        _int32('type', STAT_TYPE_ACHIEVEMENTS)
+        + _string('id', '1')
+        + _section('bits', b''.join(bits))
+    )
+    plain_stat = _int32('type', 1) + _string('name', 'STAT_PLAYED') + _string('displayName', 'Played')
+    stats = _section('stats', _section('1', achievement_stat) + _section('2', plain_stat))
+    return _section(str(appid), _string('gamename', 'Benchmark Game') + _int32('version', 1) + stats)
+
+
+def write_schema(path: str, **kwargs) -> int:
+    """Write generate_schema(**kwargs) to path; returns the size in bytes"""
+    data = generate_schema(**kwargs)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+def main(argv: Optional[List[str]] = None):
+    p = argparse.ArgumentParser(description="Write a synthetic UserGameStatsSchema_<appid>.bin file.")
+    p.add_argument("output", help="Path of the .bin file to write")
+    p.add_argument("-n", "--achievements", type=int, default=100)
+    p.add_argument("-m", "--languages", type=int, default=10, help=f"1-{len(LANGUAGES)}")
+    p.add_argument("--no-icons", action="store_true", help="Leave out icon / icon_gray")
+    p.add_argument("--opis", action="store_true", help="Add duplicate english descriptions (_opis rows)")
+    p.add_argument("--missing", type=float, default=0.2, help="Share of translations left out")
+    p.add_argument("--appid", type=int, default=480)
+    p.add_argument("--seed", type=int, default=1)
+    args = p.parse_args(argv)
+
+    size = write_schema(
+        args.output,
+        achievements=args.achievements,
+        languages=args.languages,
+        icons=not args.no_icons,
+        opis_duplicates=args.opis,
+        missing_ratio=args.missing,
+        appid=args.appid,
+        seed=args.seed
+    )
+    print(f"Wrote {args.output} ({size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
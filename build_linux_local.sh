@@ -36,6 +36,7 @@ python3.12 -m nuitka SteamAchievementLocalizer.py --standalone \
     --include-package=requests \
     --include-package=urllib3 \
     --include-module=plugins.http_client \
+    --include-package=plugins \
     --assume-yes-for-downloads \
     --show-progress
 
@@ -1,45 +1,67 @@
-from .highlight_delegate import HighlightDelegate
-from .find_replace_dialog import FindReplacePanel
-from .user_game_stats_list_dialog import UserGameStatsListDialog
-from .context_lang_dialog import ContextLangDialog
-from .theme_manager import ThemeManager
-from .binary_parser import BinaryParser
-from .steam_integration import SteamIntegration
-from .csv_handler import CSVHandler
-from .file_manager import FileManager
-from .ui_builder import UIBuilder
-from .help_dialog import HelpDialog
-from .context_menu import ContextMenuManager
-from .drag_drop_overlay import DragDropPlugin
-from .game_name_fetch_worker import GameNameFetchWorker
-from .steam_lang_codes import (
-    get_available_languages_for_selection,
-    get_display_name,
-    get_code_from_display_name
-)
-from .auto_updater import AutoUpdater
-from .icon_loader import IconLoader
-from .http_client import HTTPClient
+"""
+Plugins package for Steam Achievement Localizer
 
-__all__ = [
-    'HighlightDelegate',
-    'FindReplacePanel',
-    'UserGameStatsListDialog',
-    'ContextLangDialog',
-    'ThemeManager',
-    'BinaryParser',
-    'SteamIntegration',
-    'CSVHandler',
-    'FileManager',
-    'UIBuilder',
-    'HelpDialog',
-    'ContextMenuManager',
-    'DragDropPlugin',
-    'GameNameFetchWorker',
-    'get_available_languages_for_selection',
-    'get_display_name',
-    'get_code_from_display_name',
-    'AutoUpdater',
-    'IconLoader',
-    'HTTPClient'
-]
+Exports are imported on first access (PEP 562), so Qt-free modules such as
+the batch localizer can be used without PyQt6 installed.
+"""
+import importlib
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    'HighlightDelegate': '.highlight_delegate',
+    'FindReplacePanel': '.find_replace_dialog',
+    'UserGameStatsListDialog': '.user_game_stats_list_dialog',
+    'ContextLangDialog': '.context_lang_dialog',
+    'ThemeManager': '.theme_manager',
+    'BinaryParser': '.binary_parser',
+    'SteamIntegration': '.steam_integration',
+    'CSVHandler': '.csv_handler',
+    'FileManager': '.file_manager',
+    'UIBuilder': '.ui_builder',
+    'HelpDialog': '.help_dialog',
+    'ContextMenuManager': '.context_menu',
+    'DragDropPlugin': '.drag_drop_overlay',
+    'GameNameFetchWorker': '.game_name_fetch_worker',
+    'get_available_languages_for_selection': '.steam_lang_codes',
+    'get_display_name': '.steam_lang_codes',
+    'get_code_from_display_name': '.steam_lang_codes',
+    'AutoUpdater': '.auto_updater',
+    'IconLoader': '.icon_loader',
+    'HTTPClient': '.http_client',
+    'AchievementTableModel': '.achievement_table_model',
+    'IconDelegate': '.icon_delegate',
+    'SchemaIndex': '.schema_index',
+    'SchemaScanner': '.schema_scanner',
+    'ParseCache': '.parse_cache',
+    'SearchIndex': '.search_index',
+    'RowHeightManager': '.row_height_manager',
+    'RowStore': '.row_store',
+    'GameNameStore': '.game_name_store',
+    'GameNameResolver': '.game_name_resolver',
+    'fetch_app_name': '.game_name_resolver',
+    'TokenBucket': '.rate_limiter',
+    'HTTPCache': '.http_cache',
+    'PerfTracer': '.perf_trace',
+    'perf_tracer': '.perf_trace',
+    'traced': '.perf_trace',
+    'SerializedCache': '.serialized_cache',
+    'SchemaFileWatcher': '.schema_file_watcher',
+    'diff_rows': '.schema_file_watcher',
+    'pending_edits': '.schema_file_watcher',
+    'BatchLocalizer': '.batch_localizer',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,136 @@
+"""
+Achievement Table Model Plugin for Steam Achievement Localizer
+Serves parsed data_rows to the main table view without per-cell items
+"""
+from typing import Iterable, List, Dict, Optional, Tuple
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QColor
+
+
+# Raw icon hash of an icon cell, painted by IconDelegate
+ICON_HASH_ROLE = Qt.ItemDataRole.UserRole
+
+
+class AchievementTableModel(QAbstractTableModel):
+    """Table model reading and writing the main window's data_rows in place"""
+
+    # (row, column, header, old_value, new_value) for every accepted edit
+    cell_edited = pyqtSignal(int, int, str, str, str)
+
+    READ_ONLY_COLUMNS = {'key', 'icon'}
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows: List[Dict[str, str]] = []
+        self.headers: List[str] = []
+        self.header_labels: List[str] = []
+        self.row_colors: Tuple[QColor, QColor] = (QColor(), QColor())
+
+    def set_data_rows(self,
+                      rows: List[Dict[str, str]],
+                      headers: List[str],
+                      header_labels: Optional[List[str]] = None):
+        """Point the model at new rows/headers (the lists are shared, not copied)"""
+        self.beginResetModel()
+        self.rows = rows
+        self.headers = headers
+        self.header_labels = header_labels if header_labels is not None else list(headers)
+        self.endResetModel()
+
+    def refresh(self):
+        """Notify views that row values were changed outside of setData()"""
+        if self.rows and self.headers:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self.rows) - 1, len(self.headers) - 1)
+            )
+
+    def refresh_rows(self, rows: Iterable[int]):
+        """Like refresh(), limited to some rows (one signal per consecutive run)"""
+        if not self.headers:
+            return
+        last_column = len(self.headers) - 1
+        ordered = sorted(set(rows))
+        start = 0
+        for i in range(1, len(ordered) + 1):
+            if i == len(ordered) or ordered[i] != ordered[i - 1] + 1:
+                self.dataChanged.emit(self.index(ordered[start], 0), self.index(ordered[i - 1], last_column))
+                start = i
+
+    def set_row_colors(self, color_1: QColor, color_2: QColor):
+        """Set zebra colors; rows are striped in key/_opis pairs"""
+        self.row_colors = (color_1, color_2)
+        if self.rows and self.headers:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self.rows) - 1, len(self.headers) - 1),
+                [Qt.ItemDataRole.BackgroundRole]
+            )
+
+    def row_color(self, row: int) -> QColor:
+        """Background color of a row pair"""
+        return self.row_colors[(row // 2) % 2]
+
+    def cell_text(self, row: int, column: int) -> str:
+        """Displayed text of a cell (icon cells are painted, they show no text)"""
+        header = self.headers[column]
+        if header == 'icon':
+            return ''
+        return self.rows[row].get(header, '')
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.EditRole:
+            return self.cell_text(index.row(), index.column())
+
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self.row_color(index.row())
+
+        if role == ICON_HASH_ROLE and self.headers[index.column()] == 'icon':
+            return self.rows[index.row()].get('icon', '')
+
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+
+        header = self.headers[index.column()]
+        if header in self.READ_ONLY_COLUMNS:
+            return False
+
+        new_value = '' if value is None else str(value)
+        row = self.rows[index.row()]
+        old_value = row.get(header, '')
+        if new_value == old_value:
+            return True
+
+        row[header] = new_value
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
+        self.cell_edited.emit(index.row(), index.column(), header, old_value, new_value)
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+
+        flags = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+        if self.headers[index.column()] not in self.READ_ONLY_COLUMNS:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (role == Qt.ItemDataRole.DisplayRole
+                and orientation == Qt.Orientation.Horizontal
+                and 0 <= section < len(self.header_labels)):
+            return self.header_labels[section]
+        return super().headerData(section, orientation, role)
@@ -128,7 +128,10 @@ class UpdateChecker(QThread):
                 'Accept': 'application/vnd.github.v3+json'
             }
             
-            response = HTTPClient.get(GITHUB_API_URL, headers=headers, timeout=(5, 10))
+            # A manual check must not miss a release made in the last minutes; the
+            # cached copy is still revalidated (a 304 does not count against the API limit)
+            response = HTTPClient.get(GITHUB_API_URL, headers=headers, timeout=(5, 10),
+                                      revalidate=self.force_check)
             response.raise_for_status()
             data = response.json()
 
@@ -0,0 +1,265 @@
+"""
+Batch Localizer Plugin for Steam Achievement Localizer
+Applies translation CSVs to many UserGameStatsSchema_*.bin files without the GUI
+
+Usage:
+    python -m plugins.batch_localizer --steam-path STEAM_DIR --language ukrainian CSV_OR_DIR [...]
+
+A CSV belongs to the game whose ID is the last header cell (as written by
+"Export for translation") or, failing that, the last number in its file
+name. Prints a JSON summary; the exit code is 1 if any game failed.
+This module must stay importable without PyQt6.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .binary_parser import BinaryParser
+from .csv_handler import CSVHandler
+from .file_manager import FileManager
+
+
+STATS_SUBDIR = os.path.join("appcache", "stats")
+
+# Result statuses that count as failures in the summary/exit code
+FAILED_STATUSES = {'missing_schema', 'import_failed', 'error'}
+
+
+def localize_game(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Import a game's CSVs into its schema and write the patched file
+
+    Runs inside pool processes, so it only takes and returns plain data.
+    """
+    game_id = job['game_id']
+    schema_path = job['schema_path']
+    language = job['language']
+    result = {
+        'game_id': game_id,
+        'schema': schema_path,
+        'csv': job['csv_paths'],
+        'status': 'ok',
+        'imported': 0,
+        'changed': 0,
+        'skipped': 0,
+        'reasons': [],
+        'written': False,
+        'backup': None,
+        'error': None
+    }
+
+    if not os.path.isfile(schema_path):
+        result['status'] = 'missing_schema'
+        return result
+
+    try:
+        parser = BinaryParser()
+        file_manager = FileManager(parser)
+        csv_handler = CSVHandler()
+
+        data = file_manager.load_binary_file(schema_path)
+        rows, _ = parser.parse_binary_data(data)
+        if not rows:
+            result['status'] = 'no_achievements'
+            return result
+
+        # Same as dropping a CSV in the GUI: a missing target language gets an empty column
+        rows.ensure_columns([language])
+
+        for csv_path in job['csv_paths']:
+            success, imported, changed, skipped, reason = csv_handler.import_translations(
+                csv_path, rows, language
+            )
+            if not success:
+                result['status'] = 'import_failed'
+                result['reasons'].append(reason)
+                return result
+            result['imported'] += imported
+            result['changed'] += changed
+            result['skipped'] += skipped
+            if reason:
+                result['reasons'].append(reason)
+
+        if result['changed'] == 0:
+            result['status'] = 'unchanged'
+            return result
+
+        new_data = file_manager.replace_language_in_binary(data, rows)
+        if new_data == data:
+            result['status'] = 'unchanged'
+            return result
+
+        if not job['dry_run']:
+            if job['backup']:
+                result['backup'] = file_manager.backup_file(schema_path)
+            file_manager.save_binary_file_atomic(new_data, schema_path)
+            result['written'] = True
+
+    except Exception as e:
+        result['status'] = 'error'
+        result['error'] = str(e)
+
+    return result
+
+
+class BatchLocalizer:
+    """Matches CSVs to games and localizes them on a process pool"""
+
+    def __init__(self,
+                 steam_path: str,
+                 language: str,
+                 max_workers: Optional[int] = None,
+                 dry_run: bool = False,
+                 backup: bool = False):
+        self.stats_dir = os.path.join(steam_path, STATS_SUBDIR)
+        self.language = language
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.dry_run = dry_run
+        self.backup = backup
+        self.csv_handler = CSVHandler()
+
+    @staticmethod
+    def expand_csv_sources(sources: Iterable[str]) -> List[str]:
+        """CSV files given directly plus every *.csv in given directories"""
+        csv_paths = []
+        for source in sources:
+            if os.path.isdir(source):
+                csv_paths.extend(
+                    os.path.join(source, name) for name in sorted(os.listdir(source))
+                    if name.lower().endswith('.csv')
+                )
+            else:
+                csv_paths.append(source)
+        return csv_paths
+
+    def game_id_for_csv(self, csv_path: str) -> Optional[str]:
+        """Game ID from the CSV header (last cell) or from the file name"""
+        preview = self.csv_handler.get_column_preview(csv_path, max_rows=0, count_rows=False)
+        if preview.get('valid') and preview.get('header'):
+            potential_id = preview['header'][-1].strip()
+            if potential_id.isdigit():
+                return potential_id
+
+        numbers = re.findall(r'\d+', os.path.splitext(os.path.basename(csv_path))[0])
+        return numbers[-1] if numbers else None
+
+    def collect_jobs(self, csv_paths: List[str]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Group CSVs by game; returns (jobs, CSVs without a game ID)"""
+        by_game: Dict[str, List[str]] = {}
+        unmatched = []
+        for csv_path in csv_paths:
+            game_id = self.game_id_for_csv(csv_path)
+            if game_id is None:
+                unmatched.append(csv_path)
+            else:
+                by_game.setdefault(game_id, []).append(csv_path)
+
+        jobs = [
+            {
+                'game_id': game_id,
+                'schema_path': os.path.join(self.stats_dir, f"UserGameStatsSchema_{game_id}.bin"),
+                'csv_paths': paths,
+                'language': self.language,
+                'dry_run': self.dry_run,
+                'backup': self.backup
+            }
+            for game_id, paths in sorted(by_game.items(), key=lambda item: int(item[0]))
+        ]
+        return jobs, unmatched
+
+    def _run_jobs(self, jobs, on_result):
+        if len(jobs) < 2 or self.max_workers == 1:
+            for job in jobs:
+                on_result(localize_game(job))
+            return
+
+        try:
+            # Spawn like SchemaScanner, so workers never inherit another thread's locks
+            executor = ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(jobs)),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        except (OSError, NotImplementedError):
+            for job in jobs:
+                on_result(localize_game(job))
+            return
+
+        with executor:
+            futures = [executor.submit(localize_game, job) for job in jobs]
+            for future in as_completed(futures):
+                on_result(future.result())
+
+    def run(self,
+            sources: Iterable[str],
+            progress: Optional[Callable[[int, int, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """Localize every game that has a CSV in sources and return the summary"""
+        started = time.perf_counter()
+        jobs, unmatched = self.collect_jobs(self.expand_csv_sources(sources))
+
+        results = []
+
+        def on_result(result):
+            results.append(result)
+            if progress:
+                progress(len(results), len(jobs), result)
+
+        self._run_jobs(jobs, on_result)
+        results.sort(key=lambda result: int(result['game_id']))
+
+        totals: Dict[str, int] = {}
+        for result in results:
+            totals[result['status']] = totals.get(result['status'], 0) + 1
+
+        return {
+            'language': self.language,
+            'stats_dir': self.stats_dir,
+            'dry_run': self.dry_run,
+            'games': results,
+            'unmatched_csv': unmatched,
+            'totals': totals,
+            'written': sum(1 for result in results if result['written']),
+            'failed': sum(1 for result in results if result['status'] in FAILED_STATUSES),
+            'elapsed_seconds': round(time.perf_counter() - started, 3)
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m plugins.batch_localizer",
+        description="Apply translation CSVs to Steam achievement schema files without the GUI."
+    )
+    arg_parser.add_argument("sources", nargs="+", help="CSV files and/or directories with CSV files")
+    arg_parser.add_argument("--steam-path", required=True, help="Steam installation folder")
+    arg_parser.add_argument("--language", required=True, help="Target language code, e.g. ukrainian")
+    arg_parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    arg_parser.add_argument("--dry-run", action="store_true", help="Parse and patch, but do not write files")
+    arg_parser.add_argument("--backup", action="store_true", help="Copy each schema file before overwriting it")
+    arg_parser.add_argument("--summary", help="Write the JSON summary to this file instead of stdout")
+    args = arg_parser.parse_args(argv)
+
+    def report(done, total, result):
+        print(f"[{done}/{total}] {result['game_id']}: {result['status']}", file=sys.stderr)
+
+    localizer = BatchLocalizer(
+        args.steam_path, args.language,
+        max_workers=args.workers, dry_run=args.dry_run, backup=args.backup
+    )
+    summary = localizer.run(args.sources, progress=report)
+
+    output = json.dumps(summary, ensure_ascii=False, indent=2)
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,16 @@ Handles parsing and manipulation of Steam binary files
 import re
 from typing import List, Dict, Optional, Tuple, Union
 
+from .keyvalues import iter_nodes, KeyValuesError, TYPE_SECTION, TYPE_STRING, TYPE_END
+from .parse_cache import ParseCache
+from .perf_trace import traced
+from .row_store import MISSING, RowStore
+
+
+# String nodes of an achievement's display name/desc section (one per language)
+_LANGUAGE_SECTION = re.compile(b'\x00(?:name|desc)\x00((?:\x01[^\x00]*\x00[^\x00]*\x00)+)[\x08\x0b]')
+_STRING_KEY = re.compile(b'\x01([^\x00]*)\x00[^\x00]*\x00')
+
 
 class BinaryParser:
     """Handles parsing of Steam binary achievement files"""
@@ -16,22 +26,43 @@ class BinaryParser:
         b'operation', b'type', b'version', b'schinese', b'tchinese'
     }
     
-    def __init__(self):
-        self.chunks: List[bytes] = []
+    # version and gamename are written at the top of the root section
+    HEADER_SIZE = 4096
+    
+    def __init__(self, parse_cache: Optional[ParseCache] = None):
+        # Optional LRU of earlier parse results; parse_binary_data() skips
+        # parsing entirely for buffers it has seen before
+        self.parse_cache = parse_cache
+        # (start, end) of every achievement chunk in raw_data; slice or
+        # memoryview raw_data to read one, chunks are never copied out
+        self.chunk_spans: List[Tuple[int, int]] = []
         self.raw_data: bytes = b""
+        # Entries of the last tokenized buffer, reused by build_offset_index()
+        self.entries: Optional[List[Tuple[int, int, str, List[tuple]]]] = None
     
-    def split_chunks(self, data: bytes) -> List[bytes]:
-        """Split binary data into chunks based on Steam format patterns"""
+    def _chunk_starts(self, data: bytes) -> List[int]:
+        """Offsets where chunks start, in file order"""
         # Determine pattern based on content
         # If file has 'bits' section but uses numeric keys instead of 'bit' separator
         # OR if it starts directly with a numeric key (snippet case)
-        if (b'\x00bits\x00' in data and b'\x02bit\x00' not in data) or re.match(b'^[0-9]+\x00', data):
+        # (find() rather than "in" so mmap buffers work as well)
+        if (data.find(b'\x00bits\x00') != -1 and data.find(b'\x02bit\x00') == -1) or re.match(b'^[0-9]+\x00', data):
              pattern = re.compile(b'(?:^|\x00)[0-9]+\x00')
-        else:
-             # Standard format
-             pattern = re.compile(b'\x00bits\x00|\x02bit\x00')
-             
-        positions = [m.start() for m in pattern.finditer(data)]
+             return [m.start() for m in pattern.finditer(data)]
+
+        # Standard format: two literal markers, bytes.find outruns a regex alternation
+        positions = []
+        for marker in (b'\x00bits\x00', b'\x02bit\x00'):
+            pos = data.find(marker)
+            while pos != -1:
+                positions.append(pos)
+                pos = data.find(marker, pos + len(marker))
+        positions.sort()
+        return positions
+
+    def split_chunks(self, data: bytes) -> List[bytes]:
+        """Split binary data into chunks based on Steam format patterns"""
+        positions = self._chunk_starts(data)
         
         chunks = []
         for i in range(len(positions)):
@@ -95,61 +126,137 @@ class BinaryParser:
         
         return values
     
-    def parse_binary_data(self, data: bytes) -> Tuple[List[Dict[str, str]], List[str]]:
-        """Parse binary data and return rows and headers"""
-        self.raw_data = data
-        chunks = self.split_chunks(data)
-        self.chunks = chunks
-        
-        all_rows = []
-        all_columns = set()
-        
-        for chunk in chunks:
+    def extract_entries(self, data: bytes) -> List[Tuple[int, int, str, List[tuple]]]:
+        """Walk the KeyValues token stream once and collect achievement entries
+
+        An entry is the innermost section that directly holds a ``name`` string
+        and has an ``english`` string somewhere below it.
+
+        Returns:
+            List of (start, end, key, string_nodes) in file order. String nodes
+            are laid out like KVToken, so node[1] is the word and node[2] the
+            raw value; excluded words are already filtered out.
+        """
+        strings: List[tuple] = []
+        add_string = strings.append
+        # Frame: [offset, first string index, name, has_english, has_entry_below]
+        stack: List[list] = []
+        entries = []
+        excluded = self.EXCLUDE_WORDS
+
+        for node in iter_nodes(data):
+            node_type, key, value, offset, _, value_end, _ = node
+            if node_type == TYPE_STRING:
+                add_string(node)
+                if stack:
+                    frame = stack[-1]
+                    if key == b'name':
+                        if frame[2] is None:
+                            frame[2] = value
+                    elif key == b'english':
+                        frame[3] = True
+            elif node_type == TYPE_SECTION:
+                stack.append([offset, len(strings), None, False, False])
+            elif node_type == TYPE_END:
+                frame = stack.pop()
+                is_entry = frame[2] is not None and frame[3] and not frame[4]
+                if is_entry:
+                    nodes = [item for item in strings[frame[1]:] if item[1] not in excluded]
+                    entries.append((frame[0], value_end, frame[2].decode(errors='ignore'), nodes))
+                if stack:
+                    parent = stack[-1]
+                    parent[3] = parent[3] or frame[3]
+                    parent[4] = parent[4] or frame[4] or is_entry
+
+        return entries
+
+    def _extract_entries_from_chunks(self, data: bytes) -> List[Tuple[int, int, str, List[tuple]]]:
+        """Fallback for buffers the tokenizer cannot walk (regex chunking)
+
+        Offsets are unknown on this path, nodes carry -1 instead.
+        """
+        entries = []
+        position = 0
+        for chunk in self.split_chunks(data):
+            start = data.find(chunk, position)
+            position = start + len(chunk)
             key = self.extract_key_and_data(chunk)
             if not key:
                 continue
-                
             words = self.extract_words(chunk)
             values = self.extract_values(chunk, words)
-            
+            nodes = [(TYPE_STRING, word.encode(), value.encode(), -1, -1, -1, -1)
+                     for word, value in zip(words, values)]
+            entries.append((start, position, key, nodes))
+        return entries
+
+    @traced("parse_binary_data")
+    def parse_binary_data(self, data: bytes) -> Tuple[RowStore, List[str]]:
+        """Parse binary data and return rows (a columnar RowStore) and headers"""
+        self.raw_data = data
+        cache_key = None
+        if self.parse_cache is not None:
+            cache_key = self.parse_cache.key_for(data)
+            cached = self.parse_cache.get(cache_key)
+            if cached is not None:
+                all_rows, headers, self.entries, self.chunk_spans = cached
+                return all_rows, headers
+        
+        try:
+            entries = self.extract_entries(data)
+            self.entries = entries
+        except KeyValuesError:
+            entries = self._extract_entries_from_chunks(data)
+            self.entries = None
+        self.chunk_spans = [(start, end) for start, end, _, _ in entries]
+        
+        keys: List[str] = []
+        # One list per field; every entry yields at most two rows (key and _opis)
+        capacity = 2 * len(entries)
+        columns: Dict[str, List[Optional[str]]] = {}
+        # Field names repeat for every achievement, decode each one only once
+        word_names: Dict[bytes, str] = {}
+        
+        for _, _, key, nodes in entries:
             word_counts = {}
-            unique_row = {'key': key}
-            description_row = {'key': f'{key}_opis'}
+            row_index = len(keys)
+            keys.append(key)
+            description = {}
             
-            for word, val in zip(words, values):
+            for _, word, val, _, _, _, _ in nodes:
+                name = word_names.get(word)
+                if name is None:
+                    name = word_names[word] = word.decode('utf-8', 'ignore')
+                word = name
+                val = val.decode('utf-8', 'ignore')
                 count = word_counts.get(word, 0)
                 if count == 0:
-                    unique_row[word] = val
+                    column = columns.get(word)
+                    if column is None:
+                        column = columns[word] = [MISSING] * capacity
+                    column[row_index] = val
                 else:
-                    if word in description_row:
-                        description_row[word] += '; ' + val
+                    if word in description:
+                        description[word] += '; ' + val
                     else:
-                        description_row[word] = val
+                        description[word] = val
                 word_counts[word] = count + 1
             
-            all_rows.append(unique_row)
-            if len(description_row) > 1:
-                all_rows.append(description_row)
-            
-            for row in [unique_row, description_row]:
-                for col in row.keys():
-                    if col != 'key':
-                        all_columns.add(col)
+            if description:
+                row_index = len(keys)
+                keys.append(f'{key}_opis')
+                for word, val in description.items():
+                    columns[word][row_index] = val
         
+        all_rows = RowStore.from_columns(keys, columns)
         # Ensure english column exists (always needed as base language)
-        for row in all_rows:
-            if 'english' not in row:
-                row['english'] = ''
+        all_rows.ensure_columns(['english'])
         
         # Define headers - icon first (if exists), then key, then other columns sorted
-        all_columns = set()
-        for row in all_rows:
-            for col in row:
-                if col not in ['key', 'icon']:
-                    all_columns.add(col)
+        all_columns = [col for col in all_rows.column_names() if col not in ['key', 'icon']]
         
         # Check if any row has icon data
-        has_icons = any('icon' in row for row in all_rows)
+        has_icons = any(value is not MISSING for value in all_rows.column('icon'))
         
         # Build headers: icon (if exists) -> key -> sorted other columns
         if has_icons:
@@ -157,13 +264,75 @@ class BinaryParser:
         else:
             headers = ['key'] + sorted(all_columns)
         
+        if cache_key is not None:
+            self.parse_cache.put(cache_key, all_rows, headers, self.entries, self.chunk_spans)
+        
         return all_rows, headers
-    
+
+    def build_offset_index(self, data: bytes) -> List[Dict[str, object]]:
+        """Map every table cell back to the string nodes it was read from
+
+        Rows come out in the same order and with the same keys as
+        parse_binary_data(). Each entry is a dict with:
+            key: Row key ('{key}_opis' for description rows)
+            fields: {word: [node, ...]} - string nodes (laid out like KVToken)
+                joined into the cell value
+            anchor: Offset where new language strings for this row go
+                (in front of the row's english string, like Steam writes them)
+
+        Raises:
+            KeyValuesError: If the buffer cannot be tokenized; offsets are
+                unknown in that case and the caller has to fall back
+        """
+        if self.entries is not None and self._is_raw_data(data):
+            entries = self.entries
+        else:
+            entries = self.extract_entries(data)
+
+        index = []
+        word_names: Dict[bytes, str] = {}
+
+        for _, _, key, nodes in entries:
+            unique_fields: Dict[str, List[tuple]] = {}
+            description_fields: Dict[str, List[tuple]] = {}
+
+            for node in nodes:
+                name = word_names.get(node[1])
+                if name is None:
+                    name = word_names[node[1]] = node[1].decode('utf-8', 'ignore')
+                if name in unique_fields:
+                    description_fields.setdefault(name, []).append(node)
+                else:
+                    unique_fields[name] = [node]
+
+            for row_key, fields in ((key, unique_fields), (f'{key}_opis', description_fields)):
+                if not fields:
+                    continue
+                english = fields.get('english')
+                # Dicts keep insertion order, so the first field holds the row's first node
+                anchor = english[0][3] if english else next(iter(fields.values()))[0][3]
+                index.append({'key': row_key, 'fields': fields, 'anchor': anchor})
+
+        return index
+
+    def _is_raw_data(self, data) -> bool:
+        """True if data holds the same bytes as the last parsed buffer"""
+        if data is self.raw_data:
+            return True
+        if len(data) != len(self.raw_data):
+            return False
+        # Compare through a view so mapped files are not copied
+        with memoryview(data) as view:
+            return view == self.raw_data
+
     def extract_metadata(self, data: bytes, marker: str) -> Optional[str]:
         """Extract metadata (version, gamename) from binary data"""
         try:
             marker_bytes = f"\x01{marker}\x00".encode()
-            pos = data.find(marker_bytes)
+            # Look in the header first, most files never need the full scan
+            pos = data.find(marker_bytes, 0, self.HEADER_SIZE)
+            if pos == -1 and len(data) > self.HEADER_SIZE:
+                pos = data.find(marker_bytes)
             
             if pos == -1:
                 return None
@@ -195,7 +364,42 @@ class BinaryParser:
         """Extract game name from binary data"""
         return self.extract_metadata(data, "gamename")
 
+    def read_header(self, file_path: str) -> Dict[str, Optional[str]]:
+        """Read version and gamename from the first HEADER_SIZE bytes of a file"""
+        with open(file_path, "rb") as f:
+            header = f.read(self.HEADER_SIZE)
+        version = self.extract_metadata(header, "version")
+        return {'version': version, 'gamename': self.extract_metadata(header, "gamename")}
+
+    def get_languages(self, data: bytes) -> List[str]:
+        """Languages with at least one achievement name or description string"""
+        keys = set(_STRING_KEY.findall(b''.join(_LANGUAGE_SECTION.findall(data))))
+        keys.discard(b'token')
+        return sorted(key.decode('utf-8', 'ignore') for key in keys)
+
+    def get_schema_metadata(self, data: bytes) -> Dict[str, object]:
+        """Collect the metadata shown in the stats file list"""
+        version = self.get_version(data)
+        return {
+            'version': str(version) if version is not None else None,
+            'gamename': self.get_gamename(data),
+            'achievement_count': self.get_achievement_count(data),
+            'languages': self.get_languages(data)
+        }
+
     def get_achievement_count(self, data: bytes) -> int:
-        """Count achievements in binary data"""
-        chunks = self.split_chunks(data)
-        return sum(1 for chunk in chunks if b'\x01english\x00' in chunk and chunk.count(b'\x01english\x00') >= 2)
\ No newline at end of file
+        """Count achievements in binary data
+
+        A chunk counts if it holds at least two english strings (name and
+        description). Chunks are only located, never sliced out of data.
+        """
+        english = b'\x01english\x00'
+        positions = self._chunk_starts(data)
+        ends = positions[1:] + [len(data)]
+        return sum(1 for start, end in zip(positions, ends) if self._has_two(data, english, start, end))
+
+    @staticmethod
+    def _has_two(data: bytes, needle: bytes, start: int, end: int) -> bool:
+        """True if needle occurs at least twice in data[start:end]"""
+        first = data.find(needle, start, end)
+        return first != -1 and data.find(needle, first + 1, end) != -1
\ No newline at end of file
@@ -1,12 +1,12 @@
 """
 Custom Context Menu Plugin
-Provides unified context menu with icons for QLineEdit and QTableWidget widgets.
+Provides unified context menu with icons for QLineEdit and QTableView widgets.
 """
 
 from functools import partial
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QIcon, QAction
-from PyQt6.QtWidgets import QMenu, QStyle, QApplication, QLineEdit, QTableWidget
+from PyQt6.QtWidgets import QMenu, QStyle, QApplication, QLineEdit, QTableView
 
 
 class ContextMenuManager:
@@ -49,12 +49,12 @@ class ContextMenuManager:
             partial(self._show_lineedit_menu, line_edit)
         )
     
-    def setup_table(self, table: QTableWidget, extra_actions=None):
+    def setup_table(self, table: QTableView, extra_actions=None):
         """
-        Setup custom context menu for a QTableWidget widget.
+        Setup custom context menu for a QTableView widget.
         
         Args:
-            table: QTableWidget widget to setup
+            table: QTableView widget to setup
             extra_actions: List of additional QAction objects to add at the end
         """
         self._table = table
@@ -147,7 +147,7 @@ class ContextMenuManager:
         menu.exec(line_edit.mapToGlobal(pos))
     
     def _show_table_menu(self, pos):
-        """Show context menu for QTableWidget"""
+        """Show context menu for QTableView"""
         menu = QMenu(self.parent)
         
         # Undo
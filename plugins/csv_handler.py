@@ -2,8 +2,11 @@
 CSV Handler Plugin for Steam Achievement Localizer
 Handles CSV export and import functionality
 """
+import codecs
 import csv
-from typing import List, Dict, Optional, Tuple, Any
+import io
+import os
+from typing import Callable, Iterator, List, Dict, Optional, Tuple, Any
 from pathlib import Path
 
 
@@ -57,140 +60,200 @@ class CSVHandler:
         except Exception as e:
             raise Exception(f"Failed to export translation CSV: {e}")
     
+    def detect_encoding(self, filepath: str, sample_size: int = 65536) -> str:
+        """Guess the file encoding once from a byte sample
+
+        BOM first, then a strict UTF-8 check of the sample; anything else is
+        treated as a legacy single-byte encoding.
+        """
+        with open(filepath, 'rb') as f:
+            sample = f.read(sample_size)
+            at_eof = not f.read(1)
+
+        if sample.startswith(codecs.BOM_UTF8):
+            return "utf-8-sig"
+        try:
+            sample.decode("utf-8")
+            return "utf-8"
+        except UnicodeDecodeError as e:
+            # A multi-byte character cut off by the end of the sample is fine
+            if not at_eof and e.start >= len(sample) - 3 and e.reason == "unexpected end of data":
+                return "utf-8"
+        try:
+            sample.decode("cp1251")
+            return "cp1251"
+        except UnicodeDecodeError:
+            return "iso-8859-1"
+    
+    def iter_csv_rows(self,
+                      filepath: str,
+                      encoding: str,
+                      progress: Optional[Callable[[int, int], None]] = None,
+                      progress_every: int = 500) -> Iterator[List[str]]:
+        """Yield CSV rows lazily, reporting (bytes_read, total_bytes) every few rows"""
+        total = os.path.getsize(filepath)
+        with open(filepath, 'rb') as raw, io.TextIOWrapper(raw, encoding=encoding) as text:
+            for count, row in enumerate(csv.reader(text), 1):
+                if progress and count % progress_every == 0:
+                    progress(raw.tell(), total)
+                yield row
+            if progress:
+                progress(total, total)
+    
     def import_translations(self, 
                            filepath: str, 
                            data_rows: List[Dict[str, str]], 
-                           import_column: str) -> Tuple[bool, int, int, int, str]:
+                           import_column: str,
+                           progress: Optional[Callable[[int, int], None]] = None) -> Tuple[bool, int, int, int, str]:
         """Import translations from CSV file
         
+        Rows are streamed and applied one by one, so the CSV is never held
+        in memory. If the detected encoding turns out wrong further down the
+        file, the rows applied so far are rolled back and the import is
+        retried with the next fallback encoding.
+        
+        Args:
+            progress: Optional callback receiving (bytes_read, total_bytes)
+        
         Returns:
             Tuple of (success, imported_count, changed_count, skipped_count, reason)
         """
         try:
-            # Try different encodings
-            content = None
-            for encoding in self.supported_encodings:
-                try:
-                    with open(filepath, 'r', encoding=encoding) as csvfile:
-                        content = list(csv.reader(csvfile))
-                        break
-                except UnicodeDecodeError:
-                    continue
-            
-            if content is None:
-                return False, 0, 0, 0, "cannot_decode_csv"
-            
-            if not content:
-                return False, 0, 0, 0, "error_empty"
-            
-            header = content[0]
-            
-            # Find required columns
-            # Support both old format (ukrainian/russian/etc columns) and new format (translation column)
-            try:
-                key_idx = header.index('key')
-            except ValueError:
-                return False, 0, 0, 0, "error_no_key_column"
-            
-            # Try to find translation column (new format) or import_column directly (old format)
-            translation_idx = None
-            if 'translation' in header:
-                translation_idx = header.index('translation')
-            elif import_column in header:
-                translation_idx = header.index(import_column)
-            else:
-                return False, 0, 0, 0, "error_no_translation_column"
-            
-            # Check if import_column exists in data_rows
-            if data_rows and import_column not in data_rows[0]:
-                return False, 0, 0, 0, "error_no_target_column"
-
             # explicitly prevent importing into icon column
             if import_column == 'icon':
                 return False, 0, 0, 0, "error_cannot_import_icon"
             
+            encoding = self.detect_encoding(filepath)
+            fallbacks = [e for e in self.supported_encodings
+                         if e not in (encoding, "utf-8-sig", "utf-8")]
+            
             # Create mapping for fast lookup
             key_to_row = {row['key']: row for row in data_rows}
-            imported_count = 0
-            changed_count = 0
-            skipped_count = 0
             
-            for csv_row in content[1:]:  # Skip header
-                if len(csv_row) <= max(key_idx, translation_idx):
-                    skipped_count += 1
-                    continue
-                
-                key = csv_row[key_idx].strip()
-                translation = csv_row[translation_idx].strip()
-                
-                if not key:
-                    skipped_count += 1
-                    continue
-                
-                if key not in key_to_row:
-                    skipped_count += 1
-                    continue
-                
-                if not translation:
-                    skipped_count += 1
+            for candidate in [encoding] + fallbacks:
+                # (row, previous value) of every applied change, for rollback
+                applied: List[Tuple[Dict[str, str], str]] = []
+                try:
+                    return self._apply_translation_rows(
+                        self.iter_csv_rows(filepath, candidate, progress),
+                        data_rows, key_to_row, import_column, applied
+                    )
+                except UnicodeDecodeError:
+                    for row, old_value in reversed(applied):
+                        row[import_column] = old_value
                     continue
-                
-                # Check if value actually changed
-                old_value = key_to_row[key].get(import_column, '')
-                if old_value != translation:
-                    key_to_row[key][import_column] = translation
-                    changed_count += 1
-                
-                imported_count += 1
-            
-            reason = ""
-            if changed_count == 0:
-                if imported_count == 0:
-                    reason = "reason_no_valid_translations"
-                else:
-                    reason = "reason_all_identical"
             
-            return True, imported_count, changed_count, skipped_count, reason
+            return False, 0, 0, 0, "cannot_decode_csv"
             
         except Exception as e:
             return False, 0, 0, 0, "import_failed"
     
-    def validate_csv_structure(self, filepath: str) -> Dict[str, Any]:
-        """Validate CSV file structure and return info"""
+    def _apply_translation_rows(self,
+                                rows: Iterator[List[str]],
+                                data_rows: List[Dict[str, str]],
+                                key_to_row: Dict[str, Dict[str, str]],
+                                import_column: str,
+                                applied: List[Tuple[Dict[str, str], str]]) -> Tuple[bool, int, int, int, str]:
+        header = next(rows, None)
+        if header is None:
+            return False, 0, 0, 0, "error_empty"
+        
+        # Find required columns
+        # Support both old format (ukrainian/russian/etc columns) and new format (translation column)
         try:
-            # Try to read with different encodings
-            content = None
-            used_encoding = None
+            key_idx = header.index('key')
+        except ValueError:
+            return False, 0, 0, 0, "error_no_key_column"
+        
+        # Try to find translation column (new format) or import_column directly (old format)
+        translation_idx = None
+        if 'translation' in header:
+            translation_idx = header.index('translation')
+        elif import_column in header:
+            translation_idx = header.index(import_column)
+        else:
+            return False, 0, 0, 0, "error_no_translation_column"
+        
+        # Check if import_column exists in data_rows
+        if data_rows and import_column not in data_rows[0]:
+            return False, 0, 0, 0, "error_no_target_column"
+        
+        imported_count = 0
+        changed_count = 0
+        skipped_count = 0
+        min_length = max(key_idx, translation_idx) + 1
+        
+        for csv_row in rows:
+            if len(csv_row) < min_length:
+                skipped_count += 1
+                continue
+            
+            key = csv_row[key_idx].strip()
+            translation = csv_row[translation_idx].strip()
+            
+            row = key_to_row.get(key) if key else None
+            if row is None or not translation:
+                skipped_count += 1
+                continue
             
-            for encoding in self.supported_encodings:
+            # Check if value actually changed
+            old_value = row.get(import_column, '')
+            if old_value != translation:
+                applied.append((row, old_value))
+                row[import_column] = translation
+                changed_count += 1
+            
+            imported_count += 1
+        
+        reason = ""
+        if changed_count == 0:
+            if imported_count == 0:
+                reason = "reason_no_valid_translations"
+            else:
+                reason = "reason_all_identical"
+        
+        return True, imported_count, changed_count, skipped_count, reason
+    
+    def validate_csv_structure(self, filepath: str, count_rows: bool = True) -> Dict[str, Any]:
+        """Validate CSV file structure and return info
+        
+        Rows are streamed; with count_rows=False only the header is read.
+        """
+        try:
+            encoding = self.detect_encoding(filepath)
+            candidates = [encoding] + [e for e in self.supported_encodings
+                                       if e not in (encoding, "utf-8-sig", "utf-8")]
+            
+            header = None
+            row_count = None
+            used_encoding = None
+            for candidate in candidates:
                 try:
-                    with open(filepath, 'r', encoding=encoding) as csvfile:
-                        content = list(csv.reader(csvfile))
-                        used_encoding = encoding
-                        break
+                    rows = self.iter_csv_rows(filepath, candidate)
+                    header = next(rows, None)
+                    row_count = sum(1 for _ in rows) if count_rows else None
+                    used_encoding = candidate
+                    break
                 except UnicodeDecodeError:
                     continue
             
-            if content is None:
+            if used_encoding is None:
                 return {
                     'valid': False,
                     'error': 'Could not decode file with any supported encoding'
                 }
             
-            if not content:
+            if header is None:
                 return {
                     'valid': False,
                     'error': 'File is empty'
                 }
             
-            header = content[0]
-            row_count = len(content) - 1  # Exclude header
-            
             return {
                 'valid': True,
                 'encoding': used_encoding,
                 'columns': header,
-                'row_count': row_count,
+                'row_count': row_count,  # Excludes header; None if not counted
                 'has_key_column': 'key' in header,
                 'has_translation_column': 'translation' in header,
                 'has_english_column': 'english' in header
@@ -217,10 +280,15 @@ class CSVHandler:
     
     def get_column_preview(self, 
                           filepath: str, 
-                          max_rows: int = 10) -> Dict[str, Any]:
-        """Get a preview of CSV columns and first few rows"""
+                          max_rows: int = 10,
+                          count_rows: bool = True) -> Dict[str, Any]:
+        """Get a preview of CSV columns and first few rows
+        
+        With count_rows=False only the first rows are read and total_rows
+        is None; enough for peeking at the header of a large file.
+        """
         try:
-            validation = self.validate_csv_structure(filepath)
+            validation = self.validate_csv_structure(filepath, count_rows=count_rows)
             if not validation['valid']:
                 return validation
             
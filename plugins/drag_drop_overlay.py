@@ -151,6 +151,18 @@ class DragDropPlugin(QObject):
                         
                         if lower_path.endswith('.bin'):
                              message = translations.get("drag_drop_hint", "Drop .bin file here")
+
+                             # Preview game name/version from the file header only
+                             if hasattr(self.main_window, 'binary_parser'):
+                                 try:
+                                     header = self.main_window.binary_parser.read_header(path)
+                                     if header['gamename']:
+                                         message += f"\n{translations.get('gamename', '')}{header['gamename']}"
+                                     if header['version']:
+                                         message += f"\n{translations.get('file_version', '')}{header['version']}"
+                                 except Exception:
+                                     pass
+
                              self.main_window.activateWindow()
                              self.main_window.raise_()
                              self.overlay.show_overlay(message)
@@ -173,7 +185,7 @@ class DragDropPlugin(QObject):
                              if is_empty and hasattr(self.main_window, 'csv_handler'):
                                  # Peek at CSV to find game_id
                                  try:
-                                     preview = self.main_window.csv_handler.get_column_preview(path, max_rows=1)
+                                     preview = self.main_window.csv_handler.get_column_preview(path, max_rows=1, count_rows=False)
                                      if preview['valid'] and preview['header']:
                                          potential_id = preview['header'][-1].strip()
                                          if potential_id.isdigit():
@@ -5,17 +5,22 @@ Handles file operations, binary data manipulation and file I/O
 import os
 import json
 import re
-from typing import List, Dict, Optional, Union, Any
+import mmap
+import tempfile
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Tuple, Union, Any, Iterator
 from .binary_parser import BinaryParser
+from .keyvalues import KeyValuesError
+from .perf_trace import traced
 
 
 class FileManager:
     """Handles file operations and binary data manipulation"""
     
-    def __init__(self):
-        self.binary_parser = BinaryParser()
+    def __init__(self, binary_parser: Optional[BinaryParser] = None):
+        # Sharing the window's parser lets saves reuse the offsets of the last parse
+        self.binary_parser = binary_parser or BinaryParser()
         self.current_file_path: Optional[str] = None
-        self.raw_data: bytes = b""
     
     def load_binary_file(self, filepath: str) -> bytes:
         """Load binary file and return raw data"""
@@ -23,11 +28,33 @@ class FileManager:
             with open(filepath, "rb") as f:
                 data = f.read()
             self.current_file_path = filepath
-            self.raw_data = data
             return data
         except Exception as e:
             raise Exception(f"Failed to load binary file: {e}")
     
+    @staticmethod
+    @contextmanager
+    def open_mapped(filepath: str) -> Iterator[Union[mmap.mmap, bytes]]:
+        """Map a binary file read-only for the duration of the with block
+
+        The map supports find(), slicing and regex matching like bytes, but
+        pages are only read when touched and nothing is copied up front.
+        Slices taken from it are bytes and stay valid after the block; the
+        map itself must not be used afterwards (on Windows an open map also
+        keeps the file from being overwritten).
+        """
+        with open(filepath, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                yield b""
+                return
+            try:
+                yield mapped
+            finally:
+                mapped.close()
+    
     def save_binary_file(self, data: bytes, filepath: str) -> bool:
         """Save binary data to file"""
         try:
@@ -40,6 +67,30 @@ class FileManager:
         except Exception as e:
             raise Exception(f"Failed to save binary file: {e}")
     
+    def save_binary_file_atomic(self, data: bytes, filepath: str) -> bool:
+        """Save binary data so readers see either the old or the new file, never a partial one"""
+        directory = os.path.dirname(os.path.abspath(filepath))
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                prefix=f".{os.path.basename(filepath)}.", suffix=".tmp", dir=directory
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, filepath)
+            except BaseException:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+                raise
+            return True
+        except Exception as e:
+            raise Exception(f"Failed to save binary file: {e}")
+    
     def load_json_with_fallback(self, filepath: str) -> Dict[str, Any]:
         """Load JSON file with encoding fallback"""
         encodings = ["utf-8-sig", "utf-8", "cp1251"]
@@ -70,28 +121,121 @@ class FileManager:
         """Parse binary data using binary parser"""
         return self.binary_parser.parse_binary_data(data)
     
+    @traced("replace_language_in_binary")
     def replace_language_in_binary(self, 
                                   data: bytes, 
                                   data_rows: List[Dict[str, str]]) -> bytes:
-        """Replace language data in binary format"""
+        """Replace language data in binary format
+
+        Only the strings whose value changed are touched: the rows are diffed
+        against the offset index of ``data`` and the output is assembled in a
+        single splice pass over the resulting edit list.
+        """
         try:
-            ignored_cols = {"key", "icon", "icon_gray"}
-            lang_columns = [col for col in data_rows[0].keys() if col not in ignored_cols]
-            cleaned = bytearray(data)
-            
-            for selected_column in lang_columns:
-                values = [row.get(selected_column, '') for row in data_rows]
-                
-                if selected_column == "english":
-                    cleaned = self._replace_english_values(cleaned, values)
-                else:
-                    cleaned = self._replace_language_values(cleaned, selected_column, values)
+            try:
+                index = self.binary_parser.build_offset_index(data)
+            except KeyValuesError:
+                return self._replace_language_by_markers(bytes(data), data_rows)
             
-            return bytes(cleaned)
+            edits = self._collect_edits(index, data_rows)
+            return self._apply_edits(data, edits)
             
         except Exception as e:
             raise Exception(f"Failed to replace language in binary: {e}")
     
+    def _collect_edits(self, 
+                       index: List[Dict[str, Any]], 
+                       data_rows: List[Dict[str, str]]) -> List[Tuple[int, int, bytes]]:
+        """Build (start, end, replacement) edits for every changed cell"""
+        ignored_cols = {"key", "icon", "icon_gray"}
+        edits = []
+        
+        # Rows are matched by key; duplicate keys are taken in file order
+        positions: Dict[str, List[Dict[str, Any]]] = {}
+        for entry in index:
+            positions.setdefault(entry['key'], []).append(entry)
+        for entries in positions.values():
+            entries.reverse()
+        
+        for row in data_rows:
+            entries = positions.get(row.get('key'))
+            if not entries:
+                continue
+            entry = entries.pop()
+            fields = entry['fields']
+            
+            for column, value in row.items():
+                if column in ignored_cols or value is None:
+                    continue
+                nodes = fields.get(column)
+                
+                if not nodes:
+                    if value:
+                        marker = b'\x01' + column.encode("utf-8") + b'\x00'
+                        edits.append((entry['anchor'], entry['anchor'],
+                                      marker + value.encode("utf-8") + b'\x00'))
+                    continue
+                
+                originals = [node[2] for node in nodes]
+                if value.encode("utf-8") == b'; '.join(originals):
+                    continue
+                # Cells hold the 'ignore'-decoded text, don't rewrite undecodable bytes
+                if value == '; '.join(raw.decode('utf-8', 'ignore') for raw in originals):
+                    continue
+                
+                # Description cells join repeated strings with '; '
+                parts = value.split('; ') if len(nodes) > 1 else [value]
+                if len(parts) != len(nodes):
+                    parts = [value] + [''] * (len(nodes) - 1)
+                
+                for (_, _, _, offset, value_start, value_end, _), part in zip(nodes, parts):
+                    if part or column == "english":
+                        edits.append((value_start, value_end, part.encode("utf-8")))
+                    else:
+                        # Empty translations are dropped together with their marker
+                        edits.append((offset, value_end + 1, b''))
+        
+        return edits
+    
+    def _apply_edits(self, data: bytes, edits: List[Tuple[int, int, bytes]]) -> bytes:
+        """Splice edits into data in one pass"""
+        if not edits:
+            return bytes(data)
+        
+        # Stable sort keeps insertions at the same anchor in column order
+        edits.sort(key=lambda edit: (edit[0], edit[1]))
+        pieces = []
+        pos = 0
+        
+        for start, end, replacement in edits:
+            pieces.append(data[pos:start])
+            pieces.append(replacement)
+            pos = end
+        
+        pieces.append(data[pos:])
+        return b''.join(pieces)
+    
+    def _replace_language_by_markers(self, 
+                                     data: bytes, 
+                                     data_rows: List[Dict[str, str]]) -> bytes:
+        """Rewrite every language column by marker position
+
+        Used for buffers the KeyValues tokenizer cannot walk.
+        """
+        ignored_cols = {"key", "icon", "icon_gray"}
+        lang_columns = [col for col in data_rows[0].keys() if col not in ignored_cols]
+        cleaned = bytearray(data)
+        
+        for selected_column in lang_columns:
+            values = [row.get(selected_column, '') for row in data_rows]
+            
+            if selected_column == "english":
+                cleaned = self._replace_english_values(cleaned, values)
+            else:
+                cleaned = self._replace_language_values(cleaned, selected_column, values)
+        
+        return bytes(cleaned)
+    
     def _replace_english_values(self, data: bytearray, values: List[str]) -> bytearray:
         """Replace English values in binary data"""
         english_marker = b'\x01english\x00'
@@ -235,7 +379,7 @@ class FileManager:
             data = self.load_binary_file(filepath)
             
             # Check for basic Steam binary markers
-            if b'\x01english\x00' not in data:
+            if data.find(b'\x01english\x00') == -1:
                 return {
                     'valid': False, 
                     'error': 'File does not contain expected Steam data markers'
@@ -163,17 +163,9 @@ class FindReplacePanel(QWidget):
         col_idx = self.parent_window.headers.index(col) if col in self.parent_window.headers else -1
         match_count = 0
 
-        for row in range(self.table.rowCount()):
+        for row in range(self.table.model().rowCount()):
             self.table.setRowHidden(row, False)
 
-
-        if col_idx != -1:
-            for row in range(self.table.rowCount()):
-                item = self.table.item(row, col_idx)
-                if item:
-                    plain_text = self.parent_window.data_rows[row].get(col, "")
-                    item.setText(plain_text)
-
         if not find_text or not col or col_idx == -1:
             self.match_label.setText(translations.get("found_nothing"))
             # CLEAR DELEGATE HIGHLIGHT
@@ -182,16 +174,15 @@ class FindReplacePanel(QWidget):
             self.parent_window.table.viewport().update()
             return
 
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, col_idx)
-            if item:
-                val = item.text()
-                occurrences = len(re.findall(re.escape(find_text), val, flags=re.IGNORECASE))
-                if occurrences > 0:
-                    match_count += occurrences
-                    self.matches.append((row, col_idx))
-                else:
-                    self.table.setRowHidden(row, True)
+        model = self.table.model()
+        for row in range(model.rowCount()):
+            val = model.cell_text(row, col_idx)
+            occurrences = len(re.findall(re.escape(find_text), val, flags=re.IGNORECASE))
+            if occurrences > 0:
+                match_count += occurrences
+                self.matches.append((row, col_idx))
+            else:
+                self.table.setRowHidden(row, True)
 
         msg = translations.get("found").format(match_count=match_count)
         self.match_label.setText(msg)
@@ -227,23 +218,20 @@ class FindReplacePanel(QWidget):
         col_idx = self.parent_window.headers.index(col)
         changed = 0
 
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, col_idx)
-            if item:
-                old_plain = self.parent_window.data_rows[row].get(col, "")
-                if find_text and find_text.lower() in old_plain.lower():
-                    new_val = re.sub(
-                        re.escape(find_text), replace_text, old_plain, flags=re.IGNORECASE
-                    )
-                    item.setText(new_val)
-                    self.parent_window.data_rows[row][col] = new_val
+        model = self.table.model()
+        for row in range(model.rowCount()):
+            old_plain = model.cell_text(row, col_idx)
+            if find_text and find_text.lower() in old_plain.lower():
+                new_val = re.sub(
+                    re.escape(find_text), replace_text, old_plain, flags=re.IGNORECASE
+                )
+                # Goes through the model so the change lands in data_rows and the undo stack
+                if model.setData(model.index(row, col_idx), new_val):
                     changed += 1
-                else:
-                    item.setText(old_plain)
         self.update_matches()
 
     def cleaner(self):
-        for row in range(self.table.rowCount()):
+        for row in range(self.table.model().rowCount()):
             self.table.setRowHidden(row, False)
 
         self.parent_window.highlight_delegate.set_highlight("")
@@ -5,61 +5,85 @@ try:
 except ImportError:
     requests = None
     
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QThread, QStandardPaths, pyqtSignal
+
+from .perf_trace import traced
+from .schema_index import SchemaIndex
+from .schema_scanner import SchemaScanner
 
 class GameNameFetchWorker(QThread):
     """Worker thread for fetching game names from Steam API in background"""
-    progress = pyqtSignal(int, int, str)  # (current, total, message)
-    finished = pyqtSignal(list)      # result list
+    progress = pyqtSignal(int, int, str)  # (files done so far, total, message)
+    finished = pyqtSignal(list)      # [(game_id, metadata), ...]
     api_error = pyqtSignal(str)      # error message
     
-    def __init__(self, stats_files, stats_dir, gui):
+    def __init__(self, stats_files, stats_dir, gui, index_path=None):
         super().__init__()
         self.stats_files = stats_files
         self.stats_dir = stats_dir
         self.gui = gui
         self._is_cancelled = False
+        if index_path is None:
+            cache_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+            index_path = os.path.join(cache_dir, "schema_index.sqlite3")
+        self.index_path = index_path
         
+    @traced("GameNameFetchWorker")
     def run(self):
-        stats_list = []
-        use_steam_api = self.gui.settings.value("UseSteamName", False, type=bool)
+        """Collect (game_id, metadata) for every schema file
+
+        Game names are resolved on the GUI side in one go (see
+        get_game_names_for_ids), so nothing here touches QSettings.
+        """
+        results = []
         
         valid_files = [f for f in self.stats_files if re.match(r"UserGameStatsSchema_(\d+)\.bin", f)]
         total = len(valid_files)
-        consecutive_failures = 0
         
-        for i, fname in enumerate(valid_files):
-            if self._is_cancelled:
-                break
-                
-            m = re.match(r"UserGameStatsSchema_(\d+)\.bin", fname)
-            game_id = m.group(1)
-            file_path = os.path.join(self.stats_dir, fname)
-            
+        # Unchanged files are served from the index, only new/modified ones are parsed
+        index = SchemaIndex(self.index_path)
+        indexed = index.load_all()
+        stats = {}
+        misses = []
+        
+        for fname in valid_files:
+            game_id = re.match(r"UserGameStatsSchema_(\d+)\.bin", fname).group(1)
             try:
-                # Read file once for all metadata
-                with open(file_path, "rb") as f:
-                    file_data = f.read()
-                
-                # Use BinaryParser for version and achievement count
-                achievement_count = self.gui.binary_parser.get_achievement_count(file_data)
-                version = self.gui.binary_parser.get_version(file_data)
-                
-                # Use centralized game name fetching procedure
-                gamename = self.gui.get_game_name_for_id(game_id, raw_data=file_data, show_progress=False)
-                
-                stats_list.append((
-                    gamename,
-                    str(version) if version is not None else self.gui.translations.get("unknown"),
-                    game_id,
-                    achievement_count
-                ))
-                self.progress.emit(i + 1, total, self.gui.translations.get("processing", "Processing {game_id}...").format(game_id=game_id))
-            except Exception:
-                self.progress.emit(i + 1, total, self.gui.translations.get("processing", "Processing {game_id}...").format(game_id=game_id))
+                stat = os.stat(os.path.join(self.stats_dir, fname))
+            except OSError:
+                continue
+            metadata = indexed.get(fname)
+            if SchemaIndex.is_current(metadata, stat):
+                results.append((game_id, metadata))
+            else:
+                stats[fname] = stat
+                misses.append(fname)
+        
+        done = total - len(misses)
+        self.progress.emit(done, total, self.gui.translations.get("processing", "Processing {game_id}...").format(game_id=""))
+        
+        updated = []
+        scanner = SchemaScanner()
+        paths = [os.path.join(self.stats_dir, fname) for fname in misses]
+        for batch in scanner.iter_batches(paths, is_cancelled=lambda: self._is_cancelled):
+            game_id = ""
+            for file_path, metadata in batch:
+                fname = os.path.basename(file_path)
+                if metadata is None:
+                    continue
+                game_id = re.match(r"UserGameStatsSchema_(\d+)\.bin", fname).group(1)
+                results.append((game_id, metadata))
+                updated.append((fname, stats[fname], metadata))
+            done += len(batch)
+            self.progress.emit(done, total, self.gui.translations.get("processing", "Processing {game_id}...").format(game_id=game_id))
+        
+        index.store_many(updated)
+        if not self._is_cancelled:
+            index.prune(valid_files)
+        index.close()
                 
         if not self._is_cancelled:
-            self.finished.emit(stats_list)
+            self.finished.emit(results)
 
     def cancel(self):
         self._is_cancelled = True
@@ -0,0 +1,193 @@
+"""
+Game Name Resolver Plugin for Steam Achievement Localizer
+Fetches missing game names from the Steam Store API in the background
+"""
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, List, Optional, Tuple
+
+import requests
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .game_name_store import GameNameStore, STATUS_OK
+from .http_client import HTTPClient, RequestCancelled
+from .rate_limiter import TokenBucket
+
+
+APP_DETAILS_URL = "https://store.steampowered.com/api/appdetails?appids={appid}"
+
+
+def fetch_app_name(appid,
+                   timeout: tuple = (5, 10),
+                   is_cancelled: Optional[Callable[[], bool]] = None) -> Tuple[str, Optional[str], Optional[float]]:
+    """Ask the Steam Store API for one app's name
+
+    Returns (status, name, retry_after): status is STATUS_OK together with
+    the name, one of GameNameStore.FAILED_STATUSES, or "CANCELLED" if
+    is_cancelled() turned true before the request was sent. retry_after is
+    the server's Retry-After in seconds when rate limited, if it sent one.
+    HTTPClient already paused the Store host on a 429; retrying is up to
+    the caller.
+    """
+    try:
+        response = HTTPClient.get(
+            APP_DETAILS_URL.format(appid=appid), timeout=timeout,
+            retry_on_rate_limit=False, is_cancelled=is_cancelled
+        )
+        if response.status_code == 429:
+            print(f"[API] Game {appid}: Rate limited (429)")
+            return "RATE_LIMITED", None, HTTPClient.retry_after_seconds(response)
+        response.raise_for_status()
+        data = response.json()
+
+        entry = data.get(str(appid)) if isinstance(data, dict) else None
+        if entry and entry.get('success'):
+            return STATUS_OK, entry['data']['name'], None
+        # Game exists but API returned success=false (delisted, region-locked, etc.)
+        print(f"[API] Game {appid}: API returned success=false")
+        return "API_FAILED", None, None
+    except RequestCancelled:
+        return "CANCELLED", None, None
+    except requests.exceptions.HTTPError as e:
+        print(f"[API] Game {appid}: HTTP error {e.response.status_code}")
+        return "API_ERROR", None, None
+    except requests.exceptions.Timeout:
+        print(f"[API] Game {appid}: Request timeout")
+        return "TIMEOUT", None, None
+    except requests.exceptions.RequestException as e:
+        print(f"[API] Game {appid}: Network error - {str(e)}")
+        return "NETWORK_ERROR", None, None
+    except Exception as e:
+        print(f"[API] Game {appid}: Unexpected error - {str(e)}")
+        return "UNKNOWN_ERROR", None, None
+
+
+class GameNameResolver(QThread):
+    """Resolves many app IDs with a few concurrent, rate-limited requests
+
+    Names already in the store are reported without a request, and recent
+    failures (still within their TTL) are not retried. Results are written
+    to the store in small batches while the run goes on, so cancelling and
+    starting again later continues with the IDs that are still missing.
+    Pacing comes from HTTPClient's limiter for the Store host, which other
+    requests to it share. A 429 sends the ID back to the queue; after
+    MAX_CONSECUTIVE_THROTTLES in a row the run stops early.
+    """
+    name_resolved = pyqtSignal(str, str)   # (appid, name)
+    lookup_failed = pyqtSignal(str, str)   # (appid, status)
+    progress = pyqtSignal(int, int)        # (done, total)
+    finished = pyqtSignal(dict)            # summary, see _run()
+
+    CONCURRENCY = 3
+    MAX_CONSECUTIVE_THROTTLES = 5
+    FLUSH_EVERY = 20
+
+    def __init__(self,
+                 appids: Iterable[str],
+                 store_path: str,
+                 concurrency: Optional[int] = None,
+                 limiter: Optional[TokenBucket] = None,
+                 fetch: Callable[..., Tuple[str, Optional[str], Optional[float]]] = fetch_app_name):
+        super().__init__()
+        self.appids: List[str] = list(dict.fromkeys(str(appid) for appid in appids))
+        self.store_path = store_path
+        self.concurrency = concurrency or self.CONCURRENCY
+        self.limiter = limiter or HTTPClient.host_limiter(APP_DETAILS_URL)
+        self.fetch = fetch
+        self._is_cancelled = False
+        self._stopped = False
+
+    def cancel(self):
+        self._is_cancelled = True
+
+    def _should_stop(self) -> bool:
+        return self._is_cancelled or self._stopped
+
+    def _resolve_one(self, appid: str):
+        # Waiting for the host's rate limit happens on the pool thread and stops on cancel
+        return self.fetch(appid, is_cancelled=self._should_stop)
+
+    def run(self):
+        store = GameNameStore(self.store_path)
+        try:
+            summary = self._run(store)
+        finally:
+            store.close()
+        self.finished.emit(summary)
+
+    def _run(self, store: GameNameStore) -> dict:
+        total = len(self.appids)
+        done = 0
+        resolved = 0
+        failed = 0
+        requests_made = 0
+        self._stopped = False
+
+        # Already known (e.g. resolved before the last cancel) or failed recently
+        queue = deque()
+        known = store.get_names(self.appids)
+        for appid in self.appids:
+            if appid in known:
+                self.name_resolved.emit(appid, known[appid])
+                resolved += 1
+                done += 1
+                continue
+            entry = store.get_entry(appid)
+            if entry is not None and entry[1] in GameNameStore.FAILED_STATUSES and entry[1] != "RATE_LIMITED":
+                self.lookup_failed.emit(appid, entry[1])
+                failed += 1
+                done += 1
+                continue
+            queue.append(appid)
+        self.progress.emit(done, total)
+
+        writes = []
+        pending = {}
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            while pending or (queue and not self._should_stop()):
+                while queue and len(pending) < self.concurrency and not self._should_stop():
+                    appid = queue.popleft()
+                    pending[pool.submit(self._resolve_one, appid)] = appid
+
+                finished, _ = wait(list(pending), timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    appid = pending.pop(future)
+                    status, name, _ = future.result()
+                    if status == "CANCELLED":
+                        # Stopped while waiting for the rate limit, nothing was sent
+                        queue.appendleft(appid)
+                        continue
+
+                    requests_made += 1
+                    if status == "RATE_LIMITED":
+                        # HTTPClient already paused the host and lowered its rate
+                        queue.appendleft(appid)
+                        if self.limiter.consecutive_throttles >= self.MAX_CONSECUTIVE_THROTTLES:
+                            self._stopped = True
+                        continue
+
+                    if status == STATUS_OK:
+                        writes.append((appid, name, status))
+                        self.name_resolved.emit(appid, name)
+                        resolved += 1
+                    else:
+                        writes.append((appid, None, status))
+                        self.lookup_failed.emit(appid, status)
+                        failed += 1
+                    done += 1
+                    self.progress.emit(done, total)
+
+                    if len(writes) >= self.FLUSH_EVERY:
+                        store.put_many(writes)
+                        writes = []
+
+        store.put_many(writes)
+        return {
+            'total': total,
+            'resolved': resolved,
+            'failed': failed,
+            'requests': requests_made,
+            'rate_limited': self._stopped and not self._is_cancelled,
+            'cancelled': self._is_cancelled,
+            'remaining': list(queue)
+        }
@@ -0,0 +1,234 @@
+"""
+Game Name Store Plugin for Steam Achievement Localizer
+Keeps Steam game names in an indexed SQLite database instead of QSettings
+"""
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, Optional, Tuple, Any
+
+
+# Status of a successfully resolved name
+STATUS_OK = "OK"
+
+# Store API said the app has no details (delisted, region-locked, ...); unlikely to change soon
+NEGATIVE_STATUSES = {"API_FAILED"}
+
+# Transient failures, worth retrying after a short while
+ERROR_STATUSES = {"RATE_LIMITED", "API_ERROR", "TIMEOUT", "NETWORK_ERROR", "UNKNOWN_ERROR"}
+
+
+class GameNameStore:
+    """appid -> name lookups backed by SQLite
+
+    Two tables: app_list holds the bundled Steam app list (imported once
+    from JSON), game_names holds names resolved at runtime together with
+    negative and error results. Failed lookups expire after a TTL so they
+    are retried eventually, but not on every request.
+    """
+
+    # Bump when the tables change, they are rebuilt (and the app list re-imported)
+    SCHEMA_VERSION = 1
+
+    STATUS_OK = STATUS_OK
+    FAILED_STATUSES = NEGATIVE_STATUSES | ERROR_STATUSES
+
+    NEGATIVE_TTL = 7 * 24 * 3600
+    ERROR_TTL = 15 * 60
+
+    # SQLite limits the number of bound parameters per statement
+    _QUERY_CHUNK = 500
+
+    def __init__(self,
+                 db_path: str,
+                 negative_ttl: Optional[float] = None,
+                 error_ttl: Optional[float] = None):
+        self.db_path = db_path
+        self.negative_ttl = self.NEGATIVE_TTL if negative_ttl is None else negative_ttl
+        self.error_ttl = self.ERROR_TTL if error_ttl is None else error_ttl
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.db_path)
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != self.SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS app_list")
+                conn.execute("DROP TABLE IF EXISTS game_names")
+                conn.execute("DROP TABLE IF EXISTS meta")
+                conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS app_list ("
+                " appid INTEGER PRIMARY KEY,"
+                " name TEXT NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS game_names ("
+                " appid INTEGER PRIMARY KEY,"
+                " name TEXT,"
+                " status TEXT NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def _appid(appid) -> Optional[int]:
+        try:
+            return int(appid)
+        except (TypeError, ValueError):
+            return None
+
+    def _is_expired(self, status: str, updated_at: float, now: float) -> bool:
+        if status == STATUS_OK:
+            return False
+        ttl = self.negative_ttl if status in NEGATIVE_STATUSES else self.error_ttl
+        return now - updated_at > ttl
+
+    # ---- lookups ----
+
+    def get_entry(self, appid) -> Optional[Tuple[Optional[str], str]]:
+        """(name, status) of a runtime lookup, or None if unknown or expired"""
+        key = self._appid(appid)
+        if key is None:
+            return None
+        try:
+            row = self._connect().execute(
+                "SELECT name, status, updated_at FROM game_names WHERE appid = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"[GameNameStore] Failed to read name: {e}")
+            return None
+        if row is None or self._is_expired(row[1], row[2], time.time()):
+            return None
+        return row[0], row[1]
+
+    def get_app_list_name(self, appid) -> Optional[str]:
+        """Name from the imported Steam app list"""
+        key = self._appid(appid)
+        if key is None:
+            return None
+        try:
+            row = self._connect().execute(
+                "SELECT name FROM app_list WHERE appid = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"[GameNameStore] Failed to read app list: {e}")
+            return None
+        return row[0] if row else None
+
+    def get_name(self, appid) -> Optional[str]:
+        """Resolved name, falling back to the app list; None if neither knows it"""
+        entry = self.get_entry(appid)
+        if entry is not None and entry[1] == STATUS_OK:
+            return entry[0]
+        return self.get_app_list_name(appid)
+
+    def get_names(self, appids: Iterable[Any]) -> Dict[str, str]:
+        """Known names of many apps in a few queries: {appid as str: name}"""
+        keys = sorted({key for key in map(self._appid, appids) if key is not None})
+        names: Dict[str, str] = {}
+        try:
+            conn = self._connect()
+            for start in range(0, len(keys), self._QUERY_CHUNK):
+                chunk = keys[start:start + self._QUERY_CHUNK]
+                placeholders = ','.join('?' * len(chunk))
+                for appid, name in conn.execute(
+                    f"SELECT appid, name FROM app_list WHERE appid IN ({placeholders})", chunk
+                ):
+                    names[str(appid)] = name
+                # Runtime results are newer than the bundled list
+                for appid, name in conn.execute(
+                    f"SELECT appid, name FROM game_names WHERE status = ? AND appid IN ({placeholders})",
+                    [STATUS_OK] + chunk
+                ):
+                    names[str(appid)] = name
+        except sqlite3.Error as e:
+            print(f"[GameNameStore] Failed to read names: {e}")
+        return names
+
+    # ---- writes ----
+
+    def put(self, appid, name: Optional[str], status: str = STATUS_OK):
+        self.put_many([(appid, name, status)])
+
+    def put_names(self, names: Dict[Any, str]):
+        """Save many resolved {appid: name} pairs in one transaction"""
+        self.put_many((appid, name, STATUS_OK) for appid, name in names.items() if name)
+
+    def put_many(self, records: Iterable[Tuple[Any, Optional[str], str]]):
+        """Insert or replace (appid, name, status) records in one transaction"""
+        now = time.time()
+        rows = [
+            (key, name, status, now)
+            for key, name, status in ((self._appid(appid), name, status) for appid, name, status in records)
+            if key is not None
+        ]
+        if not rows:
+            return
+        try:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO game_names (appid, name, status, updated_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    rows
+                )
+        except sqlite3.Error as e:
+            print(f"[GameNameStore] Failed to save names: {e}")
+
+    # ---- imports ----
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def import_app_list(self, json_path: str) -> bool:
+        """Load the bundled Steam app list JSON unless this exact file was imported before
+
+        The file is identified by size and mtime, so a new bundled list
+        (e.g. after an app update) replaces the old one. Returns True if
+        an import happened.
+        """
+        try:
+            stat = os.stat(json_path)
+        except OSError:
+            return False
+        stamp = f"{stat.st_size}:{stat.st_mtime_ns}"
+
+        try:
+            if self._get_meta("app_list_source") == stamp:
+                return False
+
+            with open(json_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            apps = (
+                (app['appid'], app['name'])
+                for app in data.get('applist', {}).get('apps', [])
+                if app.get('name')
+            )
+
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM app_list")
+                conn.executemany("INSERT OR REPLACE INTO app_list (appid, name) VALUES (?, ?)", apps)
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('app_list_source', ?)", (stamp,)
+                )
+            return True
+        except (OSError, ValueError, KeyError, TypeError, sqlite3.Error) as e:
+            print(f"[GameNameStore] Failed to import app list: {e}")
+            return False
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -1,59 +1,100 @@
+from collections import OrderedDict
+
 from PyQt6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem, QStyle
 from PyQt6.QtGui import QTextDocument, QPalette, QColor
 import re
 
 class HighlightDelegate(QStyledItemDelegate):
+    # Laid-out documents kept for repaints; a screenful of cells fits many times over
+    MAX_CACHED_DOCUMENTS = 512
+    MAX_CACHED_SIZES = 4096
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.highlight_text = ""
         self.highlight_color = QColor("orange")
-        self.highlight_column = -1  
+        self.highlight_column = -1
+        self.highlight_pattern = None
+        # (text, width, highlight, color) -> QTextDocument
+        self.document_cache = OrderedDict()
+        # text -> QSize of the unwrapped document
+        self.size_cache = OrderedDict()
 
     def set_highlight(self, text, color=None):
-        self.highlight_text = text
         if color is not None:
             self.highlight_color = QColor(color)
+        if text == self.highlight_text:
+            return
+        self.highlight_text = text
+        self.highlight_pattern = re.compile(re.escape(text), re.IGNORECASE) if text else None
+        # Documents of the previous query are not reused, drop them now instead of via LRU
+        self.document_cache.clear()
+
+    @staticmethod
+    def html_escape(s):
+        return (s.replace("&", "&amp;")
+                  .replace("<", "&lt;")
+                  .replace(">", "&gt;")
+                  .replace('"', "&quot;")
+                  .replace("'", "&#39;"))
+
+    def highlighted_document(self, text, width):
+        """Laid-out document with every match of the current highlight marked"""
+        color = self.highlight_color.name()
+        key = (text, width, self.highlight_text, color)
+        doc = self.document_cache.get(key)
+        if doc is not None:
+            self.document_cache.move_to_end(key)
+            return doc
+
+        html_escape = self.html_escape
+        highlighted = self.highlight_pattern.sub(
+            lambda m: f"<span style='background-color: {color};'>{html_escape(m.group(0))}</span>",
+            html_escape(text)
+        )
+        doc = QTextDocument()
+        doc.setHtml(highlighted)
+        doc.setTextWidth(width)
+
+        self.document_cache[key] = doc
+        if len(self.document_cache) > self.MAX_CACHED_DOCUMENTS:
+            self.document_cache.popitem(last=False)
+        return doc
 
     def paint(self, painter, option, index):
-        
+
         if self.highlight_column != -1 and index.column() != self.highlight_column:
             super().paint(painter, option, index)
             return
 
         text = index.data()
-        if not self.highlight_text or not text:
+        # Cells without a match paint like plain cells, without rich-text layout
+        if self.highlight_pattern is None or not text or not self.highlight_pattern.search(str(text)):
             super().paint(painter, option, index)
             return
 
-        pattern = re.compile(re.escape(self.highlight_text), re.IGNORECASE)
-        def html_escape(s):
-            return (s.replace("&", "&amp;")
-                      .replace("<", "&lt;")
-                      .replace(">", "&gt;")
-                      .replace('"', "&quot;")
-                      .replace("'", "&#39;"))
-        text_escaped = html_escape(str(text))
-        highlighted = pattern.sub(
-            lambda m: f"<span style='background-color: {self.highlight_color.name()};'>{html_escape(m.group(0))}</span>",
-            text_escaped
-        )
-
-        
         if option.state & QStyle.StateFlag.State_Selected:
             painter.fillRect(option.rect, option.palette.color(QPalette.ColorRole.Highlight))
 
-        doc = QTextDocument()
-        doc.setHtml(highlighted)
+        doc = self.highlighted_document(str(text), option.rect.width())
         painter.save()
         painter.translate(option.rect.left(), option.rect.top())
-        doc.setTextWidth(option.rect.width())
         doc.drawContents(painter)
         painter.restore()
 
     def sizeHint(self, option, index):
         text = index.data()
+        text = str(text) if text else ""
+        sz = self.size_cache.get(text)
+        if sz is not None:
+            self.size_cache.move_to_end(text)
+            return sz
+
         doc = QTextDocument()
-        doc.setHtml(str(text) if text else "")
+        doc.setHtml(text)
         sz = doc.size().toSize()
         # print(f"SizeHint for row {index.row()}, col {index.column()} = {sz}")
-        return sz
\ No newline at end of file
+        self.size_cache[text] = sz
+        if len(self.size_cache) > self.MAX_CACHED_SIZES:
+            self.size_cache.popitem(last=False)
+        return sz
@@ -0,0 +1,199 @@
+"""
+HTTP Cache Plugin for Steam Achievement Localizer
+Keeps HTTP responses in an on-disk SQLite cache with per-endpoint TTLs
+"""
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Pattern, Tuple, Any
+
+
+# (URL pattern, seconds a response stays fresh); first match wins, unmatched URLs are not cached
+DEFAULT_TTL_RULES: List[Tuple[str, float]] = [
+    (r"^https://store\.steampowered\.com/api/appdetails\b", 7 * 24 * 3600),
+    (r"^https://api\.github\.com/repos/[^/]+/[^/]+/releases", 10 * 60),
+    (r"^https://raw\.githubusercontent\.com/.+/CHANGELOG\.md$", 60 * 60),
+]
+
+# Describe the original transfer, not the decoded body that is stored
+_SKIPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+
+class HTTPCache:
+    """Response cache keyed by URL, with conditional revalidation and an LRU size cap
+
+    A response is fresh for the TTL of the first rule matching its URL.
+    Stale entries are kept while they have an ETag or Last-Modified, so
+    the next request can revalidate them (304) instead of downloading
+    again. Past max_bytes the least recently used entries are dropped.
+    Safe to use from several threads.
+    """
+
+    # Bump when the table changes, it is rebuilt
+    SCHEMA_VERSION = 1
+
+    DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+    def __init__(self,
+                 db_path: str,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 ttl_rules: Optional[List[Tuple[str, float]]] = None):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.ttl_rules: List[Tuple[Pattern, float]] = [
+            (re.compile(pattern), ttl) for pattern, ttl in (DEFAULT_TTL_RULES if ttl_rules is None else ttl_rules)
+        ]
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+            # Shared by the request threads, every use holds self._lock
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != self.SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS responses")
+                conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " url TEXT PRIMARY KEY,"
+                " status INTEGER NOT NULL,"
+                " headers TEXT NOT NULL,"
+                " body BLOB NOT NULL,"
+                " etag TEXT,"
+                " last_modified TEXT,"
+                " expires_at REAL NOT NULL,"
+                " last_access REAL NOT NULL,"
+                " size INTEGER NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def ttl_for(self, url: str) -> Optional[float]:
+        """Freshness lifetime for url, or None if it is not cached"""
+        for pattern, ttl in self.ttl_rules:
+            if pattern.search(url):
+                return ttl
+        return None
+
+    def lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        """Cached entry for url: {'status', 'headers', 'body', 'etag', 'last_modified', 'fresh'}"""
+        if self.ttl_for(url) is None:
+            return None
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT status, headers, body, etag, last_modified, expires_at FROM responses WHERE url = ?",
+                    (url,)
+                ).fetchone()
+                if row is None:
+                    return None
+                with conn:
+                    conn.execute("UPDATE responses SET last_access = ? WHERE url = ?", (now, url))
+        except sqlite3.Error as e:
+            print(f"[HTTPCache] Failed to read cache: {e}")
+            return None
+
+        status, headers, body, etag, last_modified, expires_at = row
+        return {
+            'status': status,
+            'headers': json.loads(headers),
+            'body': body,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fresh': now < expires_at
+        }
+
+    def store(self, url: str, status: int, headers: Dict[str, str], body: bytes):
+        """Cache a response if its URL has a TTL rule and the server allows storing it"""
+        ttl = self.ttl_for(url)
+        if ttl is None:
+            return
+        lowered = {key.lower(): value for key, value in headers.items()}
+        if 'no-store' in lowered.get('cache-control', '').lower():
+            return
+
+        kept = {key: value for key, value in headers.items() if key.lower() not in _SKIPPED_HEADERS}
+        encoded_headers = json.dumps(kept)
+        size = len(body) + len(url) + len(encoded_headers)
+        if size > self.max_bytes:
+            return
+
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO responses"
+                        " (url, status, headers, body, etag, last_modified, expires_at, last_access, size)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (url, status, encoded_headers, body, lowered.get('etag'),
+                         lowered.get('last-modified'), now + ttl, now, size)
+                    )
+                    self._evict(conn)
+        except sqlite3.Error as e:
+            print(f"[HTTPCache] Failed to write cache: {e}")
+
+    def refresh(self, url: str):
+        """A 304 confirmed the cached body: make it fresh again"""
+        ttl = self.ttl_for(url)
+        if ttl is None:
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "UPDATE responses SET expires_at = ?, last_access = ? WHERE url = ?",
+                        (now + ttl, now, url)
+                    )
+        except sqlite3.Error as e:
+            print(f"[HTTPCache] Failed to write cache: {e}")
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop least recently used entries until the cache fits max_bytes"""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        stale = []
+        for url, size in conn.execute("SELECT url, size FROM responses ORDER BY last_access"):
+            stale.append((url,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+        conn.executemany("DELETE FROM responses WHERE url = ?", stale)
+
+    def set_max_bytes(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    self._evict(conn)
+        except sqlite3.Error as e:
+            print(f"[HTTPCache] Failed to write cache: {e}")
+
+    def clear(self):
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute("DELETE FROM responses")
+        except sqlite3.Error as e:
+            print(f"[HTTPCache] Failed to clear cache: {e}")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
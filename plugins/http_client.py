@@ -1,12 +1,22 @@
 """
 Centralized HTTP client for network requests with proper error handling,
-retry logic, and connection pooling.
+retry logic, connection pooling and per-host rate limiting.
 """
 
-import time
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
 import requests
 from requests.adapters import HTTPAdapter
-from typing import Optional, Dict, Any
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from typing import Optional, Dict, Any, Callable, Tuple
+
+from .http_cache import HTTPCache
+from .rate_limiter import TokenBucket
 
 try:
     from urllib3.util.retry import Retry
@@ -17,13 +27,22 @@ except ImportError:
 try:
     import certifi
     CA_BUNDLE = certifi.where()
+    # For requests made outside HTTPClient, also in frozen apps
+    os.environ["REQUESTS_CA_BUNDLE"] = CA_BUNDLE
 except ImportError:
     CA_BUNDLE = True  # Fallback to default system store
 
-try:
-    CA_BUNDLE = certifi.where()
-except ImportError:
-    CA_BUNDLE = True  # Fallback to default system store
+
+# (requests per second, burst) per host; the Store API is the one that rate limits
+HOST_RATES: Dict[str, Tuple[float, float]] = {
+    'store.steampowered.com': (1.0, 3),
+}
+# Other hosts are not paced, but still share pauses from Retry-After
+DEFAULT_HOST_RATE: Tuple[float, float] = (50.0, 50)
+
+
+class RequestCancelled(requests.exceptions.RequestException):
+    """The request was cancelled while waiting for its host's rate limit"""
 
 
 class HTTPClient:
@@ -34,11 +53,26 @@ class HTTPClient:
     - Proper timeout configuration
     - Consistent headers
     - SSL verification
+    - One rate limiter per host, shared by every caller: a 429 with
+      Retry-After pauses all requests to that host, not only the one
+      that got it, and the host's rate adapts (see TokenBucket)
+    - get_async() for callers that should not block at all
+    - Optional on-disk response cache (set_cache) with per-endpoint TTLs;
+      stale entries are revalidated with ETag / Last-Modified
     """
     
     _instance: Optional['HTTPClient'] = None
     _session: Optional[requests.Session] = None
     
+    _host_limiters: Dict[str, TokenBucket] = {}
+    _limiters_lock = threading.Lock()
+    
+    ASYNC_WORKERS = 8
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+    
+    _cache: Optional[HTTPCache] = None
+    
     def __init__(self):
         if HTTPClient._session is None:
             HTTPClient._session = self._create_session()
@@ -90,6 +124,22 @@ class HTTPClient:
             cls._session = cls._create_session()
         return cls._session
     
+    @classmethod
+    def set_cache(cls, cache: Optional[HTTPCache]):
+        """Install (or with None, remove) the response cache used by get()"""
+        cls._cache = cache
+    
+    @classmethod
+    def host_limiter(cls, url: str) -> TokenBucket:
+        """Shared rate limiter of the host of url (a bare host name works too)"""
+        host = (urlsplit(url).hostname or url).lower()
+        with cls._limiters_lock:
+            limiter = cls._host_limiters.get(host)
+            if limiter is None:
+                rate, burst = HOST_RATES.get(host, DEFAULT_HOST_RATE)
+                limiter = cls._host_limiters[host] = TokenBucket(rate, capacity=burst)
+            return limiter
+    
     @classmethod
     def get(
         cls,
@@ -98,25 +148,101 @@ class HTTPClient:
         verify: bool = True,
         headers: Optional[Dict[str, str]] = None,
         stream: bool = False,
+        retry_on_rate_limit: bool = True,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+        use_cache: bool = True,
+        revalidate: bool = False,
         **kwargs
     ) -> requests.Response:
         """
         Make a GET request with proper error handling.
         
+        A fresh cached response is returned without touching the network.
+        Otherwise the request first waits for a slot from its host's rate
+        limiter, so callers queue behind each other (and behind a
+        Retry-After pause) instead of each sleeping on their own.
+        
         Args:
             url: URL to request
             timeout: Tuple of (connect_timeout, read_timeout) in seconds
             verify: Whether to verify SSL certificates (default: True, uses CA_BUNDLE)
             headers: Additional headers to include
             stream: Whether to stream the response
+            retry_on_rate_limit: On 429, wait for the host's pause and retry once;
+                callers with their own retry logic pass False and get the 429 response
+            is_cancelled: Polled while waiting for the rate limiter
+            use_cache: Read and write the response cache (streamed requests never do)
+            revalidate: Confirm even a fresh cached response with the server
             **kwargs: Additional arguments to pass to requests.get
             
         Returns:
             requests.Response object
             
         Raises:
+            RequestCancelled: If is_cancelled() turned true while waiting
             requests.exceptions.RequestException: For network errors
         """
+        cache = cls._cache if use_cache and not stream else None
+        cached = cache.lookup(url) if cache is not None else None
+        if cached is not None:
+            if cached['fresh'] and not revalidate:
+                return cls._cached_response(url, cached)
+            # Ask the server whether the stale copy is still good
+            conditional = {}
+            if cached['etag']:
+                conditional['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                conditional['If-Modified-Since'] = cached['last_modified']
+            headers = {**conditional, **(headers or {})}
+        
+        limiter = cls.host_limiter(url)
+        attempts = 2 if retry_on_rate_limit else 1
+        
+        for _ in range(attempts):
+            if not limiter.acquire(is_cancelled=is_cancelled):
+                raise RequestCancelled(f"Request to {url} was cancelled")
+            
+            response = cls._send(url, timeout, verify, headers, stream, **kwargs)
+            if response.status_code != 429:
+                limiter.succeeded()
+                if cache is not None:
+                    if response.status_code == 304 and cached is not None:
+                        cache.refresh(url)
+                        return cls._cached_response(url, cached)
+                    if response.status_code == 200:
+                        cache.store(url, response.status_code, dict(response.headers), response.content)
+                return response
+            
+            # Everyone waiting for this host is held back, not only this caller
+            pause = limiter.throttled(cls.retry_after_seconds(response))
+            print(f"[HTTPClient] Rate limited by {urlsplit(url).hostname}, pausing requests for {pause:.1f}s")
+        
+        return response
+    
+    @classmethod
+    def get_async(cls, url: str, **kwargs) -> Future:
+        """Queue a get() on the shared request pool and return its Future
+
+        Takes the same arguments as get(); the Future's result is the
+        response, or it raises what get() would have raised.
+        """
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=cls.ASYNC_WORKERS, thread_name_prefix="HTTPClient")
+            executor = cls._executor
+        return executor.submit(cls.get, url, **kwargs)
+    
+    @classmethod
+    def _send(
+        cls,
+        url: str,
+        timeout: tuple,
+        verify: bool,
+        headers: Optional[Dict[str, str]],
+        stream: bool,
+        **kwargs
+    ) -> requests.Response:
+        """Single GET on the shared session (no rate limiting)"""
         session = cls.get_session()
         
         # Merge headers
@@ -128,7 +254,7 @@ class HTTPClient:
         verify_param = CA_BUNDLE if verify else False
         
         try:
-            response = session.get(
+            return session.get(
                 url,
                 timeout=timeout,
                 verify=verify_param,
@@ -137,22 +263,6 @@ class HTTPClient:
                 **kwargs
             )
             
-            # Handle rate limiting with exponential backoff
-            if response.status_code == 429:
-                retry_after = int(response.headers.get('Retry-After', 5))
-                time.sleep(retry_after)
-                # Retry once after waiting
-                response = session.get(
-                    url,
-                    timeout=timeout,
-                    verify=verify_param,
-                    headers=request_headers,
-                    stream=stream,
-                    **kwargs
-                )
-            
-            return response
-            
         except requests.exceptions.Timeout as e:
             raise requests.exceptions.Timeout(
                 f"Request to {url} timed out after {timeout} seconds"
@@ -179,9 +289,45 @@ class HTTPClient:
             # Re-raise other request exceptions as-is
             raise
     
+    @staticmethod
+    def _cached_response(url: str, cached: Dict[str, Any]) -> requests.Response:
+        """Rebuild a Response from a cache entry (from_cache is set on it)"""
+        response = requests.Response()
+        response.status_code = cached['status']
+        response.headers = CaseInsensitiveDict(cached['headers'])
+        response._content = cached['body']
+        response.url = url
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
+    
+    @staticmethod
+    def retry_after_seconds(response: requests.Response) -> Optional[float]:
+        """Retry-After of a response in seconds (delta or HTTP date), None if absent"""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at is None:
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    
     @classmethod
     def close(cls):
         """Close the session and clean up resources"""
+        with cls._executor_lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=False, cancel_futures=True)
+                cls._executor = None
         if cls._session:
             cls._session.close()
             cls._session = None
@@ -0,0 +1,58 @@
+"""
+Icon Delegate Plugin for Steam Achievement Localizer
+Paints the achievement icon column from an in-memory pixmap cache
+"""
+from typing import Dict, Iterable, Optional
+
+from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtWidgets import QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+from .achievement_table_model import ICON_HASH_ROLE
+
+
+class IconDelegate(QStyledItemDelegate):
+    """Draws icons keyed by icon hash; cells show the placeholder until the image arrives"""
+
+    def __init__(self, parent=None, icon_size: tuple = (64, 64)):
+        super().__init__(parent)
+        self.icon_size = QSize(icon_size[0], icon_size[1])
+        self.placeholder: Optional[QPixmap] = None
+        self.pixmaps: Dict[str, QPixmap] = {}
+
+    def has_pixmap(self, icon_hash: str) -> bool:
+        return icon_hash in self.pixmaps
+
+    def set_pixmap(self, icon_hash: str, pixmap: QPixmap):
+        self.pixmaps[icon_hash] = pixmap
+
+    def retain(self, icon_hashes: Iterable[str]):
+        """Drop cached pixmaps that are not used by the current table"""
+        keep = set(icon_hashes)
+        self.pixmaps = {icon_hash: pixmap for icon_hash, pixmap in self.pixmaps.items() if icon_hash in keep}
+
+    def paint(self, painter, option, index):
+        # Background, selection and focus frame as for any other cell, without text
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ''
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+
+        icon_hash = index.data(ICON_HASH_ROLE)
+        if not icon_hash:
+            return
+
+        pixmap = self.pixmaps.get(icon_hash, self.placeholder)
+        if pixmap is None or pixmap.isNull():
+            return
+
+        target = QStyle.alignedRect(
+            option.direction, Qt.AlignmentFlag.AlignCenter,
+            pixmap.size().scaled(option.rect.size().boundedTo(self.icon_size), Qt.AspectRatioMode.KeepAspectRatio),
+            option.rect
+        )
+        painter.drawPixmap(target, pixmap)
+
+    def sizeHint(self, option, index):
+        return self.icon_size
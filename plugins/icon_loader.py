@@ -1,12 +1,9 @@
 import os
-import requests
 import shutil
 from PyQt6.QtGui import QPixmap, QIcon
 from PyQt6.QtCore import QSettings, QStandardPaths, Qt
 from typing import Optional, Any
 
-from plugins.http_client import HTTPClient
-
 
 class IconLoader:
     """Handles loading and caching of achievement icons"""
@@ -73,6 +70,8 @@ class IconLoader:
         
         # Download icon
         try:
+            # Networking is only imported once an icon really has to be downloaded
+            from plugins.http_client import HTTPClient
             response = HTTPClient.get(icon_url, timeout=(2, 5))  # Short timeout to prevent blocking
             response.raise_for_status()
             
@@ -120,6 +119,7 @@ class IconLoader:
         
         try:
             # HTTPClient handles SSL verification and fallback automatically
+            from plugins.http_client import HTTPClient
             response = HTTPClient.get(icon_url, timeout=(5, 10))
             response.raise_for_status()
 
@@ -0,0 +1,139 @@
+"""
+KeyValues Tokenizer Plugin for Steam Achievement Localizer
+Walks binary KeyValues buffers (UserGameStatsSchema_*.bin) in a single pass
+"""
+import re
+import struct
+from typing import Iterator, NamedTuple, Optional, Union
+
+
+# Node type bytes used by Valve's binary KeyValues format
+TYPE_SECTION = 0x00
+TYPE_STRING = 0x01
+TYPE_INT32 = 0x02
+TYPE_FLOAT32 = 0x03
+TYPE_POINTER = 0x04
+TYPE_COLOR = 0x06
+TYPE_UINT64 = 0x07
+TYPE_END = 0x08
+TYPE_INT64 = 0x0A
+TYPE_END_ALT = 0x0B
+
+# One alternative per node shape. Nodes are matched back to back, so the
+# regex engine does the byte scanning and Python only dispatches per node.
+# Group layout (m.lastindex identifies the node shape):
+#   1, 2 - string key and value
+#   3    - section key
+#   4, 5 - int32 key and payload
+#   6, 7 - other 4-byte key and payload (float32, pointer, color)
+#   8, 9 - 8-byte key and payload (uint64, int64)
+#   none - end of section
+_NODE_PATTERN = re.compile(
+    b'\x01([^\x00]*)\x00([^\x00]*)\x00'
+    b'|\x00([^\x00]*)\x00'
+    b'|[\x08\x0b]'
+    b'|\x02([^\x00]*)\x00(.{4})'
+    b'|[\x03\x04\x06]([^\x00]*)\x00(.{4})'
+    b'|[\x07\x0a]([^\x00]*)\x00(.{8})',
+    re.DOTALL
+)
+
+_INT32 = struct.Struct('<i')
+
+_GROUP_STRING = 2
+_GROUP_SECTION = 3
+_GROUP_INT32 = 5
+
+
+class KVToken(NamedTuple):
+    """Single node emitted by the tokenizer
+
+    offset points at the type byte, value_start/value_end delimit the raw
+    payload (for strings value_end is the position of the terminating NUL).
+    Section and end tokens have an empty payload.
+    """
+    type: int
+    key: bytes
+    value: Union[bytes, int, None]
+    offset: int
+    value_start: int
+    value_end: int
+    depth: int
+
+
+class KeyValuesError(ValueError):
+    """Raised when the buffer is not a walkable binary KeyValues stream"""
+
+
+def iter_nodes(data, start: int = 0, implicit_root: Optional[bool] = None) -> Iterator[tuple]:
+    """Tokenize a binary KeyValues buffer in one linear pass
+
+    Yields plain tuples laid out like KVToken (type, key, value, offset,
+    value_start, value_end, depth); hot paths index them directly, use
+    tokenize() for named access.
+
+    Args:
+        data: bytes, bytearray or mmap with the KeyValues stream
+        start: Offset to start reading from
+        implicit_root: Treat the buffer as starting with a section key that has
+            no leading type byte (snippets such as ``0\\x00\\x01name...``).
+            Autodetected when None.
+
+    Truncated input is tolerated: open sections are closed with synthetic
+    end tokens at the end of the buffer.
+
+    Raises:
+        KeyValuesError: On an unknown type byte in the middle of the buffer
+    """
+    size = len(data)
+    pos = start
+    depth = 0
+
+    if implicit_root is None:
+        implicit_root = size > pos and data[pos] > TYPE_END_ALT
+
+    if implicit_root:
+        key_end = data.find(b'\x00', pos)
+        if key_end == -1:
+            raise KeyValuesError(f"Unterminated root key at offset {pos}")
+        yield (TYPE_SECTION, bytes(data[pos:key_end]), None, pos, key_end + 1, key_end + 1, depth)
+        depth += 1
+        pos = key_end + 1
+
+    for match in _NODE_PATTERN.finditer(data, pos):
+        offset = match.start()
+        if offset != pos:
+            raise KeyValuesError(f"Unknown node type 0x{data[pos]:02x} at offset {pos}")
+        pos = match.end()
+        shape = match.lastindex
+
+        if shape == _GROUP_STRING:
+            key, value = match.group(1, 2)
+            yield (TYPE_STRING, key, value, offset, offset + len(key) + 2, pos - 1, depth)
+        elif shape == _GROUP_SECTION:
+            yield (TYPE_SECTION, match.group(3), None, offset, pos, pos, depth)
+            depth += 1
+        elif shape is None:
+            if depth == 0:
+                # Trailing terminator of the root object
+                continue
+            depth -= 1
+            yield (TYPE_END, b'', None, offset, pos, pos, depth)
+        elif shape == _GROUP_INT32:
+            key, raw = match.group(4, 5)
+            yield (TYPE_INT32, key, _INT32.unpack(raw)[0], offset, pos - 4, pos, depth)
+        else:
+            key, raw = match.group(shape - 1, shape)
+            yield (data[offset], key, raw, offset, pos - len(raw), pos, depth)
+
+    # Anything left over is a node cut off by a truncated buffer; close the
+    # sections that are still open so callers always see balanced output
+    while depth > 0:
+        depth -= 1
+        yield (TYPE_END, b'', None, size, size, size, depth)
+
+
+def tokenize(data, start: int = 0, implicit_root: Optional[bool] = None) -> Iterator[KVToken]:
+    """Same as iter_nodes() but yields KVToken named tuples"""
+    for node in iter_nodes(data, start, implicit_root):
+        yield KVToken(*node)
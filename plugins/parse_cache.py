@@ -0,0 +1,97 @@
+"""
+Parse Cache Plugin for Steam Achievement Localizer
+Keeps recently parsed schema files in memory, keyed by a hash of their bytes
+"""
+import hashlib
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from .row_store import RowStore
+
+
+class ParseCache:
+    """LRU cache of parse results under a memory budget
+
+    Row stores are kept as private copies and handed out as fresh copies, so
+    edits made to the table never leak into the cache.
+    """
+
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    # Rough per-object overhead used by the size estimate (dict slot, str header, tuple)
+    _ITEM_OVERHEAD = 80
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        # key -> (rows, headers, entries, chunk_spans, estimated size)
+        self._items: "OrderedDict[bytes, tuple]" = OrderedDict()
+
+    @staticmethod
+    def key_for(data) -> bytes:
+        """Fast content hash of a schema buffer"""
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[Tuple[RowStore, List[str], Optional[list], List[Tuple[int, int]]]]:
+        """Return (rows, headers, entries, chunk_spans) for key, or None
+
+        rows and headers are fresh copies; entries and spans are shared
+        (they are never modified).
+        """
+        item = self._items.get(key)
+        if item is None:
+            return None
+        self._items.move_to_end(key)
+        rows, headers, entries, chunk_spans, _ = item
+        return rows.copy(), list(headers), entries, chunk_spans
+
+    def put(self,
+            key: bytes,
+            rows: RowStore,
+            headers: List[str],
+            entries: Optional[list],
+            chunk_spans: List[Tuple[int, int]]):
+        """Store a parse result; least recently used files are evicted past the budget"""
+        size = self._estimate_size(rows, entries)
+        if size > self.max_bytes:
+            return
+
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.used_bytes -= old[-1]
+
+        self._items[key] = (rows.copy(), list(headers), entries, chunk_spans, size)
+        self.used_bytes += size
+
+        while self.used_bytes > self.max_bytes and self._items:
+            _, evicted = self._items.popitem(last=False)
+            self.used_bytes -= evicted[-1]
+
+    def set_max_bytes(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        while self.used_bytes > self.max_bytes and self._items:
+            _, evicted = self._items.popitem(last=False)
+            self.used_bytes -= evicted[-1]
+
+    def clear(self):
+        self._items.clear()
+        self.used_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _estimate_size(self, rows: RowStore, entries: Optional[list]) -> int:
+        overhead = self._ITEM_OVERHEAD
+        size = 0
+        for name in rows.column_names():
+            # One reference per row; the value strings themselves are counted once
+            size += len(name) + 8 * len(rows)
+            for value in rows.column(name):
+                if value:
+                    size += len(value) + overhead
+        if entries:
+            for _, _, key, nodes in entries:
+                size += len(key) + overhead
+                for node in nodes:
+                    size += len(node[1]) + len(node[2]) + 3 * overhead
+        return size
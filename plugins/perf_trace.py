@@ -0,0 +1,205 @@
+"""
+Performance Trace Plugin for Steam Achievement Localizer
+Named timing spans with a rolling summary and Chrome trace export
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+
+# "1"/"true"/"yes" turns tracing on at startup; a path ending in .json also
+# writes the trace there when the app exits
+PERF_TRACE_ENV_VAR = "SAL_PERF_TRACE"
+
+
+class _NullSpan:
+    """Span used while tracing is off: entering and leaving do nothing"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'args', 'start')
+
+    def __init__(self, tracer: 'PerfTracer', name: str, args: Optional[Dict[str, Any]]):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.tracer.record(self.name, self.start, time.perf_counter_ns() - self.start, self.args)
+        return False
+
+
+class PerfTracer:
+    """Collects finished spans from any thread
+
+    Every span is kept (up to MAX_EVENTS) for the Chrome trace, and the
+    last WINDOW durations of each name feed the rolling summary. While
+    disabled, span() hands out a shared no-op object, so instrumented code
+    only pays for one attribute check.
+    """
+
+    MAX_EVENTS = 100000
+    WINDOW = 20
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._origin = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        # (name, start ns, duration ns, thread id, args)
+        self._events: Deque[Tuple[str, int, int, int, Optional[Dict[str, Any]]]] = deque(maxlen=self.MAX_EVENTS)
+        self._recent: Dict[str, Deque[int]] = {}
+        self._thread_names: Dict[int, str] = {}
+
+    def set_enabled(self, enabled: bool):
+        self.enabled = enabled
+
+    def span(self, name: str, **args):
+        """Context manager timing the enclosed block as `name`"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args or None)
+
+    def record(self, name: str, start_ns: int, duration_ns: int, args: Optional[Dict[str, Any]] = None):
+        thread = threading.current_thread()
+        with self._lock:
+            self._events.append((name, start_ns, duration_ns, thread.ident, args))
+            self._thread_names.setdefault(thread.ident, thread.name)
+            recent = self._recent.get(name)
+            if recent is None:
+                recent = self._recent[name] = deque(maxlen=self.WINDOW)
+            recent.append(duration_ns)
+
+    def clear(self):
+        with self._lock:
+            self._events.clear()
+            self._recent.clear()
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Per span name: last and average duration (ms) over the rolling window"""
+        with self._lock:
+            recent = {name: list(durations) for name, durations in self._recent.items()}
+        return [
+            {
+                'name': name,
+                'count': len(durations),
+                'last_ms': durations[-1] / 1e6,
+                'avg_ms': sum(durations) / len(durations) / 1e6
+            }
+            for name, durations in recent.items()
+        ]
+
+    def format_summary(self, names: Optional[List[str]] = None) -> str:
+        """One-line breakdown for the status bar, e.g. "parse_binary_data 12.3 ms | ..."
+
+        Shows the last duration of each span (only those in names, in that
+        order, if given), with the rolling average in brackets when the
+        window holds more than one run.
+        """
+        entries = {entry['name']: entry for entry in self.summary()}
+        parts = []
+        for name in (names if names is not None else list(entries)):
+            entry = entries.get(name)
+            if entry is None:
+                continue
+            text = f"{entry['name']} {_format_ms(entry['last_ms'])}"
+            if entry['count'] > 1:
+                text += f" (avg {_format_ms(entry['avg_ms'])})"
+            parts.append(text)
+        return " | ".join(parts)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Spans as Chrome trace events, loadable in chrome://tracing or Perfetto"""
+        pid = os.getpid()
+        with self._lock:
+            events = list(self._events)
+            thread_names = dict(self._thread_names)
+
+        trace_events: List[Dict[str, Any]] = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+            for tid, name in thread_names.items()
+        ]
+        for name, start_ns, duration_ns, tid, args in events:
+            event = {
+                'name': name,
+                'cat': 'app',
+                'ph': 'X',
+                'ts': (start_ns - self._origin) / 1000,
+                'dur': duration_ns / 1000,
+                'pid': pid,
+                'tid': tid
+            }
+            if args:
+                event['args'] = args
+            trace_events.append(event)
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    @staticmethod
+    def env_trace_file() -> Optional[str]:
+        """Trace path given in PERF_TRACE_ENV_VAR, if it names a .json file"""
+        value = os.environ.get(PERF_TRACE_ENV_VAR, "").strip()
+        return value if value.lower().endswith(".json") else None
+
+    @staticmethod
+    def env_enabled() -> bool:
+        value = os.environ.get(PERF_TRACE_ENV_VAR, "").strip().lower()
+        return value in ("1", "true", "yes", "on") or PerfTracer.env_trace_file() is not None
+
+    def dump_chrome_trace(self, path: str) -> bool:
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.chrome_trace(), f, default=str)
+            return True
+        except (OSError, TypeError, ValueError) as e:
+            print(f"[PerfTrace] Failed to write trace: {e}")
+            return False
+
+
+def _format_ms(ms: float) -> str:
+    return f"{ms / 1000:.2f} s" if ms >= 1000 else f"{ms:.1f} ms"
+
+
+# Shared by the whole app, see span() and traced()
+perf_tracer = PerfTracer()
+
+
+def span(name: str, **args):
+    """Time a block with the shared tracer: `with span("parse"): ...`"""
+    if not perf_tracer.enabled:
+        return _NULL_SPAN
+    return _Span(perf_tracer, name, args or None)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Decorator timing every call of a function as one span"""
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not perf_tracer.enabled:
+                return func(*args, **kwargs)
+            with _Span(perf_tracer, span_name, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
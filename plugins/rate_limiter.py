@@ -0,0 +1,104 @@
+"""
+Rate Limiter Plugin for Steam Achievement Localizer
+Token bucket with adaptive backoff for requests to rate-limited APIs
+"""
+import threading
+import time
+from typing import Callable, Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket whose rate adapts to 429 responses
+
+    Every request takes one token. Tokens refill at `rate` per second up
+    to `capacity`, which allows short bursts. throttled() halves the rate
+    and pauses all callers (for Retry-After when the server sends one);
+    succeeded() slowly raises the rate back (AIMD, like TCP congestion
+    control), so the limiter settles just below what the server accepts.
+    """
+
+    # Granularity of waits, so cancellation is noticed quickly
+    _WAIT_SLICE = 0.1
+
+    def __init__(self,
+                 rate: float,
+                 capacity: float = 1.0,
+                 min_rate: Optional[float] = None,
+                 recovery: float = 0.05,
+                 base_backoff: float = 2.0,
+                 max_backoff: float = 60.0):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate if min_rate is not None else rate / 8
+        self.capacity = capacity
+        # Rate added back per successful request
+        self.recovery = recovery
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._consecutive_throttles = 0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self,
+                timeout: Optional[float] = None,
+                is_cancelled: Optional[Callable[[], bool]] = None) -> bool:
+        """Block until a token is available; False on timeout or cancellation"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if is_cancelled and is_cancelled():
+                return False
+
+            with self._lock:
+                now = time.monotonic()
+                if now >= self._paused_until:
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return True
+                    wait = (1 - self._tokens) / self.rate
+                else:
+                    wait = self._paused_until - now
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(min(wait, self._WAIT_SLICE))
+
+    def throttled(self, retry_after: Optional[float] = None) -> float:
+        """Record a 429: halve the rate and pause everyone; returns the pause in seconds"""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                # Requests sent before the pause began report the same overload
+                return self._paused_until - now
+
+            self._consecutive_throttles += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            if retry_after is None or retry_after <= 0:
+                retry_after = self.base_backoff * 2 ** (self._consecutive_throttles - 1)
+            pause = min(retry_after, self.max_backoff)
+
+            self._paused_until = max(self._paused_until, now + pause)
+            # No burst right after the pause
+            self._tokens = 0
+            self._updated = self._paused_until
+            return pause
+
+    def succeeded(self):
+        """Record an accepted request and recover the rate a little"""
+        with self._lock:
+            self._consecutive_throttles = 0
+            self.rate = min(self.max_rate, self.rate + self.recovery)
+
+    @property
+    def consecutive_throttles(self) -> int:
+        return self._consecutive_throttles
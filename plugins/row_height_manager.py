@@ -0,0 +1,126 @@
+"""
+Row Height Manager Plugin for Steam Achievement Localizer
+Sizes main table rows to their wrapped text lazily, as rows scroll into view
+"""
+from typing import Dict, Set, Tuple
+
+from PyQt6.QtCore import QObject, QEvent, QTimer, Qt
+from PyQt6.QtGui import QTextDocument
+
+from .perf_trace import traced
+
+
+class RowHeightManager(QObject):
+    """Measures only rows in (or just below) the viewport
+
+    Text heights are cached by (text hash, column width), so re-measuring a
+    row after an unrelated change costs a few dict lookups. Rows are
+    measured again after a cell of theirs changes or a column is resized.
+    """
+
+    # Rows below the viewport measured ahead of scrolling
+    PREFETCH_ROWS = 10
+    # Cached text heights before the cache starts over
+    MAX_CACHED_HEIGHTS = 50000
+    # Document margin above and below the text
+    PADDING = 8
+
+    def __init__(self, table, model):
+        super().__init__(table)
+        self.table = table
+        self.model = model
+        self.heights: Dict[Tuple[int, int], int] = {}
+        self.measured_rows: Set[int] = set()
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.measure_visible_rows)
+
+        table.verticalScrollBar().valueChanged.connect(self.schedule)
+        table.horizontalHeader().sectionResized.connect(self.on_section_resized)
+        table.viewport().installEventFilter(self)
+        model.modelReset.connect(self.invalidate)
+        model.dataChanged.connect(self.on_data_changed)
+
+    def schedule(self, *args):
+        """Measure visible rows once control returns to the event loop"""
+        self.timer.start()
+
+    def invalidate(self):
+        """Re-measure every row as it becomes visible"""
+        self.measured_rows.clear()
+        self.schedule()
+
+    def invalidate_rows(self, first: int, last: int):
+        if first <= 0 and last >= self.model.rowCount() - 1:
+            self.measured_rows.clear()
+        else:
+            self.measured_rows.difference_update(range(first, last + 1))
+        self.schedule()
+
+    def on_section_resized(self, column, old_size, new_size):
+        # Heights of the old width stay cached, switching back is free
+        self.invalidate()
+
+    def on_data_changed(self, top_left, bottom_right, roles=()):
+        # Zebra color updates don't change any text
+        if roles and Qt.ItemDataRole.DisplayRole not in roles and Qt.ItemDataRole.EditRole not in roles:
+            return
+        self.invalidate_rows(top_left.row(), bottom_right.row())
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Resize:
+            self.schedule()
+        return False
+
+    def text_height(self, text: str, width: int) -> int:
+        key = (hash(text), width)
+        height = self.heights.get(key)
+        if height is None:
+            if len(self.heights) >= self.MAX_CACHED_HEIGHTS:
+                self.heights.clear()
+            doc = QTextDocument()
+            doc.setPlainText(text)
+            doc.setTextWidth(width)
+            height = self.heights[key] = int(doc.size().height()) + self.PADDING
+        return height
+
+    def measure_row(self, row: int):
+        height = self.table.verticalHeader().defaultSectionSize()
+        for col in range(self.model.columnCount()):
+            if self.table.isColumnHidden(col):
+                continue
+            text = self.model.cell_text(row, col)
+            if text:
+                height = max(height, self.text_height(text, self.table.columnWidth(col)))
+        if self.table.rowHeight(row) != height:
+            self.table.setRowHeight(row, height)
+        self.measured_rows.add(row)
+
+    # Row-height layout happens here, update_row_heights() only invalidates
+    @traced("update_row_heights")
+    def measure_visible_rows(self):
+        row_count = self.model.rowCount()
+        if row_count == 0:
+            return
+
+        viewport_height = self.table.viewport().height()
+        # New heights move rows in and out of the viewport; a few rounds settle it
+        for _ in range(8):
+            first_row = self.table.rowAt(0)
+            if first_row < 0:
+                return
+            last_row = self.table.rowAt(viewport_height - 1)
+            if last_row < 0:
+                last_row = row_count - 1
+            last_row = min(row_count - 1, last_row + self.PREFETCH_ROWS)
+
+            pending = [
+                row for row in range(first_row, last_row + 1)
+                if row not in self.measured_rows and not self.table.isRowHidden(row)
+            ]
+            if not pending:
+                return
+            for row in pending:
+                self.measure_row(row)
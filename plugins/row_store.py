@@ -0,0 +1,183 @@
+"""
+Row Store Plugin for Steam Achievement Localizer
+Keeps parsed table rows column by column instead of one dict per row
+"""
+import sys
+from collections.abc import MutableMapping, Sequence
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+# Cell value of a row that has no such field (a dict row would lack the key)
+MISSING = None
+
+
+class RowStore(Sequence):
+    """Columnar table rows: an interned key column plus one list per field
+
+    A column only holds references, so an empty or missing cell costs one
+    pointer instead of a dict entry. Indexing returns a RowView, which acts
+    like the dict rows the rest of the app was written against.
+    """
+
+    def __init__(self, keys: Optional[Iterable[str]] = None):
+        self._keys: List[str] = [sys.intern(key) for key in keys] if keys else []
+        # Field name -> value per row, MISSING where the row lacks the field
+        self._columns: Dict[str, List[Optional[str]]] = {}
+
+    @classmethod
+    def from_columns(cls, keys: List[str], columns: Dict[str, List[Optional[str]]]) -> 'RowStore':
+        """Build a store from row keys and one value list per field
+
+        The lists are taken over, not copied; entries past len(keys) are
+        cut off, so callers may preallocate.
+        """
+        store = cls(keys)
+        length = len(store._keys)
+        for name, column in columns.items():
+            if len(column) != length:
+                del column[length:]
+                column.extend([MISSING] * (length - len(column)))
+            store._columns[name] = column
+        return store
+
+    @classmethod
+    def from_dicts(cls, rows: Iterable[Dict[str, str]]) -> 'RowStore':
+        """Build a store from dict rows (each must have a 'key')"""
+        store = cls()
+        for row in rows:
+            index = len(store._keys)
+            store._keys.append(sys.intern(row['key']))
+            for column in store._columns.values():
+                column.append(MISSING)
+            for name, value in row.items():
+                if name != 'key':
+                    store.set_value(index, name, value)
+        return store
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [RowView(self, i) for i in range(*index.indices(len(self._keys)))]
+        if index < 0:
+            index += len(self._keys)
+        if not 0 <= index < len(self._keys):
+            raise IndexError("row index out of range")
+        return RowView(self, index)
+
+    def __iter__(self) -> Iterator['RowView']:
+        for index in range(len(self._keys)):
+            yield RowView(self, index)
+
+    def __repr__(self) -> str:
+        return f"RowStore({len(self._keys)} rows, columns={self.column_names()})"
+
+    def copy(self) -> 'RowStore':
+        """Independent store sharing the (immutable) cell strings"""
+        store = RowStore()
+        store._keys = list(self._keys)
+        store._columns = {name: list(column) for name, column in self._columns.items()}
+        return store
+
+    def to_dicts(self) -> List[Dict[str, str]]:
+        return [dict(row) for row in self]
+
+    def column_names(self) -> List[str]:
+        """'key' followed by every field in order of first appearance"""
+        return ['key'] + list(self._columns)
+
+    def column(self, name: str) -> List[Optional[str]]:
+        """Values of one field for every row (MISSING where absent); do not modify"""
+        if name == 'key':
+            return self._keys
+        return self._columns.get(name) or [MISSING] * len(self._keys)
+
+    def has_column(self, name: str) -> bool:
+        return name == 'key' or name in self._columns
+
+    def ensure_columns(self, names: Iterable[str], fill: str = ''):
+        """Give every row a value for each of names, filling missing cells"""
+        length = len(self._keys)
+        for name in names:
+            if name == 'key':
+                continue
+            column = self._columns.get(name)
+            if column is None:
+                self._columns[name] = [fill] * length
+            elif MISSING in column:
+                column[:] = [fill if value is MISSING else value for value in column]
+
+    def drop_column(self, name: str):
+        self._columns.pop(name, None)
+
+    def get_value(self, row: int, name: str, default: Optional[str] = None) -> Optional[str]:
+        if name == 'key':
+            return self._keys[row]
+        column = self._columns.get(name)
+        if column is None:
+            return default
+        value = column[row]
+        return default if value is MISSING else value
+
+    def set_value(self, row: int, name: str, value: str):
+        if name == 'key':
+            self._keys[row] = sys.intern(value)
+            return
+        column = self._columns.get(name)
+        if column is None:
+            column = self._columns[name] = [MISSING] * len(self._keys)
+        column[row] = value
+
+    def clear_value(self, row: int, name: str):
+        """Remove a field from one row; raises KeyError if the row lacks it"""
+        column = self._columns.get(name)
+        if name == 'key' or column is None or column[row] is MISSING:
+            raise KeyError(name)
+        column[row] = MISSING
+
+    def row_fields(self, row: int) -> Iterator[str]:
+        yield 'key'
+        for name, column in self._columns.items():
+            if column[row] is not MISSING:
+                yield name
+
+
+class RowView(MutableMapping):
+    """Dict-like window onto one row of a RowStore; writes go to the store"""
+
+    __slots__ = ('store', 'index')
+
+    def __init__(self, store: RowStore, index: int):
+        self.store = store
+        self.index = index
+
+    def __getitem__(self, name: str) -> str:
+        value = self.store.get_value(self.index, name, MISSING)
+        if value is MISSING:
+            raise KeyError(name)
+        return value
+
+    def get(self, name: str, default=None):
+        return self.store.get_value(self.index, name, default)
+
+    def __contains__(self, name) -> bool:
+        return self.store.get_value(self.index, name, MISSING) is not MISSING
+
+    def __setitem__(self, name: str, value: str):
+        self.store.set_value(self.index, name, value)
+
+    def __delitem__(self, name: str):
+        self.store.clear_value(self.index, name)
+
+    def __iter__(self) -> Iterator[str]:
+        return self.store.row_fields(self.index)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.store.row_fields(self.index))
+
+    def copy(self) -> Dict[str, str]:
+        return dict(self)
+
+    def __repr__(self) -> str:
+        return f"RowView({dict(self)!r})"
@@ -0,0 +1,179 @@
+"""
+Schema File Watcher Plugin for Steam Achievement Localizer
+Notices when Steam rewrites the open schema file and diffs it by achievement key
+"""
+import os
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from PyQt6.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+from .row_store import RowStore
+
+
+class SchemaDiff(NamedTuple):
+    """Differences between two parses of a schema, by row key"""
+    changed: List[str]          # keys present in both with at least one different value
+    added: List[str]            # keys only in the new parse
+    removed: List[str]          # keys only in the old parse
+    new_columns: List[str]      # columns (languages) only in the new parse
+    changed_columns: Set[str]   # columns with at least one different value
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.changed or self.added or self.removed or self.new_columns)
+
+    @property
+    def in_place(self) -> bool:
+        """Same rows and columns, so the table can be updated cell by cell"""
+        return not (self.added or self.removed or self.new_columns)
+
+
+def diff_rows(old_rows: RowStore, new_rows: RowStore, ignore: Iterable[str] = ()) -> SchemaDiff:
+    """Compare two parses of a schema achievement by achievement
+
+    Missing and empty cells count as equal. Columns in ignore (e.g. ones
+    the table does not show) are skipped, and so are new columns without
+    any text.
+    """
+    ignored = set(ignore)
+    old_keys = old_rows.column('key')
+    new_keys = new_rows.column('key')
+    new_index = {key: i for i, key in enumerate(new_keys)}
+    old_key_set = set(old_keys)
+
+    added = [key for key in new_keys if key not in old_key_set]
+    removed = [key for key in old_keys if key not in new_index]
+    old_columns = set(old_rows.column_names())
+    new_columns = [
+        name for name in new_rows.column_names()
+        if name not in old_columns and name not in ignored and any(new_rows.column(name))
+    ]
+
+    # Old row index -> new row index, for keys in both
+    pairs = [(i, new_index[key]) for i, key in enumerate(old_keys) if key in new_index]
+    changed_rows: Set[int] = set()
+    changed_columns: Set[str] = set()
+    for name in old_rows.column_names():
+        if name == 'key' or name in ignored:
+            continue
+        old_column = old_rows.column(name)
+        new_column = new_rows.column(name)
+        differing = [i for i, j in pairs if (old_column[i] or '') != (new_column[j] or '')]
+        if differing:
+            changed_columns.add(name)
+            changed_rows.update(differing)
+
+    changed = [old_keys[i] for i in sorted(changed_rows)]
+    return SchemaDiff(changed, added, removed, new_columns, changed_columns)
+
+
+def pending_edits(rows: RowStore, loaded_rows: RowStore) -> Dict[Tuple[str, str], str]:
+    """Cells edited since loading: {(row key, column): value}
+
+    loaded_rows is the snapshot taken when the file was parsed; rows must
+    still have the same row order (edits never add or move rows).
+    """
+    edits: Dict[Tuple[str, str], str] = {}
+    keys = rows.column('key')
+    if len(keys) != len(loaded_rows):
+        return edits
+    for name in rows.column_names():
+        if name == 'key':
+            continue
+        current = rows.column(name)
+        loaded = loaded_rows.column(name)
+        for i, value in enumerate(current):
+            if (value or '') != (loaded[i] or ''):
+                edits[(keys[i], name)] = value or ''
+    return edits
+
+
+class SchemaFileWatcher(QObject):
+    """Reports external rewrites of one file
+
+    Uses QFileSystemWatcher and falls back to polling the file's size and
+    mtime where it cannot watch the path (some network or FUSE file
+    systems) or while the file is missing, e.g. between Steam deleting and
+    recreating it. Bursts of change events are debounced. Writes made by
+    the app itself are announced with mark_own_write() and not reported.
+    """
+    file_changed = pyqtSignal(str)  # path
+
+    DEBOUNCE_MS = 500
+    POLL_INTERVAL_MS = 2000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.path: Optional[str] = None
+        self._stamp: Optional[Tuple[int, int]] = None
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_file_event)
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._check)
+
+        self._poll = QTimer(self)
+        self._poll.setInterval(self.POLL_INTERVAL_MS)
+        self._poll.timeout.connect(self._check)
+
+    @staticmethod
+    def _stat(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def watch(self, path: str):
+        """Watch path instead of the previous file"""
+        path = os.path.abspath(path)
+        if path == self.path:
+            self.mark_own_write()
+            return
+        self.unwatch()
+        self.path = path
+        self._stamp = self._stat(path)
+        self._add_path()
+
+    def unwatch(self):
+        files = self._watcher.files()
+        if files:
+            self._watcher.removePaths(files)
+        self._debounce.stop()
+        self._poll.stop()
+        self.path = None
+        self._stamp = None
+
+    def mark_own_write(self):
+        """The app just wrote the watched file; take its current state as known"""
+        if self.path:
+            self._stamp = self._stat(self.path)
+
+    def _add_path(self):
+        # A file replaced by rename drops out of the watcher, so re-add it after every change
+        if self.path not in self._watcher.files():
+            if os.path.exists(self.path) and self._watcher.addPath(self.path):
+                self._poll.stop()
+                return
+            self._poll.start()
+
+    def _on_file_event(self, path: str):
+        if path == self.path:
+            self._debounce.start()
+
+    def _check(self):
+        if not self.path:
+            return
+        stamp = self._stat(self.path)
+        if stamp is None:
+            # Deleted, maybe about to be recreated; poll until it is back
+            self._poll.start()
+            return
+        self._add_path()
+        if stamp == self._stamp:
+            return
+        self._stamp = stamp
+        self.file_changed.emit(self.path)
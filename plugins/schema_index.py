@@ -0,0 +1,109 @@
+"""
+Schema Index Plugin for Steam Achievement Localizer
+Keeps metadata of UserGameStatsSchema_*.bin files in an on-disk SQLite index
+"""
+import os
+import sqlite3
+from typing import Dict, Iterable, List, Optional, Any
+
+
+class SchemaIndex:
+    """Metadata index keyed by file name, validated by size and mtime"""
+
+    # Bump when the stored columns or their meaning change, the table is rebuilt
+    SCHEMA_VERSION = 1
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.db_path)
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != self.SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS schema_files")
+                conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS schema_files ("
+                " file_name TEXT PRIMARY KEY,"
+                " size INTEGER NOT NULL,"
+                " mtime_ns INTEGER NOT NULL,"
+                " version TEXT,"
+                " gamename TEXT,"
+                " achievement_count INTEGER,"
+                " languages TEXT)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def load_all(self) -> Dict[str, Dict[str, Any]]:
+        """Read the whole index in one query: {file_name: entry}"""
+        try:
+            rows = self._connect().execute(
+                "SELECT file_name, size, mtime_ns, version, gamename, achievement_count, languages"
+                " FROM schema_files"
+            ).fetchall()
+        except sqlite3.Error as e:
+            print(f"[SchemaIndex] Failed to read index: {e}")
+            return {}
+
+        return {
+            file_name: {
+                'size': size,
+                'mtime_ns': mtime_ns,
+                'version': version,
+                'gamename': gamename,
+                'achievement_count': achievement_count,
+                'languages': languages.split(',') if languages else []
+            }
+            for file_name, size, mtime_ns, version, gamename, achievement_count, languages in rows
+        }
+
+    @staticmethod
+    def is_current(entry: Optional[Dict[str, Any]], stat: os.stat_result) -> bool:
+        """True if the indexed entry still describes the file on disk"""
+        return (entry is not None
+                and entry['size'] == stat.st_size
+                and entry['mtime_ns'] == stat.st_mtime_ns)
+
+    def store_many(self, entries: Iterable[tuple]):
+        """Insert or replace (file_name, stat, metadata) entries in one transaction"""
+        records = [
+            (file_name, stat.st_size, stat.st_mtime_ns,
+             metadata.get('version'), metadata.get('gamename'),
+             metadata.get('achievement_count'), ','.join(metadata.get('languages') or []))
+            for file_name, stat, metadata in entries
+        ]
+        if not records:
+            return
+        try:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO schema_files"
+                    " (file_name, size, mtime_ns, version, gamename, achievement_count, languages)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    records
+                )
+        except sqlite3.Error as e:
+            print(f"[SchemaIndex] Failed to update index: {e}")
+
+    def prune(self, existing_files: List[str]):
+        """Forget files that are no longer in the stats directory"""
+        try:
+            conn = self._connect()
+            indexed = {row[0] for row in conn.execute("SELECT file_name FROM schema_files")}
+            stale = [(file_name,) for file_name in indexed - set(existing_files)]
+            if stale:
+                with conn:
+                    conn.executemany("DELETE FROM schema_files WHERE file_name = ?", stale)
+        except sqlite3.Error as e:
+            print(f"[SchemaIndex] Failed to prune index: {e}")
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
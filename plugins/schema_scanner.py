@@ -0,0 +1,104 @@
+"""
+Schema Scanner Plugin for Steam Achievement Localizer
+Extracts metadata of many UserGameStatsSchema_*.bin files on all CPU cores
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .binary_parser import BinaryParser
+from .file_manager import FileManager
+
+
+# One parser per process; BinaryParser keeps per-buffer state, so it is never
+# shared across threads
+_parser: Optional[BinaryParser] = None
+
+
+def scan_schema_file(file_path: str) -> Optional[Dict[str, object]]:
+    """Read one schema file and return its metadata (None if unreadable)"""
+    global _parser
+    if _parser is None:
+        _parser = BinaryParser()
+    try:
+        # Metadata only touches the header and a few marker scans, the file
+        # is never read into memory as a whole
+        with FileManager.open_mapped(file_path) as data:
+            return _parser.get_schema_metadata(data)
+    except Exception as e:
+        print(f"[SchemaScanner] Failed to scan {file_path}: {e}")
+        return None
+
+
+def scan_schema_batch(file_paths: List[str]) -> List[Tuple[str, Optional[Dict[str, object]]]]:
+    """Scan a batch of files; runs inside pool processes"""
+    return [(file_path, scan_schema_file(file_path)) for file_path in file_paths]
+
+
+class SchemaScanner:
+    """Fans schema metadata extraction out to a process pool
+
+    Files are sent to the pool in batches so inter-process traffic stays
+    small; batches come back as soon as they are done, in any order.
+    """
+
+    # Below this many files starting worker processes costs more than it saves
+    MIN_FILES_FOR_POOL = 64
+
+    def __init__(self, max_workers: Optional[int] = None, batch_size: int = 32):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.batch_size = max(1, batch_size)
+
+    def iter_batches(self,
+                     file_paths: List[str],
+                     is_cancelled: Optional[Callable[[], bool]] = None
+                     ) -> Iterator[List[Tuple[str, Optional[Dict[str, object]]]]]:
+        """Yield lists of (file_path, metadata) as batches complete"""
+        if not file_paths:
+            return
+
+        if len(file_paths) < self.MIN_FILES_FOR_POOL or self.max_workers == 1:
+            yield from self._iter_inline(file_paths, is_cancelled)
+            return
+
+        # Enough batches for every worker to stay busy, but not so small that
+        # pickling overhead dominates
+        batch_size = min(self.batch_size, max(1, len(file_paths) // (self.max_workers * 4)))
+        batches = [file_paths[i:i + batch_size] for i in range(0, len(file_paths), batch_size)]
+        done_paths = set()
+
+        try:
+            # Spawn, not fork: this runs from a QThread in a process with Qt and
+            # other threads, whose held locks a forked child would inherit
+            executor = ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(batches)),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        except (OSError, NotImplementedError) as e:
+            print(f"[SchemaScanner] Process pool unavailable, scanning in-process: {e}")
+            yield from self._iter_inline(file_paths, is_cancelled)
+            return
+
+        try:
+            futures = [executor.submit(scan_schema_batch, batch) for batch in batches]
+            for future in as_completed(futures):
+                if is_cancelled and is_cancelled():
+                    return
+                results = future.result()
+                done_paths.update(file_path for file_path, _ in results)
+                yield results
+        except BrokenProcessPool as e:
+            # A worker died (e.g. killed by the OS); finish what is left here
+            print(f"[SchemaScanner] Process pool failed, scanning in-process: {e}")
+            remaining = [file_path for file_path in file_paths if file_path not in done_paths]
+            yield from self._iter_inline(remaining, is_cancelled)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _iter_inline(self, file_paths, is_cancelled):
+        for i in range(0, len(file_paths), self.batch_size):
+            if is_cancelled and is_cancelled():
+                return
+            yield scan_schema_batch(file_paths[i:i + self.batch_size])
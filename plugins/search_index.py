@@ -0,0 +1,71 @@
+"""
+Search Index Plugin for Steam Achievement Localizer
+Keeps casefolded row texts of the main table for fast global search
+"""
+from typing import Dict, List, Optional
+
+
+class SearchIndex:
+    """Casefolded text per table row, rebuilt lazily for invalidated rows
+
+    Cells of a row are joined with a NUL separator so a query never
+    matches across two cells.
+    """
+
+    SEPARATOR = '\x00'
+    SKIPPED_COLUMNS = {'icon'}
+
+    def __init__(self):
+        self.rows: List[Dict[str, str]] = []
+        self.headers: List[str] = []
+        self._texts: List[Optional[str]] = []
+        # Last query and its matches, used to narrow down while the user keeps typing
+        self._last_query: Optional[str] = None
+        self._last_matches: List[int] = []
+
+    def set_data_rows(self, rows: List[Dict[str, str]], headers: List[str]):
+        """Point the index at new rows; texts are built on the next query"""
+        self.rows = rows
+        self.headers = headers
+        self.invalidate()
+
+    def invalidate(self):
+        self._texts = [None] * len(self.rows)
+        self._last_query = None
+
+    def invalidate_rows(self, first: int, last: int):
+        """Mark rows first..last (inclusive) as changed"""
+        if len(self._texts) != len(self.rows):
+            self.invalidate()
+            return
+        for row in range(max(first, 0), min(last, len(self._texts) - 1) + 1):
+            self._texts[row] = None
+        self._last_query = None
+
+    def _row_text(self, row: int) -> str:
+        text = self._texts[row]
+        if text is None:
+            values = self.rows[row]
+            text = self.SEPARATOR.join(
+                values.get(header, '') for header in self.headers if header not in self.SKIPPED_COLUMNS
+            ).casefold()
+            self._texts[row] = text
+        return text
+
+    def match(self, query: str) -> List[int]:
+        """Rows containing query (case-insensitive), in row order"""
+        query = query.casefold()
+        if len(self._texts) != len(self.rows):
+            self.invalidate()
+
+        # A longer query can only match a subset of the previous matches
+        if self._last_query is not None and self._last_query in query:
+            candidates = self._last_matches
+        else:
+            candidates = range(len(self.rows))
+
+        row_text = self._row_text
+        matches = [row for row in candidates if query in row_text(row)]
+        self._last_query = query
+        self._last_matches = matches
+        return matches
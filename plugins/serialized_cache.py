@@ -0,0 +1,60 @@
+"""
+Serialized Cache Plugin for Steam Achievement Localizer
+Keeps data parsed from bundled files as a marshal blob between launches
+"""
+import marshal
+import os
+from typing import Any, Iterable, Optional
+
+
+class SerializedCache:
+    """One value derived from source files, stored with marshal
+
+    marshal loads plain dicts, lists and strings several times faster than
+    json. The blob is only used while the app version and the stamp
+    (path, size and mtime of every source file) match what it was saved
+    with, so edited or updated files are parsed again.
+    """
+
+    # Bump when the blob layout changes
+    FORMAT_VERSION = 1
+
+    def __init__(self, path: str, app_version: str):
+        self.path = path
+        self.app_version = app_version
+
+    @staticmethod
+    def stamp_for(paths: Iterable[str]) -> str:
+        parts = []
+        for path in sorted(paths):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            parts.append(f"{path}:{stat.st_size}:{stat.st_mtime_ns}")
+        return "|".join(parts)
+
+    def load(self, stamp: str) -> Optional[Any]:
+        """Cached value, or None if missing, unreadable or saved for other sources"""
+        try:
+            with open(self.path, 'rb') as f:
+                header, value = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if header != (self.FORMAT_VERSION, self.app_version, stamp):
+            return None
+        return value
+
+    def save(self, stamp: str, value: Any) -> bool:
+        try:
+            data = marshal.dumps(((self.FORMAT_VERSION, self.app_version, stamp), value))
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            # Write aside and swap, a concurrent launch never reads half a file
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, self.path)
+            return True
+        except (OSError, ValueError) as e:
+            print(f"[SerializedCache] Failed to write {self.path}: {e}")
+            return False
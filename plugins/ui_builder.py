@@ -12,6 +12,8 @@ from PyQt6.QtWidgets import (
 from typing import Dict, List, Callable, Any, Optional
 import sys
 
+from .perf_trace import perf_tracer
+
 class MenuTooltipFilter(QObject):
     """Event filter to show tooltips for QMenuBar items"""
     def __init__(self, parent=None):
@@ -263,8 +265,11 @@ class UIBuilder:
         return search_widget
     
     def _reset_table(self):
+        # Drop a search that is still waiting for the debounce timer
+        if hasattr(self.parent, 'search_timer'):
+            self.parent.search_timer.stop()
 
-        for row in range(self.parent.table.rowCount()):
+        for row in range(self.parent.table.model().rowCount()):
             self.parent.table.setRowHidden(row, False)
 
 
@@ -317,7 +322,7 @@ class UIBuilder:
                 
                 # Check actual column visibility state
                 is_visible = True  # Default to visible
-                if hasattr(self.parent, 'table') and self.parent.table.columnCount() > 0:
+                if hasattr(self.parent, 'table') and self.parent.table.model().columnCount() > 0:
                     try:
                         col_index = self.parent.headers.index(header)
                         is_visible = not self.parent.table.isColumnHidden(col_index)
@@ -570,6 +575,29 @@ class UIBuilder:
 
         help_menu.addSeparator()
 
+        # Performance tracing: timings in the status bar, exportable as a Chrome trace
+        perf_tracing_action = QAction(
+            self.translations.get("perf_tracing_option", "Performance tracing"),
+            self.parent
+        )
+        perf_tracing_action.setCheckable(True)
+        self._connect_status_tip(perf_tracing_action, "tooltip_perf_tracing")
+        perf_tracing_action.setChecked(perf_tracer.enabled)
+        if hasattr(self.parent, 'on_perf_tracing_toggled'):
+            perf_tracing_action.triggered.connect(self.parent.on_perf_tracing_toggled)
+        help_menu.addAction(perf_tracing_action)
+
+        if hasattr(self.parent, 'save_perf_trace'):
+            save_trace_action = QAction(
+                self.translations.get("save_perf_trace", "Save performance trace..."),
+                self.parent
+            )
+            self._connect_status_tip(save_trace_action, "tooltip_save_perf_trace")
+            save_trace_action.triggered.connect(self.parent.save_perf_trace)
+            help_menu.addAction(save_trace_action)
+
+        help_menu.addSeparator()
+
         # About action
         about_action = self._create_about_action()
         help_menu.addAction(about_action)
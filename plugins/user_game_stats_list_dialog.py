@@ -7,7 +7,7 @@ import sys
 import glob
 import webbrowser
 import subprocess
-from plugins import HighlightDelegate
+from plugins import HighlightDelegate, GameNameResolver
 try:
     import requests
 except ImportError:
@@ -31,6 +31,8 @@ class UserGameStatsListDialog(QDialog):
         super().__init__(parent)
         self.steam_game_names = steam_game_names or {}
         self.settings = settings
+        self.name_resolver = None
+        self.fetched_count = 0
         translations = getattr(self.parent(), "translations", {})
         self.setWindowTitle(parent.translations.get("user_game_stats_list"))
         self.setMinimumSize(720, 600)
@@ -250,24 +252,27 @@ class UserGameStatsListDialog(QDialog):
     
     
     def fetch_missing_names(self):
-        """Fetch missing game names from Steam API for all unknown games"""
+        """Fetch missing game names from Steam API for all unknown games
+
+        Runs in the background; pressing the button again while it runs
+        cancels. Names found so far are kept, so the next run resumes.
+        """
         parent = self.parent()
-        if not hasattr(parent, 'get_steam_game_name'):
+        if self.name_resolver is not None:
+            self.name_resolver.cancel()
+            self.fetch_names_btn.setEnabled(False)
+            return
+        if not hasattr(parent, 'game_name_store'):
             return
         
         # Get unknown text
         unknown_text = parent.translations.get("unknown", "Unknown")
         
         # Collect games to fetch (Unknown or code names marked with *)
-        games_to_fetch = []
-        for row in range(self.table.rowCount()):
-            name_item = self.table.item(row, 0)
-            id_item = self.table.item(row, 2)
-            if name_item and id_item:
-                name = name_item.text()
-                # Fetch if Unknown or starts with * (code name from binary)
-                if name == unknown_text or name.startswith("*"):
-                    games_to_fetch.append((row, id_item.text()))
+        games_to_fetch = [
+            str(game_id) for name, _, game_id, _ in self.stats_list
+            if name == unknown_text or str(name).startswith("*")
+        ]
         
         if not games_to_fetch:
             QMessageBox.information(
@@ -277,9 +282,8 @@ class UserGameStatsListDialog(QDialog):
             )
             return
         
-        # Disable button and show progress
-        self.fetch_names_btn.setEnabled(False)
-        original_text = self.fetch_names_btn.text()
+        self.fetch_names_btn.setText(parent.translations.get("cancel", "Cancel"))
+        self.fetched_count = 0
         
         # Show progress using parent's progress bar
         if hasattr(parent, 'show_progress'):
@@ -288,45 +292,39 @@ class UserGameStatsListDialog(QDialog):
                 total=len(games_to_fetch)
             )
         
-        # Track errors
-        updated_count = 0
-        error_count = 0
-        rate_limited = False
-        
-        # Fetch names for unknown games with delay between requests
-        for i, (row, game_id) in enumerate(games_to_fetch):
-            # Update progress
-            if hasattr(parent, 'update_progress'):
-                parent.update_progress(
-                    increment=1,
-                    message=parent.translations.get("processing", "Processing {game_id}").format(game_id=game_id)
-                )
-            
-            # Add delay between requests to avoid rate limiting (except for first request)
-            if i > 0:
-                import time
-                time.sleep(0.5)  # 500ms delay between requests
-            
-            # Fetch from Steam API
-            name = parent.get_steam_game_name(game_id, show_progress=False)
-            if name and name != unknown_text:
-                # Update table
+        self.name_resolver = GameNameResolver(games_to_fetch, parent.game_name_store.db_path)
+        self.name_resolver.name_resolved.connect(self.on_name_resolved)
+        self.name_resolver.progress.connect(self.on_fetch_progress)
+        self.name_resolver.finished.connect(self.on_fetch_finished)
+        self.name_resolver.start()
+    
+    def on_name_resolved(self, game_id, name):
+        """Show a fetched name right away (the table may be filtered or re-sorted meanwhile)"""
+        parent = self.parent()
+        for j, stat in enumerate(self.stats_list):
+            if stat[2] == game_id:  # Match by game_id
+                self.stats_list[j] = (name, stat[1], stat[2], stat[3])
+                break
+        for row in range(self.table.rowCount()):
+            id_item = self.table.item(row, 2)
+            if id_item and id_item.text() == game_id:
                 self.table.item(row, 0).setText(name)
-                updated_count += 1
-                # Also update stats_list for filtering
-                for j, stat in enumerate(self.stats_list):
-                    if stat[2] == game_id:  # Match by game_id
-                        self.stats_list[j] = (name, stat[1], stat[2], stat[3])
-                        break
-            else:
-                error_count += 1
-                # Check if we hit rate limit
-                if hasattr(parent, 'get_game_name_from_cache'):
-                    cached = parent.get_game_name_from_cache(game_id)
-                    if cached == "RATE_LIMITED":
-                        rate_limited = True
-                        print(f"[Fetch] Rate limited at game {i+1}/{len(games_to_fetch)}, stopping...")
-                        break
+                break
+        if hasattr(parent, 'steam_game_names'):
+            parent.steam_game_names[game_id] = name
+        self.fetched_count += 1
+    
+    def on_fetch_progress(self, done, total):
+        parent = self.parent()
+        if hasattr(parent, 'update_progress'):
+            parent.update_progress(
+                increment=done - parent.progress_current,
+                message=parent.translations.get("fetching_names_progress", "Fetching game names...")
+            )
+    
+    def on_fetch_finished(self, summary):
+        parent = self.parent()
+        self.name_resolver = None
         
         # Hide progress
         if hasattr(parent, 'hide_progress'):
@@ -334,22 +332,21 @@ class UserGameStatsListDialog(QDialog):
         
         # Re-enable button
         self.fetch_names_btn.setEnabled(True)
-        self.fetch_names_btn.setText(original_text)
+        self.fetch_names_btn.setText(parent.translations.get("fetch_missing_names", "Fetch Missing Names from Steam API"))
+        
+        if summary['cancelled'] or not self.isVisible():
+            return
         
         # Show completion message with details
-
-        if rate_limited:
-            message = parent.translations.get("fetch_complete", "Fetching complete. {count} names updated.").format(count=updated_count)
+        message = parent.translations.get("fetch_complete", "Fetching complete. {count} names updated.").format(count=self.fetched_count)
+        if summary['rate_limited']:
             # Use format for localized string insertion
-            rate_limit_msg = parent.translations.get("fetch_rate_limited", "\n\n⚠️ Rate limited by Steam after {count} requests. Try again later for remaining games.").format(count=i+1)
+            rate_limit_msg = parent.translations.get("fetch_rate_limited", "\n\n⚠️ Rate limited by Steam after {count} requests. Try again later for remaining games.").format(count=summary['requests'])
             message += rate_limit_msg
-        elif error_count > 0:
-            message = parent.translations.get("fetch_complete", "Fetching complete. {count} names updated.").format(count=updated_count)
+        elif summary['failed'] > 0:
             # Use format for localized string insertion
-            error_msg = parent.translations.get("fetch_error_count", "\n\n{count} games could not be fetched (errors logged to console).").format(count=error_count)
+            error_msg = parent.translations.get("fetch_error_count", "\n\n{count} games could not be fetched (errors logged to console).").format(count=summary['failed'])
             message += error_msg
-        else:
-            message = parent.translations.get("fetch_complete", "Fetching complete. {count} names updated.").format(count=updated_count)
         
         QMessageBox.information(
             self,
@@ -357,6 +354,38 @@ class UserGameStatsListDialog(QDialog):
             message
         )
     
+    def done(self, result):
+        # Stop the resolver with the dialog; what it already found is in the store
+        if self.name_resolver is not None:
+            self.release_name_resolver()
+        super().done(result)
+    
+    def release_name_resolver(self):
+        """Cancel the resolver and let it finish on its own
+
+        Requests in flight can take seconds to time out, so the GUI thread
+        does not wait for them. The main window keeps the thread alive until
+        run() returns; then it is deleted.
+        """
+        resolver = self.name_resolver
+        self.name_resolver = None
+        resolver.cancel()
+        resolver.name_resolved.disconnect()
+        resolver.progress.disconnect()
+        resolver.finished.disconnect()
+        
+        parent = self.parent()
+        resolver.setParent(parent)
+        
+        def dispose(_summary):
+            # finished is emitted at the very end of run(), so this wait is immediate
+            resolver.wait()
+            resolver.deleteLater()
+        resolver.finished.connect(dispose)
+        
+        if hasattr(parent, 'hide_progress'):
+            parent.hide_progress()
+    
     def open_in_steam_store(self):
         """Open the selected game's Steam Store page in the default browser"""
         if self.selected_row is None:
@@ -68,6 +68,7 @@ OPTIONS = {
         'plugins.context_lang_dialog',
         'plugins.theme_manager',
         'plugins.binary_parser',
+        'plugins.keyvalues',
         'plugins.steam_integration',
         'plugins.csv_handler',
         'plugins.file_manager',
@@ -79,6 +80,22 @@ OPTIONS = {
         'plugins.game_name_fetch_worker',
         'plugins.auto_updater',
         'plugins.http_client',
+        'plugins.achievement_table_model',
+        'plugins.icon_delegate',
+        'plugins.schema_index',
+        'plugins.schema_scanner',
+        'plugins.parse_cache',
+        'plugins.search_index',
+        'plugins.row_height_manager',
+        'plugins.row_store',
+        'plugins.game_name_store',
+        'plugins.rate_limiter',
+        'plugins.game_name_resolver',
+        'plugins.http_cache',
+        'plugins.perf_trace',
+        'plugins.serialized_cache',
+        'plugins.schema_file_watcher',
+        'plugins.batch_localizer',
     ],
     'excludes': [
         'tkinter',